@@ -1,14 +1,16 @@
+import asyncio
 import logging
 from fastapi import FastAPI
 from src.middleware.error_handler import global_exception_handler
 from src.middleware.session_middleware import SessionMiddleware
 from src.middleware.csrf_middleware import CSRFMiddleware
+from src.middleware.idempotency_middleware import IdempotencyMiddleware
 from src.config.config import get_settings
 from src.config.cors_config import add_cors
 from src.routes.api.v1 import router as v1_router
 from src.utils.logger import setup_logger
 from contextlib import asynccontextmanager
-from src.config.db_config import engine
+from src.config.db_config import engine, async_session
 from src.models.login_attempt_model import LoginAttempt
 from src.models.revoked_token_jti_model import RevokedTokenJTI
 from src.models.base_model import Base
@@ -19,6 +21,22 @@ from src.models.movie_model import Movie
 from src.models.showtime_model import Showtime
 from src.models.seat_model import Seat
 from src.models.reservation_model import Reservation
+from src.models.seat_hold_model import SeatHold
+from src.models.auditorium_layout_model import AuditoriumLayout
+from src.models.table_version_model import TableVersion
+from src.services.version_service import VersionService
+from src.cache.movie_search_index import load_movie_search_index
+from src.cache.movie_suggest_index import load_movie_suggest_index
+from src.cache.genre_movie_index import load_genre_movie_index
+from src.tasks.seat_hold_sweeper import run_seat_hold_sweeper
+from src.tasks.sse_heartbeat import run_sse_heartbeat
+from src.tasks.showtime_archiver import run_showtime_archiver
+from src.tasks.catalog_snapshot_refresher import run_catalog_snapshot_refresher
+from src.tasks.revocation_refresher import run_revocation_refresher
+from src.tasks.auth_sweeper import run_auth_sweeper
+from src.tasks.catalog_index_refresher import run_catalog_index_refresher
+from src.tasks.schema_upgrade import plan_upgrade
+from src.realtime.relay import event_relay
 
 logger = setup_logger(__name__, level=logging.INFO)
 
@@ -33,13 +51,39 @@ async def lifespan(app: FastAPI):
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
             logger.info("✅ Database tables verified or created successfully.")
+            # create_all no altera tablas existentes: columnas e índices nuevos van por el script
+            pending, _ = await conn.run_sync(plan_upgrade)
+            if pending:
+                logger.warning(f"⚠️ Faltan {len(pending)} cambios de esquema: ejecutar python -m src.tasks.schema_upgrade")
+        async with async_session() as session:
+            await VersionService.ensure_rows(session)
     except Exception as e:
         logger.error(f"❌ Failed creating/verifying database tables: {e}")
 
+    await event_relay.start()
+    stop_background = asyncio.Event()
+    background_tasks = [
+        asyncio.create_task(run_seat_hold_sweeper(stop_background)),
+        asyncio.create_task(run_sse_heartbeat(stop_background)),
+        asyncio.create_task(run_showtime_archiver(stop_background)),
+        asyncio.create_task(run_catalog_snapshot_refresher(stop_background)),
+        asyncio.create_task(run_revocation_refresher(stop_background)),
+        asyncio.create_task(run_auth_sweeper(stop_background)),
+        asyncio.create_task(run_catalog_index_refresher(stop_background)),
+        asyncio.create_task(load_movie_suggest_index()),
+        asyncio.create_task(load_genre_movie_index()),
+    ]
+    # Sin FULLTEXT la búsqueda usa el índice en memoria
+    if engine.dialect.name != "mysql":
+        background_tasks.append(asyncio.create_task(load_movie_search_index()))
+
     yield
 
     # Shutdown logic
     logger.info("🛑 Application shutdown...")
+    stop_background.set()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await event_relay.stop()
     
 app = FastAPI(
     title=_SETTINGS.service_name,
@@ -50,8 +94,11 @@ app = FastAPI(
 
 
 add_cors(app)
-app.add_middleware(SessionMiddleware)
+# Un reintento pasa por CSRF pero no llega a la ruta ni consulta la base
+app.add_middleware(IdempotencyMiddleware)
 app.add_middleware(CSRFMiddleware)
+# Afuera de todo: la sesión perezosa queda disponible para los demás middlewares
+app.add_middleware(SessionMiddleware)
 app.add_exception_handler(Exception, global_exception_handler)
 
 # Include the routes with versioning
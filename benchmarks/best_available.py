@@ -0,0 +1,102 @@
+"""
+Best-available allocator on a fragmented 600-seat room: the per-row
+free-run index of `SeatMap` against a full scan of every seat per request
+(what the allocator would do if it walked the `Seat` rows).
+
+Both pick seats the same way; the loop books every answer so the index
+pays for its incremental row refreshes too.
+
+    python -m benchmarks.best_available --rows 20 --seats-per-row 30 --fill 0.6
+"""
+import argparse
+import random
+from datetime import datetime
+from typing import Optional
+
+from benchmarks.common import report, Timer
+from src.cache.seat_map_cache import SeatMap
+from src.utils.seat_allocator import find_best_seats, PREFERRED_ROW_DEPTH
+from src.utils.seat_layout import generate_seat_numbers, split_seat_number
+
+
+def full_scan(seat_numbers: list[str], taken: set[int], gaps: set[int], count: int) -> Optional[list[int]]:
+    rows: dict[str, list[tuple[int, int]]] = {}
+    for ordinal, seat_number in enumerate(seat_numbers):
+        row, number = split_seat_number(seat_number)
+        rows.setdefault(row, []).append((number, ordinal))
+    labels = sorted(rows, key=lambda label: (len(label), label))
+    ideal_row = (len(labels) - 1) * PREFERRED_ROW_DEPTH
+
+    best = None
+    for r, label in enumerate(labels):
+        seats = sorted(rows[label])
+        width = len(seats)
+        center = (width - 1) / 2
+        start = None
+        for position, (number, ordinal) in enumerate(seats + [(None, None)]):
+            free = ordinal is not None and ordinal not in taken
+            if free and start is None:
+                start = position
+            end_run = not free or number in gaps
+            if start is not None and end_run:
+                length = position - start + (1 if free else 0)
+                if length >= count:
+                    offset = min(max(round(center - (count - 1) / 2), start), start + length - count)
+                    score = abs(r - ideal_row) / len(labels) + abs(offset + (count - 1) / 2 - center) / width
+                    if best is None or score < best[0]:
+                        best = (score, [o for _, o in seats[offset:offset + count]])
+                start = None
+    return best[1] if best else None
+
+
+def main(rows: int, seats_per_row: int, fill: float, requests: int, seed: int):
+    rng = random.Random(seed)
+    seat_numbers = generate_seat_numbers(rows, seats_per_row)
+    seat_ids = list(range(len(seat_numbers)))
+    gaps = {seats_per_row // 4, seats_per_row - seats_per_row // 4}
+
+    # Fragmentación: asientos vendidos sueltos por toda la sala
+    sold = set(rng.sample(seat_ids, int(len(seat_ids) * fill)))
+    wanted = [rng.choice((1, 2, 2, 3, 4)) for _ in range(requests)]
+
+    seat_map = SeatMap(1, datetime.now(), {}, seat_ids, seat_numbers, gaps)
+    seat_map.set_reserved(sold, True)
+    taken = set(sold)
+
+    index_answers, scan_answers = [], []
+    with Timer() as indexed:
+        for count in wanted:
+            seats = find_best_seats(seat_map, count)
+            index_answers.append(seats)
+            if seats:
+                seat_map.set_reserved(seats, True)
+
+    with Timer() as scanned:
+        for count in wanted:
+            seats = full_scan(seat_numbers, taken, gaps, count)
+            scan_answers.append(seats)
+            if seats:
+                taken.update(seats)
+
+    assert index_answers == scan_answers, "allocators disagree"
+    booked = sum(1 for a in index_answers if a)
+    report("Best-available allocator: free-run index vs full scan", [
+        ("seats", len(seat_ids)),
+        ("initial fill", f"{fill:.0%}"),
+        ("requests (1-4 seats)", requests),
+        ("satisfied", booked),
+        ("full scan avg (us)", f"{scanned.elapsed / requests * 1e6:.1f}"),
+        ("free-run index avg (us)", f"{indexed.elapsed / requests * 1e6:.1f}"),
+        ("speedup", f"{scanned.elapsed / indexed.elapsed:.1f}x"),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--seats-per-row", type=int, default=30)
+    parser.add_argument("--fill", type=float, default=0.6)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    main(args.rows, args.seats_per_row, args.fill, args.requests, args.seed)
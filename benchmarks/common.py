@@ -0,0 +1,83 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.db_config import engine
+from src.models.base_model import Base
+from src.models.user_model import User
+from src.models.movie_model import Movie
+from src.models.showtime_model import Showtime
+from src.models.seat_model import Seat
+from src.models.reservation_model import Reservation
+from src.utils.seat_layout import generate_seat_numbers
+
+
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def create_bench_user(session: AsyncSession) -> User:
+    tag = uuid.uuid4().hex[:12]
+    user = User(
+        name="Bench",
+        lastname="User",
+        nickname=f"bench{tag}",
+        email=f"bench_{tag}@example.com",
+        password="not-a-real-hash",
+        country_code="+1",
+        phone_number=str(int(tag, 16))[:15],
+        country="Benchland",
+    )
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+    return user
+
+
+async def create_bench_showtime(session: AsyncSession, rows: int = 5, seats_per_row: int = 10) -> Showtime:
+    movie = Movie(title=f"Bench movie {uuid.uuid4().hex[:8]}", duration_minutes=120)
+    session.add(movie)
+    await session.flush()
+
+    showtime = Showtime(
+        movie_id=movie.id,
+        show_datetime=datetime.now().replace(microsecond=0) + timedelta(days=2),
+        seats_total=rows * seats_per_row,
+        seats_available=rows * seats_per_row,
+    )
+    session.add(showtime)
+    await session.flush()
+
+    await session.execute(
+        insert(Seat).values([
+            {"showtime_id": showtime.id, "seat_number": seat_number, "is_reserved": False}
+            for seat_number in generate_seat_numbers(rows, seats_per_row)
+        ])
+    )
+    await session.commit()
+    await session.refresh(showtime)
+    return showtime
+
+
+async def get_seat_ids(session: AsyncSession, showtime_id: int) -> list[int]:
+    result = await session.execute(select(Seat.id).where(Seat.showtime_id == showtime_id).order_by(Seat.id))
+    return list(result.scalars().all())
+
+
+def report(title: str, rows: list[tuple[str, object]]):
+    print(f"\n== {title} ==")
+    width = max(len(label) for label, _ in rows)
+    for label, value in rows:
+        print(f"{label.ljust(width)} : {value}")
+
+
+class Timer:
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
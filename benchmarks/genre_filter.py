@@ -0,0 +1,95 @@
+"""
+GET /movies/by-genres?genres=&mode= on a large catalog: the genre bitsets
+pick the page of IDs and one IN query loads the rows.
+
+    python -m benchmarks.genre_filter --movies 50000 --genres 20
+"""
+import argparse
+import asyncio
+import random
+import uuid
+from sqlalchemy import select, insert, func
+
+from benchmarks.common import create_tables, report, Timer
+from benchmarks.movie_search import percentile
+from src.config.db_config import async_session
+from src.models.movie_model import Movie
+from src.models.genre_model import Genre
+from src.models.movie_genre_model import MovieGenre
+from src.cache.genre_movie_index import genre_movie_index, MODE_ALL, MODE_ANY
+from src.services.movie_service import MovieService
+
+BATCH = 5000
+
+
+async def seed(movies: int, genres: int) -> list[int]:
+    rng = random.Random(5)
+    tag = uuid.uuid4().hex[:8]
+    async with async_session() as session:
+        await session.execute(insert(Genre).values([{"name": f"bench-{tag}-{g}"} for g in range(genres)]))
+        genre_ids = list((await session.execute(
+            select(Genre.id).where(Genre.name.like(f"bench-{tag}-%")).order_by(Genre.id)
+        )).scalars())
+
+        first_id = (await session.scalar(select(func.max(Movie.id)))) or 0
+        for start in range(0, movies, BATCH):
+            await session.execute(insert(Movie).values([
+                {"title": f"Bench {tag} {i}", "duration_minutes": 100} for i in range(start, min(movies, start + BATCH))
+            ]))
+        movie_ids = list((await session.execute(
+            select(Movie.id).where(Movie.id > first_id).order_by(Movie.id)
+        )).scalars())
+        # Géneros populares y de nicho: el primero aparece mucho más que el último
+        weights = [1 / (rank + 1) for rank in range(len(genre_ids))]
+        rows = []
+        for movie_id in movie_ids:
+            for genre_id in set(rng.choices(genre_ids, weights=weights, k=rng.randint(1, 3))):
+                rows.append({"movie_id": movie_id, "genre_id": genre_id})
+        for start in range(0, len(rows), BATCH):
+            await session.execute(insert(MovieGenre).values(rows[start:start + BATCH]))
+        await session.commit()
+        return genre_ids
+
+
+async def main(movies: int, genres: int, queries: int, limit: int):
+    await create_tables()
+    genre_ids = await seed(movies, genres)
+
+    service = MovieService()
+    with Timer() as build:
+        async with async_session() as session:
+            await genre_movie_index.ensure_built(session)
+
+    rng = random.Random(13)
+    latencies = {MODE_ALL: [], MODE_ANY: []}
+    for _ in range(queries):
+        mode = rng.choice((MODE_ALL, MODE_ANY))
+        selected = rng.sample(genre_ids, rng.choice((1, 2, 3)))
+        with Timer() as t:
+            async with async_session() as session:
+                cursor = None
+                # Primera página y, si la hay, la siguiente
+                for _ in range(2):
+                    _, cursor = await service._load_movies_by_genres(sorted(selected), mode, session, limit, cursor, None)
+                    if cursor is None:
+                        break
+        latencies[mode].append(t.elapsed * 1000)
+
+    report("GET /movies/by-genres", [
+        ("movies x genres", f"{movies} x {genres}"),
+        ("index build (ms)", f"{build.elapsed * 1000:.1f}"),
+        ("bitmap bytes", genre_movie_index.stats()["bitmap_bytes"]),
+        ("queries (2 pages each)", queries),
+        ("all p50 / p99 (ms)", f"{percentile(latencies[MODE_ALL], 0.50):.2f} / {percentile(latencies[MODE_ALL], 0.99):.2f}"),
+        ("any p50 / p99 (ms)", f"{percentile(latencies[MODE_ANY], 0.50):.2f} / {percentile(latencies[MODE_ANY], 0.99):.2f}"),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=50000)
+    parser.add_argument("--genres", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.movies, args.genres, args.queries, args.limit))
@@ -0,0 +1,132 @@
+"""
+GET /movies: the previous full-catalog joinedload(genres, showtimes) query
+against one keyset page (genres via selectinload, no showtimes), at the
+start and deep into the catalog.
+
+    python -m benchmarks.movie_listing --movies 50000 --showtimes-per-movie 20
+"""
+import argparse
+import asyncio
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import select, insert, func
+from sqlalchemy.orm import joinedload
+
+from benchmarks.common import create_tables, report, Timer
+from src.config.db_config import async_session
+from src.models.movie_model import Movie
+from src.models.genre_model import Genre
+from src.models.movie_genre_model import MovieGenre
+from src.models.showtime_model import Showtime
+from src.schema.responses.movie_response import MovieResponse
+from src.services.movie_service import MovieService
+from src.utils.pagination import encode_cursor
+
+BATCH = 2000
+
+
+async def seed(movies: int, showtimes_per_movie: int) -> list[int]:
+    tag = uuid.uuid4().hex[:8]
+    async with async_session() as session:
+        await session.execute(insert(Genre).values([{"name": f"bench-{tag}-{g}"} for g in range(10)]))
+        genre_ids = list((await session.execute(
+            select(Genre.id).where(Genre.name.like(f"bench-{tag}-%")).order_by(Genre.id)
+        )).scalars())
+
+        first_id = (await session.scalar(select(func.max(Movie.id)))) or 0
+        for start in range(0, movies, BATCH):
+            count = min(BATCH, movies - start)
+            await session.execute(insert(Movie).values([
+                {"title": f"Bench {tag} {start + i}", "duration_minutes": 100 + i % 60, "director": "Bench"}
+                for i in range(count)
+            ]))
+        movie_ids = list((await session.execute(
+            select(Movie.id).where(Movie.id > first_id).order_by(Movie.id)
+        )).scalars())
+
+        links = [
+            {"movie_id": movie_id, "genre_id": genre_ids[(movie_id + k) % len(genre_ids)]}
+            for movie_id in movie_ids for k in (0, 3)
+        ]
+        for start in range(0, len(links), BATCH):
+            await session.execute(insert(MovieGenre).values(links[start:start + BATCH]))
+
+        # Historial de funciones pasadas: lo que infla el producto cartesiano
+        base = datetime(2020, 1, 1, 18, 0)
+        batch = []
+        for movie_id in movie_ids:
+            batch.extend(
+                {"movie_id": movie_id, "show_datetime": base + timedelta(days=7 * k, minutes=movie_id % 600)}
+                for k in range(showtimes_per_movie)
+            )
+            if len(batch) >= BATCH:
+                await session.execute(insert(Showtime).values(batch))
+                batch = []
+        if batch:
+            await session.execute(insert(Showtime).values(batch))
+        await session.commit()
+    return movie_ids
+
+
+async def full_catalog():
+    async with async_session() as session:
+        result = await session.execute(
+            select(Movie).options(joinedload(Movie.genres), joinedload(Movie.showtimes))
+        )
+        movies = result.unique().scalars().all()
+        return [MovieResponse.model_validate(m, from_attributes=True).model_dump() for m in movies]
+
+
+async def keyset_page(limit: int, cursor: str | None):
+    async with async_session() as session:
+        movies, _ = await MovieService().get_all_movies(session, limit, cursor)
+        return [MovieResponse.model_validate(m, from_attributes=True).model_dump() for m in movies]
+
+
+async def measure(fn, *args, repeat: int = 1) -> tuple[float, float]:
+    tracemalloc.start()
+    with Timer() as t:
+        for _ in range(repeat):
+            await fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return t.elapsed / repeat, peak
+
+
+async def main(movies: int, showtimes_per_movie: int, limit: int, skip_full: bool):
+    await create_tables()
+    with Timer() as seeding:
+        movie_ids = await seed(movies, showtimes_per_movie)
+
+    deep_cursor = encode_cursor({"id": movie_ids[int(len(movie_ids) * 0.9)]})
+    first_time, first_peak = await measure(keyset_page, limit, None, repeat=20)
+    deep_time, deep_peak = await measure(keyset_page, limit, deep_cursor, repeat=20)
+
+    rows = [
+        ("movies", movies),
+        ("showtimes", movies * showtimes_per_movie),
+        ("seed (s)", f"{seeding.elapsed:.1f}"),
+        ("page size", limit),
+        ("keyset first page (ms)", f"{first_time * 1000:.1f}"),
+        ("keyset first page peak (MiB)", f"{first_peak / 2**20:.2f}"),
+        ("keyset page at 90% (ms)", f"{deep_time * 1000:.1f}"),
+        ("keyset page at 90% peak (MiB)", f"{deep_peak / 2**20:.2f}"),
+    ]
+    if not skip_full:
+        full_time, full_peak = await measure(full_catalog)
+        rows += [
+            ("full joinedload (ms)", f"{full_time * 1000:.1f}"),
+            ("full joinedload peak (MiB)", f"{full_peak / 2**20:.2f}"),
+        ]
+    report("GET /movies: full joinedload vs keyset page", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=50000)
+    parser.add_argument("--showtimes-per-movie", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--skip-full", action="store_true", help="Skip the full-catalog baseline")
+    args = parser.parse_args()
+    asyncio.run(main(args.movies, args.showtimes_per_movie, args.limit, args.skip_full))
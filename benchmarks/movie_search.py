@@ -0,0 +1,91 @@
+"""
+GET /movies/search?q= latency on a large catalog: ranking in the in-process
+inverted index (non-MySQL backends) plus loading the page of movies.
+
+    python -m benchmarks.movie_search --movies 50000 --queries 500
+"""
+import argparse
+import asyncio
+import itertools
+import random
+from sqlalchemy import insert
+
+from benchmarks.common import create_tables, report, Timer
+from src.config.db_config import async_session
+from src.models.movie_model import Movie
+from src.cache.movie_search_index import movie_search_index
+from src.services.movie_service import MovieService
+
+BATCH = 2000
+
+# Vocabulario con frecuencias de Zipf, como el texto real: pocos términos muy comunes y una cola larga
+VOCABULARY = [f"term{rank}" for rank in range(5000)]
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+DIRECTORS = ["Ana Torres", "John Miller", "Lucía Pérez", "Kenji Sato", "Marie Dubois", "Omar Haddad"]
+
+
+def words(rng: random.Random, k: int) -> list[str]:
+    return rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=k)
+
+
+async def seed(movies: int, description_words: int):
+    rng = random.Random(7)
+    async with async_session() as session:
+        for start in range(0, movies, BATCH):
+            await session.execute(insert(Movie).values([
+                {
+                    "title": " ".join(words(rng, 3)).title(),
+                    "description": " ".join(words(rng, description_words)),
+                    "director": rng.choice(DIRECTORS),
+                    "duration_minutes": 100,
+                }
+                for _ in range(min(BATCH, movies - start))
+            ]))
+        await session.commit()
+
+
+def percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def main(movies: int, queries: int, limit: int, description_words: int):
+    await create_tables()
+    await seed(movies, description_words)
+
+    service = MovieService()
+    with Timer() as build:
+        async with async_session() as session:
+            await movie_search_index.ensure_built(session)
+
+    rng = random.Random(11)
+    latencies = []
+    results = 0
+    for _ in range(queries):
+        # Las consultas también siguen la distribución del texto
+        q = " ".join(words(rng, rng.choice((1, 2, 2, 3))))
+        with Timer() as t:
+            async with async_session() as session:
+                page, _ = await service.search_movies(q, session, limit)
+        latencies.append(t.elapsed * 1000)
+        results += len(page)
+
+    report("GET /movies/search", [
+        ("movies", movies),
+        ("indexed terms", movie_search_index.stats()["terms"]),
+        ("index build (ms)", f"{build.elapsed * 1000:.1f}"),
+        ("queries", queries),
+        ("avg results per page", f"{results / queries:.1f}"),
+        ("p50 (ms)", f"{percentile(latencies, 0.50):.2f}"),
+        ("p99 (ms)", f"{percentile(latencies, 0.99):.2f}"),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--description-words", type=int, default=60)
+    args = parser.parse_args()
+    asyncio.run(main(args.movies, args.queries, args.limit, args.description_words))
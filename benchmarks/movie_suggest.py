@@ -0,0 +1,53 @@
+"""
+GET /movies/suggest?prefix= lookups against the in-memory prefix index, for
+every prefix a user types letter by letter, on a large catalog.
+
+    python -m benchmarks.movie_suggest --movies 50000 --queries 2000
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.common import create_tables, report, Timer
+from benchmarks.movie_search import seed, words, percentile
+from src.config.db_config import async_session
+from src.cache.movie_suggest_index import movie_suggest_index
+
+
+async def main(movies: int, queries: int, limit: int):
+    await create_tables()
+    await seed(movies, description_words=10)
+
+    with Timer() as build:
+        async with async_session() as session:
+            await movie_suggest_index.ensure_built(session)
+
+    rng = random.Random(5)
+    latencies = []
+    for _ in range(queries):
+        # Cada tecla de una palabra de título es una consulta
+        word = words(rng, 1)[0]
+        for end in range(1, len(word) + 1):
+            start = time.perf_counter()
+            movie_suggest_index.suggest(word[:end], limit)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    stats = movie_suggest_index.stats()
+    report("GET /movies/suggest (in-memory lookup)", [
+        ("movies", movies),
+        ("keys", stats["keys"]),
+        ("index build (ms)", f"{build.elapsed * 1000:.1f}"),
+        ("lookups", len(latencies)),
+        ("p50 (µs)", f"{percentile(latencies, 0.50):.1f}"),
+        ("p99 (µs)", f"{percentile(latencies, 0.99):.1f}"),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.movies, args.queries, args.limit))
@@ -0,0 +1,67 @@
+"""
+Event-loop stalls during a login burst: Argon2 verification inline in the
+handler (before) versus on the bounded hashing pool (after). A ticker that
+should wake every 10 ms stands in for the catalog traffic on the same worker.
+
+    python -m benchmarks.password_hashing --logins 60
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from fastapi import HTTPException
+
+from benchmarks.common import report, Timer
+from benchmarks.movie_search import percentile
+from src.utils.password_handler import hash_password, verify_password, verify_password_async, password_hash_pool
+
+TICK_SECONDS = 0.01
+
+
+async def ticker(stop: asyncio.Event, lags: list[float]):
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+
+async def burst(logins: int, hashed: str, offload: bool) -> tuple[list[float], Counter, float]:
+    async def login() -> str:
+        await asyncio.sleep(0)
+        if not offload:
+            verify_password("Bench-password-1", hashed)
+            return "200"
+        try:
+            await verify_password_async("Bench-password-1", hashed)
+            return "200"
+        except HTTPException as e:
+            return str(e.status_code)
+
+    stop, lags = asyncio.Event(), []
+    tick = asyncio.create_task(ticker(stop, lags))
+    await asyncio.sleep(TICK_SECONDS * 2)
+    with Timer() as t:
+        outcomes = Counter(await asyncio.gather(*[login() for _ in range(logins)]))
+    stop.set()
+    await tick
+    return lags, outcomes, t.elapsed
+
+
+async def main(logins: int):
+    hashed = hash_password("Bench-password-1")
+    rows = [("logins in the burst", logins), ("pool workers / queue", f"{password_hash_pool.workers} / {password_hash_pool.max_queue}")]
+    for label, offload in (("inline", False), ("pool", True)):
+        lags, outcomes, elapsed = await burst(logins, hashed, offload)
+        rows += [
+            (f"{label} loop lag p50 / max (ms)", f"{percentile(lags, 0.50):.1f} / {max(lags, default=0):.1f}"),
+            (f"{label} outcomes", dict(outcomes)),
+            (f"{label} burst time (s)", f"{elapsed:.2f}"),
+        ]
+    report("Argon2 during a login burst", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=60)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins))
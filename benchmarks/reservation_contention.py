@@ -0,0 +1,105 @@
+"""
+Contention benchmark for ReservationService.
+
+Hundreds of concurrent clients race for the seats of a single showtime until
+it sells out. Reports bookings per second and checks that no seat was sold
+twice.
+
+    python -m benchmarks.reservation_contention --clients 300 --seats-per-booking 2
+"""
+import argparse
+import asyncio
+import random
+from fastapi import HTTPException
+from sqlalchemy import select, func
+
+from benchmarks.common import (
+    create_tables,
+    create_bench_user,
+    create_bench_showtime,
+    get_seat_ids,
+    report,
+    Timer,
+)
+from src.config.db_config import async_session
+from src.models.seat_model import Seat
+from src.models.reservation_model import Reservation
+from src.schema.requests.reservation_request import ReservationCreateRequest
+from src.services.reservation_service import ReservationService
+
+
+async def buyer(service: ReservationService, user, showtime_id: int, seat_ids: list[int], per_booking: int, stats: dict):
+    rnd = random.Random()
+    while stats["free"]:
+        wanted = rnd.sample(sorted(stats["free"]), min(per_booking, len(stats["free"])))
+        async with async_session() as session:
+            try:
+                await service.create_reservation(
+                    ReservationCreateRequest(showtime_id=showtime_id, seat_ids=wanted), session, user
+                )
+                stats["booked"] += 1
+                stats["free"].difference_update(wanted)
+            except HTTPException as e:
+                if e.status_code != 409:
+                    raise
+                stats["conflicts"] += 1
+                # Refresca la vista local de asientos libres como haría un cliente real
+                result = await session.execute(
+                    select(Seat.id).where(Seat.showtime_id == showtime_id, Seat.is_reserved == False)
+                )
+                stats["free"].intersection_update(result.scalars().all())
+
+
+async def main(clients: int, per_booking: int, rows: int, seats_per_row: int):
+    await create_tables()
+    async with async_session() as session:
+        user = await create_bench_user(session)
+        showtime = await create_bench_showtime(session, rows, seats_per_row)
+        seat_ids = await get_seat_ids(session, showtime.id)
+
+    service = ReservationService()
+    stats = {"booked": 0, "conflicts": 0, "free": set(seat_ids)}
+
+    with Timer() as t:
+        await asyncio.gather(*[
+            buyer(service, user, showtime.id, seat_ids, per_booking, stats)
+            for _ in range(clients)
+        ])
+
+    async with async_session() as session:
+        reserved = await session.scalar(
+            select(func.count()).select_from(Seat).where(Seat.showtime_id == showtime.id, Seat.is_reserved == True)
+        )
+        reservations = await session.scalar(
+            select(func.count()).select_from(Reservation).where(Reservation.showtime_id == showtime.id)
+        )
+        distinct_seats = await session.scalar(
+            select(func.count(func.distinct(Reservation.seat_id))).where(Reservation.showtime_id == showtime.id)
+        )
+
+    report("Reservation contention", [
+        ("showtime_id", showtime.id),
+        ("clients", clients),
+        ("seats", len(seat_ids)),
+        ("seats per booking", per_booking),
+        ("successful bookings", stats["booked"]),
+        ("conflicts (409)", stats["conflicts"]),
+        ("elapsed (s)", f"{t.elapsed:.3f}"),
+        ("bookings/s", f"{stats['booked'] / t.elapsed:.1f}"),
+        ("attempts/s", f"{(stats['booked'] + stats['conflicts']) / t.elapsed:.1f}"),
+        ("reserved seats", reserved),
+        ("reservation rows", reservations),
+        ("double bookings", reservations - distinct_seats),
+    ])
+    if reserved != reservations or reservations != distinct_seats:
+        raise SystemExit("❌ Inconsistent seat state detected")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--seats-per-booking", type=int, default=1)
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--seats-per-row", type=int, default=25)
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.seats_per_booking, args.rows, args.seats_per_row))
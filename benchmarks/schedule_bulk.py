@@ -0,0 +1,66 @@
+"""
+Times ShowtimeService.create_schedule for a full season.
+
+    python -m benchmarks.schedule_bulk --days 167 --times 14:00 17:00 20:00 --rows 20 --seats-per-row 25
+"""
+import argparse
+import asyncio
+import uuid
+from datetime import date, time, timedelta
+from sqlalchemy import select, func
+
+from benchmarks.common import create_tables, create_bench_user, report, Timer
+from src.config.db_config import async_session
+from src.models.auditorium_layout_model import AuditoriumLayout
+from src.models.movie_model import Movie
+from src.models.seat_model import Seat
+from src.models.showtime_model import Showtime
+from src.models.user_model import RoleEnum
+from src.schema.requests.showtime_request import ShowtimeScheduleRequest
+from src.services.showtime_service import ShowtimeService
+
+
+async def main(days: int, times: list[str], rows: int, seats_per_row: int):
+    await create_tables()
+    async with async_session() as session:
+        admin = await create_bench_user(session)
+        admin.user_role = RoleEnum.admin
+        movie = Movie(title=f"Bench season {uuid.uuid4().hex[:8]}")
+        layout = AuditoriumLayout(name=f"Bench {uuid.uuid4().hex[:8]}", rows=rows, seats_per_row=seats_per_row)
+        session.add_all([movie, layout])
+        await session.commit()
+
+        request = ShowtimeScheduleRequest(
+            movie_id=movie.id,
+            start_date=date.today() + timedelta(days=1),
+            end_date=date.today() + timedelta(days=days),
+            times=[time.fromisoformat(t) for t in times],
+            layout_id=layout.id,
+        )
+
+        with Timer() as t:
+            result = await ShowtimeService.create_schedule(request, session, admin)
+
+        showtimes = await session.scalar(select(func.count()).select_from(Showtime).where(Showtime.movie_id == movie.id))
+        seats = await session.scalar(
+            select(func.count()).select_from(Seat).join(Showtime).where(Showtime.movie_id == movie.id)
+        )
+
+    report("Bulk schedule", [
+        ("showtimes created", result.created),
+        ("seats created", result.seats_created),
+        ("showtimes in db", showtimes),
+        ("seats in db", seats),
+        ("elapsed (s)", f"{t.elapsed:.3f}"),
+        ("seats/s", f"{result.seats_created / t.elapsed:.0f}"),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=167)
+    parser.add_argument("--times", nargs="+", default=["14:00", "17:00", "20:00"])
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--seats-per-row", type=int, default=25)
+    args = parser.parse_args()
+    asyncio.run(main(args.days, args.times, args.rows, args.seats_per_row))
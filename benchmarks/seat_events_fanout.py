@@ -0,0 +1,109 @@
+"""
+In-process fan-out of live seat events to many SSE subscribers.
+
+Each subscriber is the same `seat_event_stream` generator the
+GET /showtimes/{id}/events route streams, consumed by its own task, so the
+memory figure covers the subscription, its queue, the generator and the
+task (sockets and transport buffers are not included).
+
+    python -m benchmarks.seat_events_fanout --subscribers 10000 --events 50
+"""
+import argparse
+import asyncio
+import gc
+import tracemalloc
+
+from benchmarks.common import report, Timer
+from src.realtime.seat_events import seat_event_hub, seat_event_stream, publish_seat_change
+
+SHOWTIME_ID = 1
+
+
+def build_snapshot(seats: int) -> dict:
+    return {
+        "id": SHOWTIME_ID,
+        "show_datetime": "2030-01-01T20:00:00",
+        "movie": {"id": 1, "title": "Bench"},
+        "seats": [{"id": i, "seat_number": f"A{i}", "is_reserved": False, "is_held": False} for i in range(seats)],
+    }
+
+
+class Delivery:
+    """Counts messages across all subscribers and wakes the publisher once every one got the current event."""
+
+    def __init__(self):
+        self.count = 0
+        self.target = 0
+        self.done = asyncio.Event()
+
+    def expect(self, target: int):
+        self.count = 0
+        self.target = target
+        self.done = asyncio.Event()
+
+    def received(self):
+        self.count += 1
+        if self.count == self.target:
+            self.done.set()
+
+
+async def consume(stream, delivery: Delivery):
+    async for _ in stream:
+        delivery.received()
+
+
+async def main(subscribers: int, events: int, seats: int):
+    snapshot = build_snapshot(seats)
+    delivery = Delivery()
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    # Cada suscriptor recibe primero el snapshot
+    delivery.expect(subscribers)
+    tasks = []
+    with Timer() as subscribe_time:
+        for _ in range(subscribers):
+            subscription = seat_event_hub.subscribe(SHOWTIME_ID)
+            tasks.append(asyncio.create_task(consume(seat_event_stream(subscription, snapshot), delivery)))
+        await delivery.done.wait()
+
+    gc.collect()
+    per_subscriber = (tracemalloc.get_traced_memory()[0] - before) / subscribers
+    tracemalloc.stop()
+
+    latencies = []
+    for i in range(events):
+        delivery.expect(subscribers)
+        with Timer() as t:
+            publish_seat_change(SHOWTIME_ID, reserved=[i % seats])
+            await delivery.done.wait()
+        latencies.append(t.elapsed)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies.sort()
+    report("Live seat events: in-process fan-out", [
+        ("subscribers", subscribers),
+        ("snapshot seats", seats),
+        ("events published", events),
+        ("subscribe + snapshot (s)", f"{subscribe_time.elapsed:.2f}"),
+        ("memory per subscriber (KiB)", f"{per_subscriber / 1024:.2f}"),
+        ("fan-out p50 (ms)", f"{latencies[len(latencies) // 2] * 1000:.2f}"),
+        ("fan-out max (ms)", f"{latencies[-1] * 1000:.2f}"),
+        ("deliveries/s", f"{subscribers * events / sum(latencies):.0f}"),
+        ("dropped slow subscribers", seat_event_hub.dropped),
+        ("subscribers left", seat_event_hub.subscriber_count()),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=10000)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--seats", type=int, default=600)
+    args = parser.parse_args()
+    asyncio.run(main(args.subscribers, args.events, args.seats))
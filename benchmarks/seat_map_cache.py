@@ -0,0 +1,81 @@
+"""
+Compares GET /showtimes/{id} served from the in-process seat map cache
+against the previous joinedload(Showtime.movie, Showtime.seats) path.
+
+    python -m benchmarks.seat_map_cache --requests 2000 --rows 20 --seats-per-row 30
+"""
+import argparse
+import asyncio
+from sqlalchemy import select, update
+from sqlalchemy.orm import joinedload
+
+from benchmarks.common import create_tables, create_bench_showtime, get_seat_ids, report, Timer
+from src.config.db_config import async_session
+from src.models.showtime_model import Showtime
+from src.models.seat_model import Seat
+from src.cache.seat_map_cache import seat_map_cache
+from src.schema.responses.showtime_response import ShowtimeDetailResponse
+from src.services.showtime_service import ShowtimeService
+
+
+async def joinedload_path(showtime_id: int):
+    async with async_session() as session:
+        result = await session.execute(
+            select(Showtime).where(Showtime.id == showtime_id).options(
+                joinedload(Showtime.movie),
+                joinedload(Showtime.seats)
+            )
+        )
+        showtime = result.unique().scalar_one()
+        return ShowtimeDetailResponse.model_validate(showtime).model_dump_json()
+
+
+async def cached_path(showtime_id: int):
+    async with async_session() as session:
+        payload = await ShowtimeService.get_showtime_by_id(showtime_id, session)
+        return ShowtimeDetailResponse.model_validate(payload).model_dump_json()
+
+
+async def run(fn, showtime_id: int, requests: int) -> float:
+    with Timer() as t:
+        for _ in range(requests):
+            await fn(showtime_id)
+    return t.elapsed
+
+
+async def main(requests: int, rows: int, seats_per_row: int):
+    await create_tables()
+    async with async_session() as session:
+        showtime = await create_bench_showtime(session, rows, seats_per_row)
+        seat_ids = await get_seat_ids(session, showtime.id)
+        # Un tercio de la sala vendida
+        await session.execute(update(Seat).where(Seat.id.in_(seat_ids[::3])).values(is_reserved=True))
+        await session.commit()
+
+    assert await joinedload_path(showtime.id) == await cached_path(showtime.id)
+
+    seat_map_cache.clear()
+    seat_map_cache.hits = seat_map_cache.misses = 0
+    base = await run(joinedload_path, showtime.id, requests)
+    cached = await run(cached_path, showtime.id, requests)
+
+    report("Showtime detail: joinedload vs seat map cache", [
+        ("showtime_id", showtime.id),
+        ("seats", len(seat_ids)),
+        ("requests", requests),
+        ("joinedload req/s", f"{requests / base:.1f}"),
+        ("joinedload avg (ms)", f"{base / requests * 1000:.3f}"),
+        ("cached req/s", f"{requests / cached:.1f}"),
+        ("cached avg (ms)", f"{cached / requests * 1000:.3f}"),
+        ("speedup", f"{base / cached:.1f}x"),
+        ("cache hits / misses", f"{seat_map_cache.hits} / {seat_map_cache.misses}"),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=5)
+    parser.add_argument("--seats-per-row", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rows, args.seats_per_row))
@@ -0,0 +1,96 @@
+"""
+Boots the API against a throwaway SQLite database for performance runs:
+
+    python -m benchmarks.serve --port 8000 --seed
+
+The database lives in a temporary directory that is removed on exit
+(--keep leaves it). --db-url points the same run at another backend,
+e.g. a local MySQL stand-in. --seed creates an admin account, a movie and
+a few showtimes so load tools can log in and book right away.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+SEED_ADMIN_EMAIL = "admin@example.com"
+SEED_ADMIN_PASSWORD = "Bench-admin-1"
+
+
+async def seed(showtimes: int):
+    # Importa la app para registrar todos los modelos en Base.metadata
+    import app  # noqa: F401
+    from src.config.db_config import engine, async_session
+    from src.models.base_model import Base
+    from src.models.user_model import User, RoleEnum
+    from src.models.movie_model import Movie
+    from src.schema.requests.showtime_request import ShowtimeCreateRequest
+    from src.services.showtime_service import ShowtimeService
+    from src.utils.password_handler import hash_password
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_session() as session:
+        admin = User(
+            name="Bench",
+            lastname="Admin",
+            nickname="benchadmin",
+            email=SEED_ADMIN_EMAIL,
+            password=hash_password(SEED_ADMIN_PASSWORD),
+            country_code="+1",
+            phone_number="5550000000",
+            country="Benchland",
+            user_role=RoleEnum.admin,
+        )
+        movie = Movie(title="Bench Movie", duration_minutes=120)
+        session.add_all([admin, movie])
+        await session.commit()
+
+        first = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+        for i in range(showtimes):
+            await ShowtimeService.create_showtime(
+                ShowtimeCreateRequest(movie_id=movie.id, show_datetime=first + timedelta(hours=3 * i)),
+                session,
+                admin,
+            )
+    await engine.dispose()
+    print(f"Seeded admin {SEED_ADMIN_EMAIL} / {SEED_ADMIN_PASSWORD}, movie {movie.id}, {showtimes} showtimes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--db-url", default=None, help="Use this database instead of a throwaway SQLite file")
+    parser.add_argument("--seed", action="store_true")
+    parser.add_argument("--showtimes", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary database on exit")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    tmpdir = None
+    if args.db_url:
+        os.environ["DB_URL"] = args.db_url
+    else:
+        tmpdir = tempfile.mkdtemp(prefix="movies-perf-")
+        os.environ["DB_URL"] = f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'perf.db')}"
+    os.environ["LOG_LEVEL"] = args.log_level
+    print(f"Database: {os.environ['DB_URL']}")
+
+    try:
+        if args.seed:
+            asyncio.run(seed(args.showtimes))
+
+        import uvicorn
+        uvicorn.run("app:app", host=args.host, port=args.port, workers=args.workers, log_level=args.log_level.lower())
+    finally:
+        if tmpdir and not args.keep:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+GET /showtimes/search/advanced on a year of schedule: date range, genres,
+start-time window and free seats, grouped by movie in one query.
+
+    python -m benchmarks.showtime_search --screens 30 --days 365 --movies 300
+"""
+import argparse
+import asyncio
+import random
+import uuid
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import select, insert, func
+
+from benchmarks.common import create_tables, report, Timer
+from benchmarks.movie_search import percentile
+from src.config.db_config import async_session
+from src.models.movie_model import Movie
+from src.models.genre_model import Genre
+from src.models.movie_genre_model import MovieGenre
+from src.models.showtime_model import Showtime
+from src.services.showtime_service import ShowtimeService
+
+BATCH = 5000
+SLOTS = (time(11, 0), time(14, 0), time(17, 0), time(20, 0), time(22, 30))
+SEATS = 150
+
+
+async def seed(screens: int, days: int, movies: int) -> list[int]:
+    rng = random.Random(3)
+    tag = uuid.uuid4().hex[:8]
+    async with async_session() as session:
+        await session.execute(insert(Genre).values([{"name": f"bench-{tag}-{g}"} for g in range(12)]))
+        genre_ids = list((await session.execute(
+            select(Genre.id).where(Genre.name.like(f"bench-{tag}-%")).order_by(Genre.id)
+        )).scalars())
+
+        first_id = (await session.scalar(select(func.max(Movie.id)))) or 0
+        await session.execute(insert(Movie).values([
+            {"title": f"Bench {tag} {i}", "duration_minutes": 110, "director": "Bench"} for i in range(movies)
+        ]))
+        movie_ids = list((await session.execute(
+            select(Movie.id).where(Movie.id > first_id).order_by(Movie.id)
+        )).scalars())
+        await session.execute(insert(MovieGenre).values([
+            {"movie_id": movie_id, "genre_id": genre_id}
+            for movie_id in movie_ids for genre_id in rng.sample(genre_ids, 2)
+        ]))
+
+        # Cada sala pasa una película distinta por semana, en todos los horarios del día
+        today = date.today()
+        rows = []
+        for day in range(days):
+            for screen in range(screens):
+                movie_id = movie_ids[(screen * 7 + (day // 7) * screens) % len(movie_ids)]
+                for slot in SLOTS:
+                    rows.append({
+                        "movie_id": movie_id,
+                        "show_datetime": datetime.combine(today + timedelta(days=day + 1), slot),
+                        "seats_total": SEATS,
+                        "seats_available": rng.randint(0, SEATS),
+                    })
+        for start in range(0, len(rows), BATCH):
+            await session.execute(insert(Showtime).values(rows[start:start + BATCH]))
+        await session.commit()
+        return genre_ids
+
+
+async def main(screens: int, days: int, movies: int, queries: int):
+    await create_tables()
+    with Timer() as seeding:
+        genre_ids = await seed(screens, days, movies)
+
+    rng = random.Random(9)
+    today = date.today()
+    latencies = []
+    groups = 0
+    for _ in range(queries):
+        date_from = today + timedelta(days=rng.randint(0, days - 30))
+        with Timer() as t:
+            async with async_session() as session:
+                page, _ = await ShowtimeService.search_showtimes(
+                    session,
+                    date_from=date_from,
+                    date_to=date_from + timedelta(days=rng.choice((1, 7, 30))),
+                    genre_ids=rng.sample(genre_ids, rng.choice((1, 2, 3))),
+                    time_from=rng.choice((None, time(17, 0))),
+                    time_to=rng.choice((None, time(23, 0))),
+                    min_seats=rng.choice((None, 2, 10)),
+                    limit=20,
+                )
+        latencies.append(t.elapsed * 1000)
+        groups += len(page)
+
+    report("GET /showtimes/search/advanced", [
+        ("screens x days", f"{screens} x {days}"),
+        ("showtimes", screens * days * len(SLOTS)),
+        ("movies", movies),
+        ("seed (s)", f"{seeding.elapsed:.1f}"),
+        ("queries", queries),
+        ("avg movies per page", f"{groups / queries:.1f}"),
+        ("p50 (ms)", f"{percentile(latencies, 0.50):.2f}"),
+        ("p99 (ms)", f"{percentile(latencies, 0.99):.2f}"),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--screens", type=int, default=30)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--movies", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(main(args.screens, args.days, args.movies, args.queries))
@@ -0,0 +1,81 @@
+"""
+GET /movies?fields=title,poster_url against the full page: columns fetched
+from the database and JSON bytes sent, on a catalog with long synopses.
+
+    python -m benchmarks.sparse_fields --movies 5000 --description-bytes 2000
+"""
+import argparse
+import asyncio
+import json
+import uuid
+from sqlalchemy import insert
+
+from benchmarks.common import create_tables, report, Timer
+from src.config.db_config import async_session
+from src.models.movie_model import Movie
+from src.schema.responses.movie_response import MovieResponse
+from src.services.movie_service import MovieService
+
+BATCH = 1000
+
+
+async def seed(movies: int, description_bytes: int):
+    tag = uuid.uuid4().hex[:8]
+    async with async_session() as session:
+        for start in range(0, movies, BATCH):
+            await session.execute(insert(Movie).values([
+                {
+                    "title": f"Bench {tag} {start + i}",
+                    "description": "Lorem ipsum " * (description_bytes // 12),
+                    "poster_url": f"https://img.example.com/{tag}/{start + i}.jpg",
+                    "duration_minutes": 100,
+                    "director": "Bench",
+                }
+                for i in range(min(BATCH, movies - start))
+            ]))
+        await session.commit()
+
+
+async def walk(limit: int, fields: str | None) -> int:
+    # Recorre todo el catálogo página a página, como el grid del cliente
+    service = MovieService()
+    sent = 0
+    cursor = None
+    while True:
+        async with async_session() as session:
+            movies, cursor = await service.get_all_movies(session, limit, cursor, fields)
+        if fields is None:
+            movies = [MovieResponse.model_validate(m, from_attributes=True).model_dump(mode="json") for m in movies]
+        sent += len(json.dumps(movies, default=str))
+        if not cursor:
+            return sent
+
+
+async def main(movies: int, description_bytes: int, limit: int, fields: str):
+    await create_tables()
+    await seed(movies, description_bytes)
+
+    with Timer() as full:
+        full_bytes = await walk(limit, None)
+    with Timer() as sparse:
+        sparse_bytes = await walk(limit, fields)
+
+    report(f"GET /movies: full vs fields={fields}", [
+        ("movies", movies),
+        ("page size", limit),
+        ("full catalog walk (ms)", f"{full.elapsed * 1000:.1f}"),
+        ("full JSON (KiB)", f"{full_bytes / 1024:.1f}"),
+        ("sparse catalog walk (ms)", f"{sparse.elapsed * 1000:.1f}"),
+        ("sparse JSON (KiB)", f"{sparse_bytes / 1024:.1f}"),
+        ("bytes ratio", f"{sparse_bytes / full_bytes:.2%}"),
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--movies", type=int, default=5000)
+    parser.add_argument("--description-bytes", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--fields", default="title,poster_url")
+    args = parser.parse_args()
+    asyncio.run(main(args.movies, args.description_bytes, args.limit, args.fields))
@@ -0,0 +1,82 @@
+"""
+Bytes read per authenticated request for the user lookup, with the 2 MB
+profile photo loaded with the row (before) and deferred (after).
+
+    python -m benchmarks.user_row_bytes --users 20 --requests 500
+"""
+import argparse
+import asyncio
+import os
+import random
+from sqlalchemy import select, update, inspect
+from sqlalchemy.orm import undefer
+
+from benchmarks.common import create_tables, create_bench_user, report, Timer
+from benchmarks.movie_search import percentile
+from src.config.db_config import async_session
+from src.models.user_model import User
+
+PHOTO_BYTES = 2 * 1024 * 1024
+
+
+def loaded_bytes(user: User) -> int:
+    # Lo que trajo la fila: cada atributo cargado, con su tamaño en el wire
+    total = 0
+    for value in inspect(user).dict.values():
+        if isinstance(value, (bytes, str)):
+            total += len(value)
+        elif value is not None and not hasattr(value, "_sa_instance_state"):
+            total += 8
+    return total
+
+
+async def seed(users: int) -> list[int]:
+    user_ids = []
+    async with async_session() as session:
+        for _ in range(users):
+            user = await create_bench_user(session)
+            user_ids.append(user.id)
+        await session.execute(update(User).where(User.id.in_(user_ids)).values(profile_photo=os.urandom(PHOTO_BYTES)))
+        await session.commit()
+    return user_ids
+
+
+async def measure(user_ids: list[int], requests: int, options: list) -> tuple[list[float], int]:
+    rng = random.Random(21)
+    latencies, total_bytes = [], 0
+    for _ in range(requests):
+        with Timer() as t:
+            # Lo mismo que get_current_user: una sesión por request y la fila del usuario
+            async with async_session() as session:
+                user = await session.scalar(select(User).options(*options).where(User.id == rng.choice(user_ids)))
+                total_bytes += loaded_bytes(user)
+        latencies.append(t.elapsed * 1000)
+    return latencies, total_bytes
+
+
+async def main(users: int, requests: int):
+    await create_tables()
+    user_ids = await seed(users)
+
+    results = []
+    for label, options in (("before (photo in row)", [undefer(User.profile_photo)]), ("after (deferred)", [])):
+        latencies, total_bytes = await measure(user_ids, requests, options)
+        results += [
+            (f"{label} bytes/request", f"{total_bytes / requests:,.0f}"),
+            (f"{label} p50 (ms)", f"{percentile(latencies, 0.50):.2f}"),
+            (f"{label} p99 (ms)", f"{percentile(latencies, 0.99):.2f}"),
+        ]
+
+    report("User lookup per authenticated request", [
+        ("users with a 2 MB photo", users),
+        ("requests", requests),
+        *results,
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.requests))
@@ -29,6 +29,7 @@ CREATE TABLE revoked_token_jti (
     exp TIMESTAMP NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     UNIQUE KEY (jti),
+    KEY ix_revoked_token_jti_exp (exp),
     FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
 );
 
@@ -38,6 +39,7 @@ CREATE TABLE login_attempts (
     user_id INT NOT NULL,
     failed_attempts INT DEFAULT 0,
     last_failed_at TIMESTAMP,
+    KEY ix_login_attempts_last_failed_at (last_failed_at),
     FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
 );
 
@@ -60,6 +62,7 @@ CREATE TABLE IF NOT EXISTS movie (
     poster_url VARCHAR(500),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FULLTEXT INDEX ft_movie_search (title, director, description),
     FOREIGN KEY (genre_id) REFERENCES genre(id) ON DELETE SET NULL
 ) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
 
@@ -68,18 +71,36 @@ CREATE TABLE IF NOT EXISTS movie_genre (
     movie_id INT NOT NULL,
     genre_id INT NOT NULL,
     PRIMARY KEY (movie_id, genre_id),
+    INDEX ix_movie_genre_genre_movie (genre_id, movie_id),
     FOREIGN KEY (movie_id) REFERENCES movie(id) ON DELETE CASCADE,
     FOREIGN KEY (genre_id) REFERENCES genre(id) ON DELETE CASCADE
 ) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
 
+-- Auditorium layout templates (rows × seats per row, aisle gaps)
+CREATE TABLE IF NOT EXISTS auditorium_layout (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100) UNIQUE NOT NULL,
+    num_rows SMALLINT NOT NULL,
+    seats_per_row SMALLINT NOT NULL,
+    gaps VARCHAR(255),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
+
 -- Showtimes table
 CREATE TABLE IF NOT EXISTS showtime (
     id INT AUTO_INCREMENT PRIMARY KEY,
     movie_id INT NOT NULL,
     show_datetime DATETIME NOT NULL,
+    layout_id INT NULL,
+    seats_total INT NOT NULL DEFAULT 0,
+    seats_available INT NOT NULL DEFAULT 0,
+    seat_version INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    FOREIGN KEY (movie_id) REFERENCES movie(id) ON DELETE CASCADE
+    FOREIGN KEY (movie_id) REFERENCES movie(id) ON DELETE CASCADE,
+    FOREIGN KEY (layout_id) REFERENCES auditorium_layout(id) ON DELETE SET NULL,
+    INDEX ix_showtime_movie_datetime (movie_id, show_datetime),
+    INDEX ix_showtime_show_datetime (show_datetime)
 ) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
 
 -- Seats table
@@ -105,3 +126,59 @@ CREATE TABLE IF NOT EXISTS reservation (
     FOREIGN KEY (seat_id) REFERENCES seat(id) ON DELETE CASCADE,
     UNIQUE KEY unique_seat_reservation (seat_id) -- To ensure each seat is reserved only once per reservatio
 ) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
+
+-- Seat holds (time-limited, released by the background sweeper)
+CREATE TABLE IF NOT EXISTS seat_hold (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    hold_token VARCHAR(36) NOT NULL,
+    user_id INT NOT NULL,
+    showtime_id INT NOT NULL,
+    seat_id INT NOT NULL,
+    expires_at DATETIME NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE,
+    FOREIGN KEY (showtime_id) REFERENCES showtime(id) ON DELETE CASCADE,
+    FOREIGN KEY (seat_id) REFERENCES seat(id) ON DELETE CASCADE,
+    UNIQUE KEY unique_seat_hold (seat_id),
+    KEY ix_seat_hold_expires_at (expires_at),
+    KEY ix_seat_hold_token (hold_token)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
+
+-- Archive of past showtimes (moved out of the hot tables by src.tasks.showtime_archiver)
+CREATE TABLE IF NOT EXISTS showtime_archive (
+    id INT PRIMARY KEY,
+    movie_id INT NOT NULL,
+    show_datetime DATETIME NOT NULL,
+    layout_id INT NULL,
+    seats_total INT NOT NULL DEFAULT 0,
+    seats_available INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_showtime_archive_movie_datetime (movie_id, show_datetime)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS seat_archive (
+    id INT PRIMARY KEY,
+    showtime_id INT NOT NULL,
+    seat_number VARCHAR(10) NOT NULL,
+    is_reserved BOOLEAN DEFAULT FALSE,
+    INDEX ix_seat_archive_showtime (showtime_id)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS reservation_archive (
+    id INT PRIMARY KEY,
+    user_id INT NOT NULL,
+    showtime_id INT NOT NULL,
+    seat_id INT NOT NULL,
+    reserved_at TIMESTAMP NULL,
+    INDEX ix_reservation_archive_user (user_id),
+    INDEX ix_reservation_archive_showtime (showtime_id)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
+
+-- Per-table change counters behind the catalog ETags
+CREATE TABLE IF NOT EXISTS table_version (
+    table_name VARCHAR(64) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
+
+INSERT IGNORE INTO table_version (table_name, version) VALUES ('movie', 0), ('genre', 0), ('showtime', 0);
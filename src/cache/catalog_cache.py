@@ -0,0 +1,138 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from src.realtime.relay import event_relay
+from src.cache.catalog_snapshots import catalog_snapshots
+from src.utils.metrics import register_metrics
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+RELAY_CHANNEL = "catalog"
+
+# Espacios de nombres de las lecturas de catálogo en caché
+MOVIES = "movies"
+MOVIE_DETAIL = "movie_detail"
+GENRES = "genres"
+SHOWTIMES = "showtimes"
+
+
+def movie_detail(movie_id: int) -> str:
+    return f"{MOVIE_DETAIL}:{movie_id}"
+
+
+def _root(namespace: str) -> str:
+    return namespace.split(":", 1)[0]
+
+
+class CatalogCache:
+    """
+    Per-process LRU + TTL cache of catalog read results (response models or
+    plain dicts, never ORM entities), keyed by (namespace, key). Namespaces
+    nest with ":" (`movie_detail:42`), and invalidating `movie_detail` also
+    drops every `movie_detail:*` entry.
+
+    Admin writes invalidate the namespaces they affect after commit; the
+    invalidation is forwarded over the event relay so every worker drops the
+    same entries. The TTL bounds staleness for data that changes without an
+    admin write (availability counters in the showtime listing).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+        # Cambia con cada invalidación: evita guardar una carga que se cruzó con una escritura
+        self._generations: dict[str, int] = {}
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def _generation(self, namespace: str) -> tuple[int, int]:
+        return self._generations.get(_root(namespace), 0), self._generations.get(namespace, 0)
+
+    async def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.enabled:
+            return await loader()
+
+        cache_key = (namespace, key)
+        root = _root(namespace)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(cache_key)
+                self.hits[root] = self.hits.get(root, 0) + 1
+                return value
+            del self._entries[cache_key]
+
+        self.misses[root] = self.misses.get(root, 0) + 1
+        generation = self._generation(namespace)
+        value = await loader()
+        if self._generation(namespace) == generation:
+            self._entries[cache_key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def _drop(self, namespace: str) -> int:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        prefix = namespace + ":"
+        stale = [
+            cache_key for cache_key in self._entries
+            if cache_key[0] == namespace or cache_key[0].startswith(prefix)
+        ]
+        for cache_key in stale:
+            del self._entries[cache_key]
+        # Los listados serializados se reconstruyen en segundo plano
+        catalog_snapshots.notify()
+        return len(stale)
+
+    def invalidate(self, *namespaces: str):
+        """Drops the given namespaces (and their children) here and on every other worker."""
+        for namespace in namespaces:
+            dropped = self._drop(namespace)
+            logger.debug(f"🧹 Caché de catálogo invalidada: {namespace} ({dropped} entradas)")
+            event_relay.publish(RELAY_CHANNEL, {"namespace": namespace})
+
+    def clear(self):
+        for namespace in {_root(cache_key[0]) for cache_key in self._entries}:
+            self._drop(namespace)
+
+    def stats(self) -> dict:
+        roots = sorted(set(self.hits) | set(self.misses))
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "namespaces": {
+                root: {
+                    "hits": self.hits.get(root, 0),
+                    "misses": self.misses.get(root, 0),
+                    "entries": sum(1 for cache_key in self._entries if _root(cache_key[0]) == root),
+                }
+                for root in roots
+            },
+        }
+
+
+catalog_cache = CatalogCache(
+    max_entries=_SETTINGS.catalog_cache_max_entries,
+    ttl_seconds=_SETTINGS.catalog_cache_ttl_seconds,
+)
+
+
+def _apply_remote(payload: dict):
+    # Invalidación publicada por otro worker: sólo local, sin reenviar
+    catalog_cache._drop(payload["namespace"])
+
+
+event_relay.subscribe(RELAY_CHANNEL, _apply_remote)
+register_metrics("catalog_cache", catalog_cache.stats)
@@ -0,0 +1,122 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.utils.metrics import register_metrics
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+# Lecturas por defecto de los listados calientes, servidas como bytes ya serializados
+MOVIES_PAGE = "movies_page"
+GENRES_LIST = "genres_list"
+SHOWTIMES_LISTING = "showtimes_listing"
+
+EtagFn = Callable[[AsyncSession], Awaitable[str]]
+BuildFn = Callable[[AsyncSession], Awaitable[tuple[bytes, dict]]]
+
+
+class Snapshot:
+    __slots__ = ("etag", "body", "headers")
+
+    def __init__(self, etag: str, body: bytes, headers: dict):
+        self.etag = etag
+        self.body = body
+        self.headers = headers
+
+    def response(self, response: Optional[Response] = None) -> Response:
+        # Conserva los headers de la ruta (ETag, Cache-Control) y agrega los propios (X-Next-Cursor)
+        headers = {**(dict(response.headers) if response is not None else {}), **self.headers}
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class CatalogSnapshots:
+    """
+    JSON bodies of the default catalog listings, serialized once and served
+    as raw bytes. Each snapshot is tagged with the ETag it was built for: a
+    request whose current ETag matches gets the stored bytes with no query
+    beyond the ETag and no response-model work; a mismatch rebuilds it once
+    (concurrent requests wait for the same build).
+
+    The refresher task rebuilds stale snapshots in the background after a
+    `notify()` (catalog invalidations, seat changes) or every
+    `catalog_snapshot_refresh_seconds`, so requests rarely pay for a rebuild.
+    """
+
+    def __init__(self):
+        self._sources: dict[str, tuple[EtagFn, BuildFn]] = {}
+        self._snapshots: dict[str, Snapshot] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._dirty: Optional[asyncio.Event] = None
+        self.hits: dict[str, int] = {}
+        self.rebuilds: dict[str, int] = {}
+
+    def register(self, name: str, etag_fn: EtagFn, build_fn: BuildFn):
+        self._sources[name] = (etag_fn, build_fn)
+        self._locks[name] = asyncio.Lock()
+
+    async def get(self, name: str, etag: str, session: AsyncSession) -> Snapshot:
+        snapshot = self._snapshots.get(name)
+        if snapshot is None or snapshot.etag != etag:
+            async with self._locks[name]:
+                snapshot = self._snapshots.get(name)
+                if snapshot is None or snapshot.etag != etag:
+                    snapshot = await self._build(name, etag, session)
+                    return snapshot
+        self.hits[name] = self.hits.get(name, 0) + 1
+        return snapshot
+
+    async def _build(self, name: str, etag: str, session: AsyncSession) -> Snapshot:
+        _, build_fn = self._sources[name]
+        body, headers = await build_fn(session)
+        snapshot = Snapshot(etag, body, headers)
+        self._snapshots[name] = snapshot
+        self.rebuilds[name] = self.rebuilds.get(name, 0) + 1
+        logger.debug(f"📦 Snapshot {name} reconstruido ({len(body)} bytes)")
+        return snapshot
+
+    async def refresh(self, session: AsyncSession):
+        """Rebuilds every snapshot whose ETag moved since it was built."""
+        for name, (etag_fn, _) in self._sources.items():
+            etag = await etag_fn(session)
+            snapshot = self._snapshots.get(name)
+            if snapshot is not None and snapshot.etag == etag:
+                continue
+            async with self._locks[name]:
+                snapshot = self._snapshots.get(name)
+                if snapshot is None or snapshot.etag != etag:
+                    await self._build(name, etag, session)
+
+    def notify(self):
+        """Wakes the refresher; safe to call from any code running on the event loop."""
+        if self._dirty is not None:
+            self._dirty.set()
+
+    async def wait_dirty(self, timeout: float) -> bool:
+        if self._dirty is None:
+            self._dirty = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._dirty.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._dirty.clear()
+
+    def stats(self) -> dict:
+        return {
+            name: {
+                "bytes": len(self._snapshots[name].body) if name in self._snapshots else 0,
+                "hits": self.hits.get(name, 0),
+                "rebuilds": self.rebuilds.get(name, 0),
+            }
+            for name in sorted(self._sources)
+        }
+
+
+catalog_snapshots = CatalogSnapshots()
+register_metrics("catalog_snapshots", catalog_snapshots.stats)
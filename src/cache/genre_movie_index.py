@@ -0,0 +1,183 @@
+import asyncio
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.db_config import async_session
+from src.models.movie_genre_model import MovieGenre
+from src.realtime.relay import event_relay
+from src.utils.metrics import register_metrics
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+RELAY_CHANNEL = "genre_movies"
+
+MODE_ALL, MODE_ANY = "all", "any"
+
+
+class GenreMovieIndex:
+    """
+    Genre -> movies index for multi-genre filtering. Each genre keeps a
+    Python int bitset indexed by movie ID, so "all" and "any" filters are a
+    single `&` / `|` over the genres involved, and a page is the next set
+    bits above the cursor.
+
+    Built from one SELECT over `movie_genre` on first use and kept in sync by
+    `MovieService` / `GenreService` writes, forwarded over the event relay
+    like the search indexes. `tasks.catalog_index_refresher` rebuilds it when
+    the catalog version moves, in case a relay message never arrived.
+    """
+
+    def __init__(self):
+        self._bitmaps: dict[int, int] = {}
+        # Géneros de cada película, para quitarla de sus bitsets al actualizarla
+        self._genres_of: dict[int, tuple[int, ...]] = {}
+        self._changes = 0
+        self._ready = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    async def ensure_built(self, session: AsyncSession):
+        if self._ready:
+            return
+        async with self._lock:
+            while not self._ready:
+                changes = self._changes
+                result = await session.execute(select(MovieGenre.movie_id, MovieGenre.genre_id))
+                self._load(result.all())
+                # Si hubo escrituras durante la carga, se vuelve a leer
+                self._ready = self._changes == changes
+            logger.info(f"🏷️ Índice de géneros cargado: {len(self._bitmaps)} géneros, {len(self._genres_of)} películas")
+
+    async def rebuild(self, session: AsyncSession):
+        """Reloads the whole index, replacing it in one step once the read is done."""
+        async with self._lock:
+            while True:
+                changes = self._changes
+                rows = (await session.execute(select(MovieGenre.movie_id, MovieGenre.genre_id))).all()
+                # Una escritura aplicada durante la lectura podría no estar en las filas
+                if self._changes == changes:
+                    self._load(rows)
+                    return
+
+    def _load(self, rows):
+        genres_of: dict[int, list[int]] = {}
+        for movie_id, genre_id in rows:
+            genres_of.setdefault(movie_id, []).append(genre_id)
+        # Cada bitset se arma en un bytearray y se convierte una sola vez: sumar bits de a uno copiaría el int en cada paso
+        size = max(genres_of, default=0) // 8 + 1
+        members: dict[int, bytearray] = {}
+        for movie_id, genre_ids in genres_of.items():
+            byte, bit = divmod(movie_id, 8)
+            for genre_id in genre_ids:
+                bits = members.get(genre_id)
+                if bits is None:
+                    bits = members[genre_id] = bytearray(size)
+                bits[byte] |= 1 << bit
+        self._bitmaps = {genre_id: int.from_bytes(bits, "little") for genre_id, bits in members.items()}
+        self._genres_of = {movie_id: tuple(genre_ids) for movie_id, genre_ids in genres_of.items()}
+
+    def _discard_movie(self, movie_id: int):
+        bit = 1 << movie_id
+        for genre_id in self._genres_of.pop(movie_id, ()):
+            bitmap = self._bitmaps.get(genre_id, 0) & ~bit
+            if bitmap:
+                self._bitmaps[genre_id] = bitmap
+            else:
+                self._bitmaps.pop(genre_id, None)
+
+    def _apply(self, change: dict):
+        self._changes += 1
+        if not self._ready:
+            return
+        if "genre" in change:
+            genre_id = change["genre"]
+            bitmap = self._bitmaps.pop(genre_id, 0)
+            while bitmap:
+                low = bitmap & -bitmap
+                movie_id = low.bit_length() - 1
+                genre_ids = tuple(g for g in self._genres_of.get(movie_id, ()) if g != genre_id)
+                if genre_ids:
+                    self._genres_of[movie_id] = genre_ids
+                else:
+                    self._genres_of.pop(movie_id, None)
+                bitmap ^= low
+            return
+        movie_id = change["movie"]
+        self._discard_movie(movie_id)
+        genre_ids = tuple(dict.fromkeys(change.get("genres") or ()))
+        if genre_ids:
+            bit = 1 << movie_id
+            for genre_id in genre_ids:
+                self._bitmaps[genre_id] = self._bitmaps.get(genre_id, 0) | bit
+            self._genres_of[movie_id] = genre_ids
+
+    def _publish(self, change: dict):
+        self._apply(change)
+        event_relay.publish(RELAY_CHANNEL, change)
+
+    def set_movie(self, movie_id: int, genre_ids: Iterable[int]):
+        self._publish({"movie": movie_id, "genres": list(genre_ids)})
+
+    def remove_movie(self, movie_id: int):
+        self._publish({"movie": movie_id, "genres": []})
+
+    def remove_genre(self, genre_id: int):
+        self._publish({"genre": genre_id})
+
+    def _matching(self, genre_ids: list[int], mode: str) -> int:
+        bitmaps = [self._bitmaps.get(genre_id, 0) for genre_id in genre_ids]
+        if not bitmaps:
+            return 0
+        matching = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            matching = matching & bitmap if mode == MODE_ALL else matching | bitmap
+        return matching
+
+    def movie_ids(self, genre_ids: list[int], mode: str, limit: int, after: int = 0) -> list[int]:
+        """Movie IDs above `after` in the genres (every one for "all", any for "any"), ascending."""
+        # Descarta los bits hasta el cursor y recorre los siguientes de menor a mayor
+        shift = after + 1
+        bitmap = self._matching(genre_ids, mode) >> shift
+        movie_ids = []
+        while bitmap and len(movie_ids) < limit:
+            low = bitmap & -bitmap
+            movie_ids.append(shift + low.bit_length() - 1)
+            bitmap ^= low
+        return movie_ids
+
+    def stats(self) -> dict:
+        return {
+            "ready": self._ready,
+            "genres": len(self._bitmaps),
+            "movies": len(self._genres_of),
+            "bitmap_bytes": sum((bitmap.bit_length() + 7) // 8 for bitmap in self._bitmaps.values()),
+        }
+
+
+genre_movie_index = GenreMovieIndex()
+
+
+async def load_genre_movie_index():
+    """Startup load in the background; filters that arrive first wait for it."""
+    try:
+        async with async_session() as session:
+            await genre_movie_index.ensure_built(session)
+    except Exception as e:
+        logger.error(f"❌ Falló la carga del índice de géneros: {e}")
+
+
+def _apply_remote(payload: dict):
+    # Cambio publicado por otro worker: sólo local, sin reenviar
+    genre_movie_index._apply(payload)
+
+
+event_relay.subscribe(RELAY_CHANNEL, _apply_remote)
+register_metrics("genre_movie_index", genre_movie_index.stats)
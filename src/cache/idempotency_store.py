@@ -0,0 +1,92 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.utils.metrics import register_metrics
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+
+
+class StoredResponse:
+    __slots__ = ("fingerprint", "status_code", "headers", "body", "expires_at")
+
+    def __init__(self, fingerprint: str, status_code: int, headers: list[tuple[str, str]], body: bytes, expires_at: float):
+        self.fingerprint = fingerprint
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.expires_at = expires_at
+
+
+class IdempotencyStore:
+    """
+    Bounded LRU of the first response per (user, method, path, key), with TTL
+    eviction. A key whose original request is still running is tracked as a
+    pending future, so concurrent retries wait for it instead of running the
+    write a second time. Per process: other workers do not see these keys.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, StoredResponse]" = OrderedDict()
+        self._pending: dict[tuple, tuple[str, asyncio.Future]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[StoredResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def pending(self, key: tuple) -> Optional[tuple[str, asyncio.Future]]:
+        return self._pending.get(key)
+
+    def begin(self, key: tuple, fingerprint: str):
+        self._pending[key] = (fingerprint, asyncio.get_running_loop().create_future())
+
+    def finish(self, key: tuple, response: Optional[StoredResponse]):
+        """Stores the response (None when it must not be replayed) and wakes waiting retries."""
+        _, future = self._pending.pop(key, (None, None))
+        if response is not None:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            self._evict()
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    def _evict(self):
+        now = time.monotonic()
+        # Desde el extremo menos usado: quita por tamaño y las vencidas que encuentre
+        while self._entries:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            if len(self._entries) > self.max_entries or oldest.expires_at <= now:
+                del self._entries[oldest_key]
+            else:
+                break
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "pending": len(self._pending),
+            "max_entries": self.max_entries,
+            "replays": self.hits,
+            "misses": self.misses,
+        }
+
+
+idempotency_store = IdempotencyStore(
+    max_entries=_SETTINGS.idempotency_max_entries,
+    ttl_seconds=_SETTINGS.idempotency_ttl_seconds,
+)
+register_metrics("idempotency_store", idempotency_store.stats)
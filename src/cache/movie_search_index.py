@@ -0,0 +1,249 @@
+import asyncio
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.db_config import async_session
+from src.models.movie_model import Movie
+from src.realtime.relay import event_relay
+from src.utils.metrics import register_metrics
+from src.utils.text import fold
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+RELAY_CHANNEL = "movie_search"
+
+# Mismo criterio que el FULLTEXT de InnoDB: tokens de 3+ caracteres y su lista de stopwords por
+# defecto (las de 3+), para que la búsqueda en memoria y la de MySQL devuelvan lo mismo
+MIN_TOKEN_LENGTH = 3
+STOPWORDS = frozenset({
+    "about", "are", "com", "for", "from", "how", "that", "the", "this", "was",
+    "what", "when", "where", "who", "will", "with", "und", "www",
+})
+FIELD_WEIGHTS = {"title": 3.0, "director": 2.0, "description": 1.0}
+
+# Parámetros de BM25
+K1 = 1.2
+B = 0.75
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """Lowercase, accent-folded word tokens, without stopwords or short tokens."""
+    if not text:
+        return []
+    return [token for token in _TOKEN_RE.findall(fold(text)) if len(token) >= MIN_TOKEN_LENGTH and token not in STOPWORDS]
+
+
+class MovieSearchIndex:
+    """
+    In-process inverted index over title, director and description, ranked
+    with BM25. Used on backends without FULLTEXT; on MySQL the database does
+    the matching.
+
+    Each posting stores the BM25 impact of the term in that movie (term
+    frequency and length normalization, everything but the IDF), computed
+    against the average length of the last full load. A query walks the
+    shortest posting list in impact order and stops as soon as no remaining
+    movie can beat the current page, so popular terms do not cost a full
+    scan.
+
+    Built from one SELECT on first use. `MovieService` writes call `upsert` /
+    `remove` after commit, and the change is forwarded over the event relay
+    so every worker keeps the same index. Writes that land while the index is
+    loading trigger another load instead of being lost, and
+    `tasks.catalog_index_refresher` rebuilds it when the catalog version
+    moves, in case a relay message never arrived.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[int, float]] = {}
+        # Posting lists ordenadas por impacto; una escritura descarta las de sus términos
+        self._ordered: dict[str, list[tuple[float, int]]] = {}
+        self._documents: dict[int, tuple[str, ...]] = {}
+        self._average_length = 1.0
+        self._changes = 0
+        self._ready = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    async def ensure_built(self, session: AsyncSession):
+        if self._ready:
+            return
+        async with self._lock:
+            while not self._ready:
+                changes = self._changes
+                result = await session.execute(select(Movie.id, Movie.title, Movie.director, Movie.description))
+                self._load([(row.id, self._frequencies(row.title, row.director, row.description)) for row in result])
+                # Si hubo escrituras durante la carga, se vuelve a leer
+                self._ready = self._changes == changes
+            logger.info(f"🔎 Índice de búsqueda cargado: {len(self._documents)} películas, {len(self._postings)} términos")
+
+    async def rebuild(self, session: AsyncSession):
+        """Reloads the whole index, replacing it in one step once the read is done."""
+        async with self._lock:
+            while True:
+                changes = self._changes
+                rows = (await session.execute(select(Movie.id, Movie.title, Movie.director, Movie.description))).all()
+                # Una escritura aplicada durante la lectura podría no estar en las filas
+                if self._changes == changes:
+                    self._load([(row.id, self._frequencies(row.title, row.director, row.description)) for row in rows])
+                    return
+
+    @staticmethod
+    def _frequencies(title: Optional[str], director: Optional[str], description: Optional[str]) -> dict[str, float]:
+        frequencies: dict[str, float] = {}
+        for field, text in (("title", title), ("director", director), ("description", description)):
+            weight = FIELD_WEIGHTS[field]
+            for token, count in Counter(tokenize(text)).items():
+                frequencies[token] = frequencies.get(token, 0.0) + weight * count
+        return frequencies
+
+    def _load(self, documents: list[tuple[int, dict[str, float]]]):
+        self._postings.clear()
+        self._ordered.clear()
+        self._documents.clear()
+        total_length = sum(sum(frequencies.values()) for _, frequencies in documents)
+        self._average_length = total_length / len(documents) if documents and total_length else 1.0
+        for movie_id, frequencies in documents:
+            self._add(movie_id, frequencies)
+        # Ordenadas al cargar: la primera consulta de un término común no paga el sort
+        for token in self._postings:
+            self._by_impact(token)
+
+    def _add(self, movie_id: int, frequencies: dict[str, float]):
+        norm = K1 * (1 - B + B * sum(frequencies.values()) / self._average_length)
+        postings, ordered = self._postings, self._ordered
+        for token, frequency in frequencies.items():
+            posting = postings.get(token)
+            if posting is None:
+                posting = postings[token] = {}
+            posting[movie_id] = frequency * (K1 + 1) / (frequency + norm)
+            if ordered:
+                ordered.pop(token, None)
+        self._documents[movie_id] = tuple(frequencies)
+
+    def _discard(self, movie_id: int):
+        for token in self._documents.pop(movie_id, ()):
+            self._ordered.pop(token, None)
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(movie_id, None)
+                if not posting:
+                    del self._postings[token]
+
+    def _apply(self, change: dict):
+        self._changes += 1
+        if not self._ready:
+            return
+        self._discard(change["id"])
+        if not change.get("removed"):
+            self._add(change["id"], self._frequencies(change.get("title"), change.get("director"), change.get("description")))
+
+    def upsert(self, movie_id: int, title: Optional[str], director: Optional[str], description: Optional[str]):
+        change = {"id": movie_id, "title": title, "director": director, "description": description}
+        self._apply(change)
+        event_relay.publish(RELAY_CHANNEL, change)
+
+    def remove(self, movie_id: int):
+        change = {"id": movie_id, "removed": True}
+        self._apply(change)
+        event_relay.publish(RELAY_CHANNEL, change)
+
+    def _by_impact(self, token: str) -> list[tuple[float, int]]:
+        ordered = self._ordered.get(token)
+        if ordered is None:
+            ordered = sorted((-impact, movie_id) for movie_id, impact in self._postings[token].items())
+            self._ordered[token] = ordered
+        return ordered
+
+    def search(self, terms: list[str], limit: int, after: Optional[tuple[float, int]] = None) -> list[tuple[int, float]]:
+        """
+        Movies containing every term, as (movie_id, score) sorted by score
+        desc then id. `after` is the (score, id) of the previous page's last row.
+        """
+        terms = list(dict.fromkeys(terms))
+        if not terms or any(term not in self._postings for term in terms):
+            return []
+        terms.sort(key=lambda term: len(self._postings[term]))
+
+        total = len(self._documents)
+        weights = [
+            math.log(1 + (total - len(self._postings[term]) + 0.5) / (len(self._postings[term]) + 0.5))
+            for term in terms
+        ]
+        # Cota de lo que aún pueden sumar los términos siguientes a cada paso
+        bounds = [weight * -self._by_impact(term)[0][0] for weight, term in zip(weights, terms)]
+        others = [
+            (weight, self._postings[term], sum(bounds[i + 1:]))
+            for i, (weight, term) in enumerate(zip(weights, terms)) if i > 0
+        ]
+        lead_weight, lead_rest = weights[0], sum(bounds[1:])
+        after_key = (-after[0], after[1]) if after is not None else None
+
+        # Peores resultados de la página arriba del heap: (score, -movie_id)
+        page: list[tuple[float, int]] = []
+        threshold = -math.inf
+        for negative_impact, movie_id in self._by_impact(terms[0]):
+            score = lead_weight * -negative_impact
+            if score + lead_rest < threshold:
+                break
+            for weight, posting, rest in others:
+                impact = posting.get(movie_id)
+                if impact is None:
+                    break
+                score += weight * impact
+                if score + rest < threshold:
+                    break
+            else:
+                if after_key is not None and (-score, movie_id) <= after_key:
+                    continue
+                entry = (score, -movie_id)
+                if len(page) < limit:
+                    heapq.heappush(page, entry)
+                elif entry > page[0]:
+                    heapq.heapreplace(page, entry)
+                if len(page) == limit:
+                    threshold = page[0][0]
+
+        return [(-negative_id, score) for score, negative_id in sorted(page, reverse=True)]
+
+    def stats(self) -> dict:
+        return {
+            "ready": self._ready,
+            "movies": len(self._documents),
+            "terms": len(self._postings),
+        }
+
+
+movie_search_index = MovieSearchIndex()
+
+
+async def load_movie_search_index():
+    """Startup load in the background; searches that arrive first wait for it."""
+    try:
+        async with async_session() as session:
+            await movie_search_index.ensure_built(session)
+    except Exception as e:
+        logger.error(f"❌ Falló la carga del índice de búsqueda: {e}")
+
+
+def _apply_remote(payload: dict):
+    # Cambio publicado por otro worker: sólo local, sin reenviar
+    movie_search_index._apply(payload)
+
+
+event_relay.subscribe(RELAY_CHANNEL, _apply_remote)
+register_metrics("movie_search_index", movie_search_index.stats)
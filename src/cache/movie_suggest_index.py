@@ -0,0 +1,226 @@
+import asyncio
+import heapq
+import re
+from bisect import bisect_left
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.db_config import async_session
+from src.models.movie_model import Movie
+from src.realtime.relay import event_relay
+from src.utils.metrics import register_metrics
+from src.utils.text import fold
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+RELAY_CHANNEL = "movie_suggest"
+
+# Rangos más chicos que esto se ordenan en cada consulta; los más grandes guardan su top-k
+SCAN_LIMIT = 256
+MAX_SUGGESTIONS = 20
+
+TITLE, DIRECTOR = 0, 1
+_WORD_RE = re.compile(r"\w+")
+_ID_MASK = 0xFFFFFFFF
+
+
+def _words(text: Optional[str]) -> list[str]:
+    return _WORD_RE.findall(fold(text)) if text else []
+
+
+def _ref(field: int, position: int, title_length: int, movie_id: int) -> int:
+    # Un entero ordena igual que (campo, palabra, largo del título, id):
+    # título antes que director, coincidencia al inicio antes que en medio, títulos cortos primero
+    rank = (field << 8 | min(position, 0xFF)) << 16 | min(title_length, 0xFFFF)
+    return rank << 32 | movie_id
+
+
+class MovieSuggestIndex:
+    """
+    Sorted prefix index over movie titles and directors for type-ahead.
+
+    Every word of a title or director starts one key (the folded text from
+    that word on), so "odys" finds "2001: A Space Odyssey". Keys live in a
+    sorted list with a parallel list of packed integers that encode the rank
+    and the movie ID; a prefix is a `bisect` range. Small ranges are sorted on
+    the spot, and the top suggestions of large ranges (one or two letters)
+    are kept until the next write.
+
+    Loaded at startup and kept in sync by `MovieService` writes (forwarded
+    over the event relay), so suggestions never touch the database.
+    `tasks.catalog_index_refresher` rebuilds it when the catalog version
+    moves, in case a relay message never arrived.
+    """
+
+    def __init__(self):
+        self._keys: list[str] = []
+        self._refs: list[int] = []
+        self._movies: dict[int, tuple[str, Optional[str], Optional[int]]] = {}
+        self._top: dict[str, list[int]] = {}
+        self._changes = 0
+        self._ready = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def ensure_built(self, session: AsyncSession):
+        if self.ready:
+            return
+        async with self._lock:
+            while not self.ready:
+                changes = self._changes
+                result = await session.execute(select(Movie.id, Movie.title, Movie.director, Movie.year))
+                self._load(result.all())
+                # Si hubo escrituras durante la carga, se vuelve a leer
+                if self._changes == changes:
+                    self._ready.set()
+            logger.info(f"🔤 Índice de sugerencias cargado: {len(self._movies)} películas, {len(self._keys)} claves")
+
+    async def rebuild(self, session: AsyncSession):
+        """Reloads the whole index, replacing it in one step once the read is done."""
+        async with self._lock:
+            while True:
+                changes = self._changes
+                rows = (await session.execute(select(Movie.id, Movie.title, Movie.director, Movie.year))).all()
+                # Una escritura aplicada durante la lectura podría no estar en las filas
+                if self._changes == changes:
+                    self._load(rows)
+                    return
+
+    async def wait_ready(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    @staticmethod
+    def _entries(movie_id: int, title: str, director: Optional[str]) -> list[tuple[str, int]]:
+        entries = []
+        for field, words in ((TITLE, _words(title)), (DIRECTOR, _words(director))):
+            for position in range(len(words)):
+                entries.append((" ".join(words[position:]), _ref(field, position, len(title), movie_id)))
+        return entries
+
+    def _load(self, rows):
+        entries = []
+        self._movies.clear()
+        for movie_id, title, director, year in rows:
+            self._movies[movie_id] = (title, director, year)
+            entries.extend(self._entries(movie_id, title, director))
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._refs = [ref for _, ref in entries]
+        self._top.clear()
+
+    def _insert(self, movie_id: int, title: str, director: Optional[str], year: Optional[int]):
+        self._movies[movie_id] = (title, director, year)
+        for key, ref in self._entries(movie_id, title, director):
+            i = bisect_left(self._keys, key)
+            self._keys.insert(i, key)
+            self._refs.insert(i, ref)
+
+    def _discard(self, movie_id: int):
+        movie = self._movies.pop(movie_id, None)
+        if movie is None:
+            return
+        for key, ref in self._entries(movie_id, movie[0], movie[1]):
+            i = bisect_left(self._keys, key)
+            while i < len(self._keys) and self._keys[i] == key:
+                if self._refs[i] == ref:
+                    del self._keys[i]
+                    del self._refs[i]
+                    break
+                i += 1
+
+    def _apply(self, change: dict):
+        self._changes += 1
+        if not self.ready:
+            return
+        self._discard(change["id"])
+        if not change.get("removed"):
+            self._insert(change["id"], change["title"], change.get("director"), change.get("year"))
+        self._top.clear()
+
+    def upsert(self, movie_id: int, title: str, director: Optional[str], year: Optional[int]):
+        change = {"id": movie_id, "title": title, "director": director, "year": year}
+        self._apply(change)
+        event_relay.publish(RELAY_CHANNEL, change)
+
+    def remove(self, movie_id: int):
+        change = {"id": movie_id, "removed": True}
+        self._apply(change)
+        event_relay.publish(RELAY_CHANNEL, change)
+
+    @staticmethod
+    def _distinct(refs, limit: int) -> list[int]:
+        # Una película puede entrar por título y por director: se queda con su mejor clave
+        movie_ids: list[int] = []
+        for ref in refs:
+            movie_id = ref & _ID_MASK
+            if movie_id not in movie_ids:
+                movie_ids.append(movie_id)
+                if len(movie_ids) == limit:
+                    break
+        return movie_ids
+
+    def _ranked(self, prefix: str, lo: int, hi: int) -> list[int]:
+        if hi - lo <= SCAN_LIMIT:
+            return self._distinct(sorted(self._refs[lo:hi]), MAX_SUGGESTIONS)
+        top = self._top.get(prefix)
+        if top is None:
+            # Cada película aporta pocas claves por rango: con 4x de margen alcanza casi siempre
+            candidates = heapq.nsmallest(MAX_SUGGESTIONS * 4, self._refs[lo:hi])
+            top = self._distinct(candidates, MAX_SUGGESTIONS)
+            if len(top) < MAX_SUGGESTIONS:
+                top = self._distinct(sorted(self._refs[lo:hi]), MAX_SUGGESTIONS)
+            self._top[prefix] = top
+        return top
+
+    def suggest(self, prefix: str, limit: int) -> list[dict]:
+        normalized = " ".join(_words(prefix))
+        if not normalized:
+            return []
+        lo = bisect_left(self._keys, normalized)
+        hi = bisect_left(self._keys, normalized + "\U0010ffff", lo)
+        suggestions = []
+        for movie_id in self._ranked(normalized, lo, hi)[:limit]:
+            title, director, year = self._movies[movie_id]
+            suggestions.append({"id": movie_id, "title": title, "director": director, "year": year})
+        return suggestions
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "movies": len(self._movies),
+            "keys": len(self._keys),
+            "cached_prefixes": len(self._top),
+        }
+
+
+movie_suggest_index = MovieSuggestIndex()
+
+
+async def load_movie_suggest_index():
+    """Startup load in the background; suggestions wait for it."""
+    try:
+        async with async_session() as session:
+            await movie_suggest_index.ensure_built(session)
+    except Exception as e:
+        logger.error(f"❌ Falló la carga del índice de sugerencias: {e}")
+
+
+def _apply_remote(payload: dict):
+    # Cambio publicado por otro worker: sólo local, sin reenviar
+    movie_suggest_index._apply(payload)
+
+
+event_relay.subscribe(RELAY_CHANNEL, _apply_remote)
+register_metrics("movie_suggest_index", movie_suggest_index.stats)
@@ -0,0 +1,130 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.revoked_token_jti_model import RevokedTokenJTI
+from src.realtime.relay import event_relay
+from src.utils.metrics import register_metrics
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+RELAY_CHANNEL = "revoked_jti"
+
+# Solapamiento al releer por created_at: cubre transacciones que confirman fuera de orden
+REFRESH_OVERLAP = timedelta(seconds=30)
+# Margen antes de olvidar un jti vencido: desfase de relojes entre workers
+EXPIRY_SLACK_SECONDS = 300
+
+
+def _timestamp(value: datetime) -> float:
+    # `exp` se guarda en UTC sin zona horaria (igual que el resto de las fechas de auth)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class RevocationCache:
+    """
+    In-process set of revoked, unexpired token JTIs, so `get_current_user`
+    checks revocation without a database round trip.
+
+    Loaded at startup and re-read every `revocation_cache_refresh_seconds`
+    (only rows created since the last read). Revocations made by this worker
+    are added right after commit and forwarded over the event relay, so
+    other workers see them at once. Without a relay, a revocation made on
+    another worker reaches this one with the next refresh, so a revoked
+    token can be accepted for up to `revocation_cache_refresh_seconds`.
+    Lookups fall back to the table while the set is not loaded, while a
+    configured relay is disconnected, or when refreshes stop succeeding.
+    """
+
+    def __init__(self):
+        self._revoked: dict[str, float] = {}
+        self._watermark: Optional[datetime] = None
+        self._ready = False
+        self._refreshed_at = 0.0
+        self._lock = asyncio.Lock()
+        self.rejected = 0
+        self.fallbacks = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @property
+    def trusted(self) -> bool:
+        if not self._ready:
+            return False
+        if event_relay.enabled:
+            return event_relay.connected
+        # Sin relay, el retraso lo acota la relectura periódica, si sigue funcionando
+        interval = _SETTINGS.revocation_cache_refresh_seconds
+        return interval > 0 and time.monotonic() - self._refreshed_at <= 2 * interval
+
+    async def refresh(self, session: AsyncSession):
+        async with self._lock:
+            stmt = select(RevokedTokenJTI.jti, RevokedTokenJTI.exp, RevokedTokenJTI.created_at)
+            if self._watermark is not None:
+                stmt = stmt.where(RevokedTokenJTI.created_at >= self._watermark - REFRESH_OVERLAP)
+            rows = (await session.execute(stmt)).all()
+            for jti, exp, created_at in rows:
+                self._revoked[jti] = _timestamp(exp)
+                if created_at is not None and (self._watermark is None or created_at > self._watermark):
+                    self._watermark = created_at
+            self._prune()
+            self._refreshed_at = time.monotonic()
+            if not self._ready:
+                self._ready = True
+                logger.info(f"🔒 Caché de revocaciones cargada: {len(self._revoked)} jti")
+
+    def _prune(self):
+        cutoff = time.time() - EXPIRY_SLACK_SECONDS
+        for jti in [jti for jti, exp in self._revoked.items() if exp < cutoff]:
+            del self._revoked[jti]
+
+    def _apply(self, payload: dict):
+        self._revoked[payload["jti"]] = payload["exp"]
+
+    def revoke(self, jti: str, exp: datetime):
+        """Record a committed revocation locally and on every other worker."""
+        payload = {"jti": jti, "exp": _timestamp(exp)}
+        self._apply(payload)
+        event_relay.publish(RELAY_CHANNEL, payload)
+
+    async def is_revoked(self, jti: str, session: AsyncSession) -> bool:
+        if jti in self._revoked:
+            self.rejected += 1
+            return True
+        if self.trusted:
+            return False
+        self.fallbacks += 1
+        result = await session.execute(select(RevokedTokenJTI.id).where(RevokedTokenJTI.jti == jti))
+        return result.scalar_one_or_none() is not None
+
+    def stats(self) -> dict:
+        return {
+            "ready": self._ready,
+            "trusted": self.trusted,
+            "revoked": len(self._revoked),
+            "rejected": self.rejected,
+            "fallbacks": self.fallbacks,
+        }
+
+
+revocation_cache = RevocationCache()
+
+
+def _apply_remote(payload: dict):
+    # Revocación hecha en otro worker: sólo local, sin reenviar
+    revocation_cache._apply(payload)
+
+
+event_relay.subscribe(RELAY_CHANNEL, _apply_remote)
+register_metrics("revocation_cache", revocation_cache.stats)
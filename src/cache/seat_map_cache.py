@@ -0,0 +1,329 @@
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterable, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.showtime_model import Showtime
+from src.models.movie_model import Movie
+from src.models.seat_model import Seat
+from src.models.seat_hold_model import SeatHold
+from src.models.auditorium_layout_model import AuditoriumLayout
+from src.utils.seat_layout import parse_gaps, split_seat_number
+from src.utils.metrics import register_metrics
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+
+class SeatMap:
+    """
+    Compact seat map of one showtime. The layout (seat ids and numbers) is
+    immutable; reserved and held seats are two Python int bitsets indexed
+    by seat ordinal.
+
+    `version` tracks `showtime.seat_version`: it is read on load and advanced
+    by one with every committed change patched in, so it can be checked
+    against the database before answering a conditional GET.
+
+    For the best-available allocator it also keeps, per row, the contiguous
+    free runs (split at aisles) and the longest one. A row's runs are
+    recomputed lazily, only after a seat of that row changed.
+    """
+
+    __slots__ = (
+        "showtime_id", "show_datetime", "movie", "seat_ids", "seat_numbers",
+        "ordinals", "reserved", "held", "next_hold_expiry", "loaded_at", "_payload", "version",
+        "row_labels", "row_seats", "row_breaks", "row_of", "_row_runs",
+    )
+
+    def __init__(
+        self,
+        showtime_id: int,
+        show_datetime: datetime,
+        movie: dict,
+        seat_ids: list[int],
+        seat_numbers: list[str],
+        gaps: Iterable[int] = (),
+        version: int = 0,
+    ):
+        self.showtime_id = showtime_id
+        self.show_datetime = show_datetime
+        self.movie = movie
+        self.seat_ids = seat_ids
+        self.seat_numbers = seat_numbers
+        self.ordinals = {seat_id: i for i, seat_id in enumerate(seat_ids)}
+        self.reserved = 0
+        self.held = 0
+        self.next_hold_expiry: Optional[datetime] = None
+        self.loaded_at = time.monotonic()
+        self._payload: Optional[dict] = None
+        self.version = version
+        self._build_rows(set(gaps))
+
+    def _build_rows(self, gaps: set[int]):
+        by_row: dict[str, list[tuple[int, int]]] = {}
+        for ordinal, seat_number in enumerate(self.seat_numbers):
+            try:
+                row, number = split_seat_number(seat_number)
+            except ValueError:
+                continue
+            by_row.setdefault(row, []).append((number, ordinal))
+
+        # Filas en orden de sala: A..Z, AA.. (más corta primero)
+        self.row_labels = sorted(by_row, key=lambda label: (len(label), label))
+        self.row_seats: list[list[int]] = []
+        self.row_breaks: list[frozenset[int]] = []
+        self.row_of: dict[int, int] = {}
+        for r, label in enumerate(self.row_labels):
+            seats = sorted(by_row[label])
+            self.row_seats.append([ordinal for _, ordinal in seats])
+            # Posición tras la cual hay pasillo o un número salteado
+            self.row_breaks.append(frozenset(
+                i for i in range(len(seats) - 1)
+                if seats[i][0] in gaps or seats[i + 1][0] != seats[i][0] + 1
+            ))
+            for _, ordinal in seats:
+                self.row_of[ordinal] = r
+        self._row_runs: list[Optional[tuple[int, list[tuple[int, int]]]]] = [None] * len(self.row_labels)
+
+    def _mask(self, seat_ids: Iterable[int]) -> int:
+        mask = 0
+        for seat_id in seat_ids:
+            ordinal = self.ordinals.get(seat_id)
+            if ordinal is not None:
+                mask |= 1 << ordinal
+                row = self.row_of.get(ordinal)
+                if row is not None:
+                    self._row_runs[row] = None
+        return mask
+
+    def free_runs(self, row: int) -> tuple[int, list[tuple[int, int]]]:
+        """(longest run, [(start position, length), ...]) of free seats in a row."""
+        cached = self._row_runs[row]
+        if cached is not None:
+            return cached
+
+        taken = self.reserved | self.held
+        breaks = self.row_breaks[row]
+        runs: list[tuple[int, int]] = []
+        start = None
+        for position, ordinal in enumerate(self.row_seats[row]):
+            if taken >> ordinal & 1:
+                if start is not None:
+                    runs.append((start, position - start))
+                    start = None
+            elif start is None:
+                start = position
+            if start is not None and position in breaks:
+                runs.append((start, position - start + 1))
+                start = None
+        if start is not None:
+            runs.append((start, len(self.row_seats[row]) - start))
+
+        cached = (max((length for _, length in runs), default=0), runs)
+        self._row_runs[row] = cached
+        return cached
+
+    def set_reserved(self, seat_ids: Iterable[int], reserved: bool):
+        mask = self._mask(seat_ids)
+        self.reserved = self.reserved | mask if reserved else self.reserved & ~mask
+        self._payload = None
+
+    def set_held(self, seat_ids: Iterable[int], held: bool, expires_at: Optional[datetime] = None):
+        mask = self._mask(seat_ids)
+        self.held = self.held | mask if held else self.held & ~mask
+        if held and expires_at and (self.next_hold_expiry is None or expires_at < self.next_hold_expiry):
+            self.next_hold_expiry = expires_at
+        self._payload = None
+
+    def is_stale(self, ttl_seconds: float) -> bool:
+        if time.monotonic() - self.loaded_at > ttl_seconds:
+            return True
+        # Una retención vencida pudo haber sido barrida por otro worker
+        return self.next_hold_expiry is not None and self.next_hold_expiry <= datetime.now()
+
+    def to_response(self) -> dict:
+        if self._payload is None:
+            reserved, held = self.reserved, self.held
+            self._payload = {
+                "id": self.showtime_id,
+                "show_datetime": self.show_datetime,
+                "movie": self.movie,
+                "seats": [
+                    {
+                        "id": seat_id,
+                        "seat_number": self.seat_numbers[i],
+                        "is_reserved": bool(reserved >> i & 1),
+                        "is_held": bool(held >> i & 1),
+                    }
+                    for i, seat_id in enumerate(self.seat_ids)
+                ],
+            }
+        return self._payload
+
+
+class SeatMapCache:
+    """
+    Per-process LRU of `SeatMap` entries. Entries are patched in place when
+    reservations or holds change on this worker and rebuilt lazily on a miss,
+    after `seat_map_cache_ttl_seconds` (to pick up writes from other workers)
+    or once the earliest known hold has expired.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, SeatMap]" = OrderedDict()
+        # Sólo mientras hay cargas en curso: [escrituras vistas, cargas]. Evita guardar
+        # una carga que se cruzó con una reserva, sin acumular una clave por función
+        self._loading: dict[int, list[int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, showtime_id: int, session: AsyncSession, version: Optional[int] = None) -> Optional[SeatMap]:
+        """`version`, when given, is the current `seat_version`; an entry behind it is reloaded."""
+        entry = self._entries.get(showtime_id)
+        if entry is not None and not entry.is_stale(self.ttl_seconds) and (version is None or entry.version == version):
+            self._entries.move_to_end(showtime_id)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        loading = self._loading.setdefault(showtime_id, [0, 0])
+        loading[1] += 1
+        generation = loading[0]
+        try:
+            entry = await self._load(showtime_id, session)
+        finally:
+            loading[1] -= 1
+            if not loading[1]:
+                del self._loading[showtime_id]
+        if entry is None:
+            self._entries.pop(showtime_id, None)
+            return None
+
+        if loading[0] == generation:
+            self._entries[showtime_id] = entry
+            self._entries.move_to_end(showtime_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    @staticmethod
+    async def _load(showtime_id: int, session: AsyncSession) -> Optional[SeatMap]:
+        result = await session.execute(
+            select(
+                Showtime.show_datetime,
+                Showtime.seat_version,
+                Movie.id,
+                Movie.title,
+                Movie.description,
+                Movie.poster_url,
+                Movie.duration_minutes,
+                Movie.director,
+                AuditoriumLayout.gaps,
+            )
+            .join(Movie, Movie.id == Showtime.movie_id)
+            .outerjoin(AuditoriumLayout, AuditoriumLayout.id == Showtime.layout_id)
+            .where(Showtime.id == showtime_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        movie = {
+            "id": row.id,
+            "title": row.title,
+            "description": row.description or None,
+            "poster_url": row.poster_url or None,
+            "duration_minutes": row.duration_minutes,
+            "director": row.director or None,
+        }
+
+        seats = (await session.execute(
+            select(Seat.id, Seat.seat_number, Seat.is_reserved)
+            .where(Seat.showtime_id == showtime_id)
+            .order_by(Seat.id)
+        )).all()
+
+        entry = SeatMap(
+            showtime_id,
+            row.show_datetime,
+            movie,
+            [s.id for s in seats],
+            [s.seat_number for s in seats],
+            parse_gaps(row.gaps),
+            row.seat_version,
+        )
+        entry.set_reserved([s.id for s in seats if s.is_reserved], True)
+
+        holds = (await session.execute(
+            select(SeatHold.seat_id, SeatHold.expires_at)
+            .where(SeatHold.showtime_id == showtime_id, SeatHold.expires_at > datetime.now())
+        )).all()
+        for hold in holds:
+            entry.set_held([hold.seat_id], True, hold.expires_at)
+
+        logger.debug(f"🗺️ Mapa de asientos cargado para función {showtime_id}: {len(seats)} asientos")
+        return entry
+
+    def _touch(self, showtime_id: int) -> Optional[SeatMap]:
+        loading = self._loading.get(showtime_id)
+        if loading is not None:
+            loading[0] += 1
+        return self._entries.get(showtime_id)
+
+    def mark_reserved(self, showtime_id: int, seat_ids: Iterable[int]):
+        entry = self._touch(showtime_id)
+        if entry is not None:
+            entry.set_held(seat_ids, False)
+            entry.set_reserved(seat_ids, True)
+
+    def mark_released(self, showtime_id: int, seat_ids: Iterable[int]):
+        entry = self._touch(showtime_id)
+        if entry is not None:
+            entry.set_reserved(seat_ids, False)
+
+    def mark_held(self, showtime_id: int, seat_ids: Iterable[int], expires_at: datetime):
+        entry = self._touch(showtime_id)
+        if entry is not None:
+            entry.set_held(seat_ids, True, expires_at)
+
+    def mark_unheld(self, showtime_id: int, seat_ids: Iterable[int]):
+        entry = self._touch(showtime_id)
+        if entry is not None:
+            entry.set_held(seat_ids, False)
+
+    def advance(self, showtime_id: int):
+        """Counts one committed change already patched into the entry (one `seat_version` bump)."""
+        entry = self._entries.get(showtime_id)
+        if entry is not None:
+            entry.version += 1
+
+    def invalidate(self, showtime_id: int):
+        self._touch(showtime_id)
+        self._entries.pop(showtime_id, None)
+
+    def clear(self):
+        for showtime_id in list(self._entries):
+            self.invalidate(showtime_id)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "loading": len(self._loading),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+seat_map_cache = SeatMapCache(
+    max_entries=_SETTINGS.seat_map_cache_max_entries,
+    ttl_seconds=_SETTINGS.seat_map_cache_ttl_seconds,
+)
+register_metrics("seat_map_cache", seat_map_cache.stats)
@@ -16,12 +16,16 @@ class Settings(BaseSettings):
     db_password: str = "root"
     db_port: int = 3306
     db_name: str = "db_name"
+    db_url: str = ""                                # URL completa (p. ej. sqlite+aiosqlite:///./perf.db); tiene prioridad sobre db_*
 
     # JWT config
     jwt_secret: str = "your-super-secret-key-that-nobody-knows"
     jwt_algorithm: str = "HS256"
     jwt_expiration_minutes: int = 15            # Access token lifespan
     jwt_refresh_expiration_minutes: int = 43200 # Refresh token lifespan (30 días)
+    password_hash_workers: int = 2              # Hilos para Argon2 (argon2-cffi libera el GIL)
+    password_hash_max_queue: int = 32           # Hashes en espera antes de responder 503
+    revocation_cache_refresh_seconds: int = 10  # Relectura de jti revocados; sin relay, es el máximo que tarda un logout en valer en otros workers. 0 = sólo al arrancar (consulta la base en cada request)
 
     # Cookie config
     jwt_cookie_name: str = "access_token"
@@ -35,6 +39,43 @@ class Settings(BaseSettings):
     csrf_safe_methods: set[str] = {"HEAD", "OPTIONS"}
     csrf_cookie_expire_minutes: int = 15
 
+    # Seat holds
+    seat_hold_ttl_seconds: int = 600                # Tiempo para pagar antes de liberar los asientos
+    seat_hold_sweep_interval_seconds: int = 30      # Máxima espera entre barridos
+    seat_hold_sweep_batch_size: int = 500
+
+    # Limpieza de jti revocados vencidos e intentos de login viejos
+    auth_sweep_interval_seconds: int = 3600         # 0 = sólo por CLI
+    auth_sweep_batch_size: int = 500                # Filas por transacción: lotes cortos para no bloquear login/logout
+    login_attempt_retention_hours: int = 24         # Intentos fallidos más viejos se olvidan
+
+    # Cartelera y archivo de funciones pasadas
+    showtime_window_days: int = 14                  # Ventana por defecto de los listados (desde ahora)
+    showtime_max_window_days: int = 92
+    showtime_archive_after_hours: int = 24          # Antigüedad mínima antes de mover una función al archivo
+    showtime_archive_batch_size: int = 200          # Funciones por transacción
+    showtime_archive_interval_seconds: int = 3600   # 0 = sólo por CLI
+
+    # Caché de lecturas de catálogo (películas, géneros, cartelera)
+    catalog_cache_max_entries: int = 1000           # 0 = desactivada
+    catalog_cache_ttl_seconds: int = 30             # Acota el desfase de los contadores de disponibilidad
+    catalog_snapshot_refresh_seconds: int = 5       # Revisión periódica de los listados serializados; 0 = sólo a pedido
+    catalog_index_refresh_seconds: int = 30         # Reconstruye búsqueda, sugerencias y géneros si cambió la versión del catálogo; 0 = nunca
+
+    # Seat map cache (bitsets en memoria por función)
+    seat_map_cache_max_entries: int = 2000
+    seat_map_cache_ttl_seconds: int = 5             # Acota lo desactualizado frente a otros workers
+
+    # Live seat events (SSE) y relay entre workers
+    event_relay_url: str = ""                       # tcp://host:port; vacío = eventos sólo en proceso
+    sse_queue_size: int = 64                        # Eventos pendientes antes de cortar a un cliente lento
+    sse_keepalive_seconds: int = 15
+
+    # Idempotency-Key
+    idempotency_ttl_seconds: int = 86400            # Ventana de reintentos de los clientes
+    idempotency_max_entries: int = 10000
+    idempotency_wait_seconds: int = 10              # Espera de un reintento mientras el original sigue en curso
+
     @property
     def debug(self) -> bool:
         return self.log_level.upper() == "DEBUG"
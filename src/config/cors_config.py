@@ -10,5 +10,6 @@ def add_cors(app):
         allow_origins=allowed_origins,  # Permitir estos orígenes
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],  # Métodos permitidos
-        allow_headers=["Authorization", "Content-Type"],  # Headers permitidos
+        allow_headers=["Authorization", "Content-Type", "Idempotency-Key"],  # Headers permitidos
+        expose_headers=["X-Next-Cursor"],  # Cursor de la siguiente página
     )
@@ -2,7 +2,9 @@ import logging
 import asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import text
+from sqlalchemy import text, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
 from src.config.config import get_settings
 from src.utils.logger import setup_logger
 
@@ -15,29 +17,57 @@ except Exception:
     _SETTINGS = None
     logger.warning("⚠️ No se pudieron cargar las variables de entorno (get_settings())")
 
+def _engine_kwargs(url: str) -> dict:
+    """Opciones de pool según el dialecto: SQLite no admite pool_size/max_overflow."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        kwargs = {"connect_args": {"timeout": 30}}
+        if parsed.database in (None, "", ":memory:"):
+            # Una sola conexión compartida, si no cada conexión ve una base vacía
+            kwargs["poolclass"] = StaticPool
+        return kwargs
+    return {
+        "pool_size": 50,
+        "max_overflow": 50,
+        "pool_timeout": 60,
+        "pool_recycle": 3600,
+    }
+
+def _configure_sqlite(engine):
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")       # ON DELETE CASCADE / SET NULL
+        cursor.execute("PRAGMA journal_mode=WAL")      # lectores concurrentes con un escritor
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
 # Construir URL solo si settings existen
 if _SETTINGS:
-    SQLALCHEMY_DATABASE_URL = (
-        f"mysql+aiomysql://{_SETTINGS.db_user}:{_SETTINGS.db_password}"
-        f"@{_SETTINGS.db_host}:{_SETTINGS.db_port}/{_SETTINGS.db_name}"
-        f"?charset=utf8mb4"
-    )
-
-    # Validación de variables
-    if not all([_SETTINGS.db_user, _SETTINGS.db_password, _SETTINGS.db_host, _SETTINGS.db_port, _SETTINGS.db_name]):
-        logger.error("❌ No se han definido las variables de entorno de la base de datos")
+    if _SETTINGS.db_url:
+        SQLALCHEMY_DATABASE_URL = _SETTINGS.db_url
+        logger.info(f"Base de datos configurada por DB_URL ({make_url(SQLALCHEMY_DATABASE_URL).get_backend_name()})")
     else:
-        logger.info("Variables de entorno de la base de datos configuradas")
-    
+        SQLALCHEMY_DATABASE_URL = (
+            f"mysql+aiomysql://{_SETTINGS.db_user}:{_SETTINGS.db_password}"
+            f"@{_SETTINGS.db_host}:{_SETTINGS.db_port}/{_SETTINGS.db_name}"
+            f"?charset=utf8mb4"
+        )
+
+        # Validación de variables
+        if not all([_SETTINGS.db_user, _SETTINGS.db_password, _SETTINGS.db_host, _SETTINGS.db_port, _SETTINGS.db_name]):
+            logger.error("❌ No se han definido las variables de entorno de la base de datos")
+        else:
+            logger.info("Variables de entorno de la base de datos configuradas")
+
     # Crear motor y sesión solo si hay configuración válida
     engine = create_async_engine(
         SQLALCHEMY_DATABASE_URL,
-        pool_size=50,
-        max_overflow=50,
-        pool_timeout=60,
-        pool_recycle=3600,
         echo=False,
+        **_engine_kwargs(SQLALCHEMY_DATABASE_URL),
     )
+    if engine.dialect.name == "sqlite":
+        _configure_sqlite(engine)
 
     async_session = async_sessionmaker(
         bind=engine,
@@ -0,0 +1,173 @@
+import asyncio
+import hashlib
+import re
+import time
+from starlette.datastructures import Headers
+from starlette.requests import HTTPConnection
+from starlette.responses import Response, JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from fastapi import status
+
+from src.cache.idempotency_store import idempotency_store, StoredResponse
+from src.security.session import request_session
+from src.config.config import get_settings
+from src.utils.logger import setup_logger
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# Endpoints de creación cubiertos (POST)
+IDEMPOTENT_PATHS = [
+    re.compile(r"^/api/v1/reservations/?$"),
+    re.compile(r"^/api/v1/reservations/best-available$"),
+    re.compile(r"^/api/v1/reservations/holds/?$"),
+    re.compile(r"^/api/v1/reservations/holds/[^/]+/confirm$"),
+    re.compile(r"^/api/v1/showtimes/?$"),
+    re.compile(r"^/api/v1/showtimes/schedule$"),
+    re.compile(r"^/api/v1/movies/?$"),
+]
+
+# Cabeceras que no se reproducen (las recalcula Starlette o el resto de middlewares)
+_SKIPPED_HEADERS = {"content-length", "set-cookie", "date", "server"}
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+class IdempotencyMiddleware:
+    """
+    Replays the first response of a POST that carries an `Idempotency-Key`
+    header, so client retries cost a lookup instead of a transaction. Keys
+    are scoped to the user (JWT `sub`), method and path; reusing a key with a
+    different body is rejected. 5xx responses are not stored, so those
+    requests can be retried for real.
+
+    Pure ASGI: every other request goes straight through. The store lives in
+    this process, so a retry that lands on another worker runs the request
+    again: a booking then gets 409 for its own seats, other creates repeat.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        key_header = Headers(scope=scope).get(IDEMPOTENCY_HEADER)
+        path = scope["path"]
+        if not key_header or not any(p.match(path) for p in IDEMPOTENT_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        if len(key_header) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters."}
+            )
+            await response(scope, receive, send)
+            return
+
+        payload = request_session(HTTPConnection(scope)).payload
+        if not payload or not payload.get("sub"):
+            # Sin usuario no hay ámbito para la clave: la autenticación responderá 401
+            await self.app(scope, receive, send)
+            return
+
+        key = (str(payload["sub"]), scope["method"], path, key_header)
+        body = await _read_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+
+        stored = idempotency_store.get(key)
+        if stored is None:
+            pending = idempotency_store.pending(key)
+            if pending is not None:
+                if pending[0] != fingerprint:
+                    await self._mismatch()(scope, receive, send)
+                    return
+                try:
+                    stored = await asyncio.wait_for(asyncio.shield(pending[1]), timeout=_SETTINGS.idempotency_wait_seconds)
+                except asyncio.TimeoutError:
+                    stored = None
+                if stored is None:
+                    response = JSONResponse(
+                        status_code=status.HTTP_409_CONFLICT,
+                        content={"detail": "A request with this Idempotency-Key is still being processed."}
+                    )
+                    await response(scope, receive, send)
+                    return
+
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                await self._mismatch()(scope, receive, send)
+                return
+            idempotency_store.hits += 1
+            logger.info(f"🔁 Respuesta idempotente reproducida para usuario {key[0]} en {path}")
+            response = Response(content=stored.body, status_code=stored.status_code)
+            for name, value in stored.headers:
+                response.headers.append(name, value)
+            response.headers[REPLAYED_HEADER] = "true"
+            await response(scope, receive, send)
+            return
+
+        idempotency_store.misses += 1
+        idempotency_store.begin(key, fingerprint)
+
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            # La ruta vuelve a leer el cuerpo ya consumido; después, lo que llegue (p. ej. desconexión)
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        start: dict = {}
+        chunks: list[bytes] = []
+        stored_response = None
+
+        async def capture_send(message: Message):
+            nonlocal stored_response
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False) and start.get("status", 500) < 500:
+                    stored_response = StoredResponse(
+                        fingerprint=fingerprint,
+                        status_code=start["status"],
+                        headers=[
+                            (k.decode("latin-1"), v.decode("latin-1"))
+                            for k, v in start.get("headers", [])
+                            if k.decode("latin-1").lower() not in _SKIPPED_HEADERS
+                        ],
+                        body=b"".join(chunks),
+                        expires_at=time.monotonic() + idempotency_store.ttl_seconds,
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        finally:
+            idempotency_store.finish(key, stored_response)
+
+    @staticmethod
+    def _mismatch() -> Response:
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={"detail": f"{IDEMPOTENCY_HEADER} was already used with a different request body."}
+        )
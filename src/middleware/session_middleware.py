@@ -1,36 +1,19 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from src.security.jwt_handler import decode_token
-from src.config.db_config import get_db
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from src.models.user_model import User
-from src.utils.logger import setup_logger
-from src.config.config import get_settings
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.security.session import request_session
 
-_SETTINGS = get_settings()
-logger = setup_logger(__name__, level=_SETTINGS.log_level)
 
-class SessionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        token = request.cookies.get("access_token")
-        request.state.user = None
+class SessionMiddleware:
+    """
+    Pure ASGI middleware that attaches a lazy `RequestSession` to the scope
+    state. Nothing is decoded or queried here: anonymous requests pay nothing,
+    and `get_current_user` resolves the principal only when a route needs it.
+    """
 
-        if token:
-            payload = decode_token(token)
-            if payload:
-                user_id = payload.get("sub")
-                try:
-                    async for db in get_db():
-                        result = await db.execute(select(User).where(User.id == int(user_id)))
-                        user = result.scalar_one_or_none()
-                        if user:
-                            request.state.user = user
-                            logger.debug(f"✅ User {user.email} injected from session")
-                        break
-                except Exception as e:
-                    logger.error(f"❌ SessionMiddleware error: {e}")
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        response: Response = await call_next(request)
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] in ("http", "websocket"):
+            request_session(HTTPConnection(scope))
+        await self.app(scope, receive, send)
@@ -0,0 +1,16 @@
+from sqlalchemy import String, TIMESTAMP, SMALLINT, text, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base_model import Base
+
+class AuditoriumLayout(Base):
+    __tablename__ = "auditorium_layout"
+    __table_args__ = (
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    rows: Mapped[int] = mapped_column("num_rows", SMALLINT, nullable=False)  # "rows" es palabra reservada en MySQL 8
+    seats_per_row: Mapped[int] = mapped_column(SMALLINT, nullable=False)
+    gaps: Mapped[str] = mapped_column(String(255), nullable=True)  # Números de asiento tras los que hay pasillo, "4,12"
+    created_at: Mapped[str] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
@@ -1,5 +1,4 @@
-from sqlalchemy import String, TIMESTAMP, text
-from sqlalchemy.dialects.mysql import INTEGER
+from sqlalchemy import String, TIMESTAMP, text, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base_model import Base
 from src.models.movie_genre_model import MovieGenre
@@ -10,7 +9,7 @@ class Genre(Base):
         {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
 
-    id: Mapped[int] = mapped_column(INTEGER, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     created_at: Mapped[str] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
 
@@ -1,14 +1,16 @@
-from sqlalchemy import ForeignKey, TIMESTAMP, func
-from sqlalchemy.dialects.mysql import INTEGER
+from sqlalchemy import ForeignKey, TIMESTAMP, func, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base_model import Base
 
 class LoginAttempt(Base):
     __tablename__ = "login_attempts"
+    __table_args__ = (
+        Index("ix_login_attempts_last_failed_at", "last_failed_at"),
+    )
 
-    id: Mapped[int] = mapped_column(INTEGER, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
-    failed_attempts: Mapped[int] = mapped_column(INTEGER, default=0)
+    failed_attempts: Mapped[int] = mapped_column(Integer, default=0)
     last_failed_at: Mapped[TIMESTAMP] = mapped_column(TIMESTAMP, nullable=True)
 
     user = relationship("User", backref="login_attempt")
@@ -1,13 +1,14 @@
-from sqlalchemy import ForeignKey, Table
+from sqlalchemy import ForeignKey, Table, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.mysql import INTEGER
 from src.models.base_model import Base
 
 class MovieGenre(Base):
     __tablename__ = "movie_genre"
     __table_args__ = (
+        # Listado por género en orden de película (paginación keyset)
+        Index("ix_movie_genre_genre_movie", "genre_id", "movie_id"),
         {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
 
-    movie_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("movie.id", ondelete="CASCADE"), primary_key=True)
-    genre_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("genre.id", ondelete="CASCADE"), primary_key=True)
+    movie_id: Mapped[int] = mapped_column(Integer, ForeignKey("movie.id", ondelete="CASCADE"), primary_key=True)
+    genre_id: Mapped[int] = mapped_column(Integer, ForeignKey("genre.id", ondelete="CASCADE"), primary_key=True)
@@ -0,0 +1,17 @@
+from sqlalchemy import TIMESTAMP, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base_model import Base
+
+class ReservationArchive(Base):
+    __tablename__ = "reservation_archive"
+    __table_args__ = (
+        Index("ix_reservation_archive_user", "user_id"),
+        Index("ix_reservation_archive_showtime", "showtime_id"),
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    showtime_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    seat_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    reserved_at: Mapped[str] = mapped_column(TIMESTAMP, nullable=True)
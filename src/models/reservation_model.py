@@ -1,5 +1,4 @@
-from sqlalchemy import ForeignKey, TIMESTAMP, text, UniqueConstraint
-from sqlalchemy.dialects.mysql import INTEGER
+from sqlalchemy import ForeignKey, TIMESTAMP, text, UniqueConstraint, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base_model import Base
 
@@ -10,10 +9,10 @@ class Reservation(Base):
         {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
 
-    id: Mapped[int] = mapped_column(INTEGER, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
-    showtime_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("showtime.id", ondelete="CASCADE"), nullable=False)
-    seat_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("seat.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    showtime_id: Mapped[int] = mapped_column(Integer, ForeignKey("showtime.id", ondelete="CASCADE"), nullable=False)
+    seat_id: Mapped[int] = mapped_column(Integer, ForeignKey("seat.id", ondelete="CASCADE"), nullable=False)
     reserved_at: Mapped[str] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
 
     user = relationship("User", backref="reservations")
@@ -0,0 +1,15 @@
+from sqlalchemy import String, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base_model import Base
+
+class SeatArchive(Base):
+    __tablename__ = "seat_archive"
+    __table_args__ = (
+        Index("ix_seat_archive_showtime", "showtime_id"),
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    showtime_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    seat_number: Mapped[str] = mapped_column(String(10), nullable=False)
+    is_reserved: Mapped[bool] = mapped_column(default=False)
@@ -0,0 +1,22 @@
+from sqlalchemy import ForeignKey, String, TIMESTAMP, DATETIME, text, UniqueConstraint, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.models.base_model import Base
+
+class SeatHold(Base):
+    __tablename__ = "seat_hold"
+    __table_args__ = (
+        UniqueConstraint('seat_id', name='unique_seat_hold'),
+        Index('ix_seat_hold_expires_at', 'expires_at'),
+        Index('ix_seat_hold_token', 'hold_token'),
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    hold_token: Mapped[str] = mapped_column(String(36), nullable=False)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    showtime_id: Mapped[int] = mapped_column(Integer, ForeignKey("showtime.id", ondelete="CASCADE"), nullable=False)
+    seat_id: Mapped[int] = mapped_column(Integer, ForeignKey("seat.id", ondelete="CASCADE"), nullable=False)
+    expires_at: Mapped[str] = mapped_column(DATETIME, nullable=False)
+    created_at: Mapped[str] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
+
+    seat = relationship("Seat")
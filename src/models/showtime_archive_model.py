@@ -0,0 +1,20 @@
+from sqlalchemy import TIMESTAMP, DATETIME, text, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base_model import Base
+
+class ShowtimeArchive(Base):
+    __tablename__ = "showtime_archive"
+    __table_args__ = (
+        Index("ix_showtime_archive_movie_datetime", "movie_id", "show_datetime"),
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+
+    # Conserva el id original; sin FKs para que el historial sobreviva a borrados
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    movie_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    show_datetime: Mapped[str] = mapped_column(DATETIME, nullable=False)
+    layout_id: Mapped[int] = mapped_column(Integer, nullable=True)
+    seats_total: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    seats_available: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    created_at: Mapped[str] = mapped_column(TIMESTAMP, nullable=True)
+    archived_at: Mapped[str] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
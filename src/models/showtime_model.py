@@ -1,19 +1,30 @@
-from sqlalchemy import ForeignKey, TIMESTAMP, DATETIME, text
-from sqlalchemy.dialects.mysql import INTEGER
+from sqlalchemy import ForeignKey, TIMESTAMP, DATETIME, text, Index, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base_model import Base
+from src.models.auditorium_layout_model import AuditoriumLayout
 
 class Showtime(Base):
     __tablename__ = "showtime"
     __table_args__ = (
+        # Cartelera por película dentro de una ventana de fechas
+        Index("ix_showtime_movie_datetime", "movie_id", "show_datetime"),
+        # Ventanas de fechas sin película (cartelera completa, ETag del listado)
+        Index("ix_showtime_show_datetime", "show_datetime"),
         {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
 
-    id: Mapped[int] = mapped_column(INTEGER, primary_key=True, autoincrement=True)
-    movie_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("movie.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    movie_id: Mapped[int] = mapped_column(Integer, ForeignKey("movie.id", ondelete="CASCADE"), nullable=False)
     show_datetime: Mapped[str] = mapped_column(DATETIME, nullable=False)
+    layout_id: Mapped[int] = mapped_column(Integer, ForeignKey("auditorium_layout.id", ondelete="SET NULL"), nullable=True)
+    # Contadores desnormalizados: se actualizan en la misma transacción que las reservas
+    seats_total: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    seats_available: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    # Sube con cada cambio de asientos (reserva, cancelación, retención): versión del mapa de asientos
+    seat_version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
     created_at: Mapped[str] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
-    updated_at: Mapped[str] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"))
+    updated_at: Mapped[str] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), onupdate=func.now())
 
     movie = relationship("Movie", back_populates="showtimes")
     seats = relationship("Seat", back_populates="showtime", cascade="all, delete")
+    layout = relationship("AuditoriumLayout")
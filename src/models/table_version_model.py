@@ -0,0 +1,13 @@
+from sqlalchemy import String, BigInteger, text
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base_model import Base
+
+class TableVersion(Base):
+    __tablename__ = "table_version"
+    __table_args__ = (
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+
+    # Contador de cambios por tabla de catálogo (movie, genre, showtime) para los ETag
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
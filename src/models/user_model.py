@@ -1,8 +1,8 @@
 from typing import Optional
 
-from sqlalchemy import Index, String, TIMESTAMP, text, Column, Enum
-from sqlalchemy.dialects.mysql import INTEGER, LONGBLOB
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import Index, String, TIMESTAMP, text, Column, Enum, Integer, LargeBinary, func
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, column_property
 from src.models.base_model import Base
 import datetime
 import enum
@@ -22,7 +22,7 @@ class User(Base):
         }
     )
 
-    id: Mapped[int] = mapped_column(INTEGER, primary_key=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(100))
     lastname: Mapped[str] = mapped_column(String(100))
     nickname: Mapped[str] = mapped_column(String(50))
@@ -31,7 +31,17 @@ class User(Base):
     country_code: Mapped[str] = mapped_column(String(6))
     phone_number: Mapped[str] = mapped_column(String(20))
     country: Mapped[str] = mapped_column(String(100))
-    profile_photo: Mapped[Optional[bytes]] = mapped_column(LONGBLOB)
+    # Hasta 2 MB: diferida, sólo la carga el endpoint de la foto; leerla sin cargar falla en vez de hacer I/O oculto
+    profile_photo: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary().with_variant(LONGBLOB, "mysql"), deferred=True, deferred_raiseload=True
+    )
     user_role: Mapped[RoleEnum] = mapped_column(Enum(RoleEnum), default=RoleEnum.user, nullable=False)
     created_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
-    updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'))
+    updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'), onupdate=func.now())
+
+    # Lo que necesita el perfil (la URL de la foto) sin traer el blob
+    has_profile_photo: Mapped[bool] = column_property(profile_photo.column.isnot(None))
+
+
+# Columnas de login y rotación de tokens: `load_only(*AUTH_COLUMNS)`
+AUTH_COLUMNS = (User.id, User.email, User.password, User.user_role)
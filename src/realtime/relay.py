@@ -0,0 +1,141 @@
+"""
+Local stand-in for a pub/sub broker (e.g. Redis) that relays events
+between uvicorn workers and nodes.
+
+Run the relay once per host or cluster:
+
+    python -m src.realtime.relay --host 127.0.0.1 --port 51010
+
+and point every worker at it with EVENT_RELAY_URL=tcp://127.0.0.1:51010.
+Without EVENT_RELAY_URL events stay inside the process.
+
+Wire format: one JSON object per line, {"channel", "origin", "payload"}.
+The relay forwards each line to every other connected worker.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import uuid
+from typing import Callable
+from urllib.parse import urlparse
+
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+RECONNECT_MAX_SECONDS = 10
+
+
+class EventRelay:
+    def __init__(self, url: str, node_id: str):
+        self.url = url
+        self.node_id = node_id
+        self._handlers: dict[str, list[Callable]] = {}
+        self._writer: asyncio.StreamWriter | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None
+
+    def subscribe(self, channel: str, handler: Callable):
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def publish(self, channel: str, payload: dict):
+        if self._writer is None:
+            return
+        line = json.dumps({"channel": channel, "origin": self.node_id, "payload": payload}, default=str)
+        try:
+            self._writer.write(line.encode() + b"\n")
+        except Exception as e:
+            logger.warning(f"⚠️ Relay publish failed on {channel}: {e}")
+
+    async def start(self):
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        parsed = urlparse(self.url)
+        delay = 0.5
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(parsed.hostname, parsed.port)
+                self._writer = writer
+                delay = 0.5
+                logger.info(f"🔌 Connected to event relay {self.url} as node {self.node_id}")
+                while line := await reader.readline():
+                    await self._dispatch(line)
+                logger.warning("⚠️ Event relay closed the connection")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Event relay unavailable ({e}), retrying in {delay:.1f}s")
+            finally:
+                if self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+
+    async def _dispatch(self, line: bytes):
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return
+        if message.get("origin") == self.node_id:
+            return
+        for handler in self._handlers.get(message.get("channel"), ()):
+            try:
+                result = handler(message.get("payload") or {})
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"❌ Relay handler error on {message.get('channel')}: {e}")
+
+
+event_relay = EventRelay(_SETTINGS.event_relay_url, node_id=uuid.uuid4().hex)
+
+
+async def serve(host: str, port: int):
+    clients: set[asyncio.StreamWriter] = set()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        clients.add(writer)
+        logger.info(f"🔌 Worker connected ({len(clients)} total)")
+        try:
+            while line := await reader.readline():
+                for client in tuple(clients):
+                    if client is not writer:
+                        client.write(line)
+        except Exception as e:
+            logger.warning(f"⚠️ Worker connection error: {e}")
+        finally:
+            clients.discard(writer)
+            writer.close()
+            logger.info(f"🔌 Worker disconnected ({len(clients)} total)")
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info(f"📡 Event relay listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local event relay between app workers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=51010)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port))
@@ -0,0 +1,124 @@
+import json
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Optional
+
+from src.cache.seat_map_cache import seat_map_cache
+from src.cache.catalog_snapshots import catalog_snapshots
+from src.realtime.event_hub import EventHub, Subscription
+from src.realtime.relay import event_relay
+from src.utils.metrics import register_metrics
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+RELAY_CHANNEL = "seats"
+
+KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+seat_event_hub = EventHub(queue_size=_SETTINGS.sse_queue_size)
+register_metrics("seat_events", seat_event_hub.stats)
+
+# Último snapshot codificado por función: el payload del mapa de asientos es
+# el mismo objeto hasta el próximo cambio, así que se serializa una sola vez
+_snapshot_frames: dict[int, tuple[dict, bytes]] = {}
+
+
+def _json_default(value):
+    # Mismo formato que las respuestas REST (ISO 8601)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _frame(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, default=_json_default, separators=(',', ':'))}\n\n".encode()
+
+
+def _apply(change: dict):
+    """Patches this worker's seat map and fans the change out to its subscribers."""
+    showtime_id = change["showtime_id"]
+    # La cartelera serializada muestra asientos disponibles por función
+    catalog_snapshots.notify()
+    if change.get("invalidate"):
+        seat_map_cache.invalidate(showtime_id)
+        seat_event_hub.publish(showtime_id, _frame("refresh", change))
+        return
+
+    if change.get("reserved"):
+        seat_map_cache.mark_reserved(showtime_id, change["reserved"])
+    if change.get("released"):
+        seat_map_cache.mark_released(showtime_id, change["released"])
+    if change.get("held"):
+        expires_at = change["expires_at"]
+        if isinstance(expires_at, str):
+            expires_at = datetime.fromisoformat(expires_at)
+        seat_map_cache.mark_held(showtime_id, change["held"], expires_at)
+    if change.get("unheld"):
+        seat_map_cache.mark_unheld(showtime_id, change["unheld"])
+    # Cada cambio publicado corresponde a un único incremento de seat_version
+    seat_map_cache.advance(showtime_id)
+    seat_event_hub.publish(showtime_id, _frame("seats", change))
+
+
+def publish_seat_change(
+    showtime_id: int,
+    reserved: Iterable[int] = (),
+    released: Iterable[int] = (),
+    held: Iterable[int] = (),
+    unheld: Iterable[int] = (),
+    expires_at: Optional[datetime] = None,
+    invalidate: bool = False,
+):
+    """
+    Single entry point for committed seat changes: updates the local seat map
+    cache, pushes the delta to live subscribers and forwards it to the other
+    workers through the event relay.
+    """
+    change: dict = {"showtime_id": showtime_id}
+    if invalidate:
+        change["invalidate"] = True
+    for key, seat_ids in (("reserved", reserved), ("released", released), ("held", held), ("unheld", unheld)):
+        seat_ids = list(seat_ids)
+        if seat_ids:
+            change[key] = seat_ids
+    if "held" in change:
+        change["expires_at"] = expires_at.isoformat()
+
+    _apply(change)
+    event_relay.publish(RELAY_CHANNEL, change)
+
+
+event_relay.subscribe(RELAY_CHANNEL, _apply)
+
+
+def _snapshot_frame(showtime_id: int, snapshot: dict) -> bytes:
+    cached = _snapshot_frames.get(showtime_id)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+    frame = _frame("snapshot", snapshot)
+    _snapshot_frames[showtime_id] = (snapshot, frame)
+    return frame
+
+
+async def seat_event_stream(subscription: Subscription, snapshot: dict) -> AsyncIterator[bytes]:
+    """
+    Server-Sent Events body for one subscriber: the current seat map first,
+    then seat deltas as they are published. The subscription must be taken
+    before the snapshot is read so no change falls in between.
+    """
+    try:
+        yield _snapshot_frame(subscription.topic, snapshot)
+        while True:
+            # Sin timer por conexión: el keep-alive llega como un mensaje más (ver tasks.sse_heartbeat)
+            message = await subscription.queue.get()
+            yield message
+            if subscription.closed and subscription.queue.empty():
+                # Cliente lento: se corta el stream para que reconecte con un snapshot nuevo
+                logger.info(f"🐢 Suscriptor lento desconectado de función {subscription.topic}")
+                break
+    finally:
+        seat_event_hub.unsubscribe(subscription)
+        if not seat_event_hub.subscriber_count(subscription.topic):
+            _snapshot_frames.pop(subscription.topic, None)
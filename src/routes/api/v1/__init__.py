@@ -6,6 +6,9 @@ from . import token_refresh
 from . import movies
 from . import genres
 from . import showtimes
+from . import reservations
+from . import layouts
+from . import metrics
 
 from fastapi import APIRouter
 import sys
@@ -27,4 +30,7 @@ router.include_router(token_refresh.router, tags=["Auth"])
 router.include_router(profile.router, tags=["User"])
 router.include_router(movies.router)
 router.include_router(genres.router)
-router.include_router(showtimes.router)
\ No newline at end of file
+router.include_router(showtimes.router)
+router.include_router(reservations.router)
+router.include_router(layouts.router)
+router.include_router(metrics.router)
\ No newline at end of file
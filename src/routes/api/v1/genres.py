@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
@@ -11,6 +11,8 @@ from src.security.dependencies import get_current_admin_user
 from src.services.genre_service import GenreService
 from src.schema.requests.genre_request import GenreCreateRequest, GenreUpdateRequest
 from src.schema.responses.genre_response import GenreResponse
+from src.utils.etag import etag_matches, not_modified, set_etag
+from src.cache.catalog_snapshots import catalog_snapshots, GENRES_LIST
 from src.schema.examples.genre_example import (
     genre_create_examples,
     genre_update_examples,
@@ -34,11 +36,18 @@ genre_service = GenreService()
     tags=["Genres"]
 )
 async def list_genres(
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     logger.info("📚 Listando todos los géneros")
-    return await genre_service.get_all_genres(session)
+    etag = await genre_service.list_etag(session)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    snapshot = await catalog_snapshots.get(GENRES_LIST, etag, session)
+    return snapshot.response(response)
 
 # GET /genres/{id}
 @router.get(
@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from src.config.db_config import get_db
+from src.config.config import get_settings
+from src.utils.logger import setup_logger
+from src.models.user_model import User
+from src.security.dependencies import get_current_user, get_current_admin_user
+from src.services.layout_service import LayoutService
+from src.schema.requests.layout_request import AuditoriumLayoutCreateRequest
+from src.schema.responses.layout_response import AuditoriumLayoutResponse
+from src.schema.examples.layout_example import (
+    layout_create_examples,
+    layout_list_examples,
+    layout_detail_examples,
+    layout_delete_examples
+)
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+router = APIRouter(prefix="/layouts")
+layout_service = LayoutService()
+
+# GET /layouts
+@router.get(
+    "/",
+    response_model=List[AuditoriumLayoutResponse],
+    status_code=200,
+    responses=layout_list_examples,
+    tags=["Layouts"]
+)
+async def list_layouts(
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info("🏛️ Listando plantillas de sala")
+    return await layout_service.get_all_layouts(session)
+
+# GET /layouts/{id}
+@router.get(
+    "/{layout_id}",
+    response_model=AuditoriumLayoutResponse,
+    status_code=200,
+    responses=layout_detail_examples,
+    tags=["Layouts"]
+)
+async def get_layout_detail(
+    layout_id: int,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"🔎 Obteniendo plantilla de sala ID {layout_id}")
+    return await layout_service.get_layout_by_id(layout_id, session)
+
+# POST /layouts
+@router.post(
+    "/",
+    response_model=AuditoriumLayoutResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses=layout_create_examples,
+    tags=["Admin"]
+)
+async def create_layout(
+    layout: AuditoriumLayoutCreateRequest,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    logger.info(f"🆕 Creando plantilla de sala: {layout.name}")
+    return await layout_service.create_layout(layout, session, admin_user)
+
+# DELETE /layouts/{id}
+@router.delete(
+    "/{layout_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses=layout_delete_examples,
+    tags=["Admin"]
+)
+async def delete_layout(
+    layout_id: int,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    logger.warning(f"🗑️ Eliminando plantilla de sala ID {layout_id}")
+    await layout_service.delete_layout(layout_id, session, admin_user)
+    return
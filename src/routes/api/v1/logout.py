@@ -5,9 +5,10 @@ from sqlalchemy import insert
 from src.utils.logger import setup_logger
 from src.config.config import get_settings
 from src.security.dependencies import get_current_user
-from src.security.jwt_handler import decode_token
+from src.security.session import request_session
 from src.models.user_model import User
 from src.models.revoked_token_jti_model import RevokedTokenJTI
+from src.cache.revocation_cache import revocation_cache
 from src.config.db_config import get_db
 from datetime import datetime
 
@@ -28,22 +29,22 @@ async def logout_user(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    token = request.cookies.get(_SETTINGS.jwt_cookie_name)
+    session = request_session(request)
     refresh_service = RefreshTokenService()
 
-    if not token:
+    if not session.token:
         logger.warning("❌ No token in cookie during logout")
         response.delete_cookie(_SETTINGS.jwt_cookie_name)
         response.delete_cookie(_SETTINGS.jwt_refresh_cookie_name)
         return {"message": "No session to log out from."}
 
     # 🔒 Revocar access_token
-    decoded = decode_token(token)
+    decoded = session.payload
     jti = decoded.get("jti")
     exp_ts = decoded.get("exp")
 
     if jti and exp_ts:
-        exp = datetime.fromtimestamp(exp_ts)
+        exp = datetime.utcfromtimestamp(exp_ts)
         await db.execute(
             insert(RevokedTokenJTI).values(
                 user_id=current_user.id,
@@ -52,6 +53,7 @@ async def logout_user(
             )
         )
         await db.commit()
+        revocation_cache.revoke(jti, exp)
         logger.info(f"🔒 Access token revoked — JTI: {jti}")
 
     # 🔒 Revocar refresh_token también
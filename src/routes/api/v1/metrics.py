@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends
+
+from src.config.config import get_settings
+from src.utils.logger import setup_logger
+from src.utils.metrics import collect_metrics
+from src.models.user_model import User
+from src.security.dependencies import get_current_user, get_current_admin_user
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+router = APIRouter(prefix="/metrics")
+
+# GET /metrics (contadores en proceso de este worker)
+@router.get(
+    "/",
+    status_code=200,
+    tags=["Admin"]
+)
+async def get_metrics(
+    user: User = Depends(get_current_user),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    logger.debug(f"📊 Admin {admin_user.email} consultó las métricas")
+    return collect_metrics()
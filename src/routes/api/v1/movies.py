@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Literal, Optional
 from src.config.db_config import get_db
 from src.config.config import get_settings
 from src.utils.logger import setup_logger
@@ -8,7 +8,12 @@ from src.models.user_model import User
 from src.security.dependencies import get_current_user, get_current_admin_user
 from src.services.movie_service import MovieService
 from src.schema.requests.movie_request import MovieCreateRequest, MovieUpdateRequest
-from src.schema.responses.movie_response import MovieResponse, MovieWithShowtimesResponse
+from src.schema.responses.movie_response import MovieResponse, MovieWithShowtimesResponse, MovieSuggestionResponse
+from src.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from src.utils.fieldsets import sparse_response
+from src.cache.movie_suggest_index import MAX_SUGGESTIONS
+from src.utils.etag import etag_matches, not_modified, set_etag
+from src.cache.catalog_snapshots import catalog_snapshots, MOVIES_PAGE
 from src.schema.examples.movie_example import (
     movie_create_examples,
     movie_update_examples,
@@ -31,11 +36,94 @@ movie_service = MovieService()
     responses=movie_list_examples,
 )
 async def list_movies(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Películas por página"),
+    cursor: Optional[str] = Query(None, description=f"Valor de {NEXT_CURSOR_HEADER} de la página anterior"),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (p. ej. title,poster_url)"),
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     logger.info(f"📽️ Usuario {user.email} solicitó la lista de películas")
-    return await movie_service.get_all_movies(session)
+    etag = await movie_service.list_etag(session)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    if cursor is None and fields is None and limit == DEFAULT_PAGE_SIZE:
+        snapshot = await catalog_snapshots.get(MOVIES_PAGE, etag, session)
+        return snapshot.response(response)
+    movies, next_cursor = await movie_service.get_all_movies(session, limit, cursor, fields, version=etag)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if fields is not None:
+        return sparse_response(movies, response)
+    return movies
+
+# GET /movies/search?q=
+@router.get(
+    "/search",
+    response_model=List[MovieResponse],
+    status_code=200
+)
+async def search_movies(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Texto a buscar en título, director y descripción"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Películas por página"),
+    cursor: Optional[str] = Query(None, description=f"Valor de {NEXT_CURSOR_HEADER} de la página anterior"),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (p. ej. title,poster_url)"),
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"🔎 Usuario {user.email} busca películas: {q!r}")
+    movies, next_cursor = await movie_service.search_movies(q, session, limit, cursor, fields)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if fields is not None:
+        return sparse_response(movies, response)
+    return movies
+
+# GET /movies/suggest?prefix=
+@router.get(
+    "/suggest",
+    response_model=List[MovieSuggestionResponse],
+    status_code=200
+)
+async def suggest_movies(
+    prefix: str = Query(..., min_length=1, max_length=100, description="Comienzo de una palabra del título o del director"),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS, description="Sugerencias a devolver"),
+    user: User = Depends(get_current_user)
+):
+    logger.debug(f"🔤 Usuario {user.email} pide sugerencias para {prefix!r}")
+    return await movie_service.suggest_movies(prefix, limit)
+
+# GET /movies/by-genres?genres=1,4&mode=all
+@router.get(
+    "/by-genres",
+    response_model=List[MovieResponse],
+    status_code=200
+)
+async def list_movies_by_genres(
+    request: Request,
+    response: Response,
+    genres: str = Query(..., min_length=1, max_length=200, description="IDs de géneros separados por coma (p. ej. 1,4)"),
+    mode: Literal["all", "any"] = Query("all", description="all: todos los géneros; any: alguno de ellos"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Películas por página"),
+    cursor: Optional[str] = Query(None, description=f"Valor de {NEXT_CURSOR_HEADER} de la página anterior"),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (p. ej. title,poster_url)"),
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"🎯 Usuario {user.email} está filtrando películas por géneros {genres} ({mode})")
+    etag = await movie_service.list_etag(session)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    movies, next_cursor = await movie_service.get_movies_by_genres(genres, mode, session, limit, cursor, fields, version=etag)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if fields is not None:
+        return sparse_response(movies, response)
+    return movies
 
 # GET /movies/{id}
 @router.get(
@@ -46,11 +134,21 @@ async def list_movies(
 )
 async def get_movie_detail(
     movie_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (p. ej. title,poster_url)"),
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     logger.info(f"🔍 Usuario {user.email} solicitó el detalle de la película ID {movie_id}")
-    return await movie_service.get_movie_by_id(movie_id, session)
+    etag = await movie_service.detail_etag(movie_id, session)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    movie = await movie_service.get_movie_detail(movie_id, session, fields, version=etag)
+    if fields is not None:
+        return sparse_response(movie, response)
+    return movie
 
 # POST /movies
 @router.post(
@@ -111,8 +209,22 @@ async def delete_movie_by_id(
 )
 async def list_movies_by_genre(
     genre_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Películas por página"),
+    cursor: Optional[str] = Query(None, description=f"Valor de {NEXT_CURSOR_HEADER} de la página anterior"),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (p. ej. title,poster_url)"),
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     logger.info(f"🎯 Usuario {user.email} está filtrando películas por género ID {genre_id}")
-    return await movie_service.get_movies_by_genre(genre_id, session)
+    etag = await movie_service.list_etag(session)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    movies, next_cursor = await movie_service.get_movies_by_genre(genre_id, session, limit, cursor, fields, version=etag)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if fields is not None:
+        return sparse_response(movies, response)
+    return movies
@@ -61,14 +61,14 @@ async def get_profile_photo(
         logger.warning(f"🚫 Access denied: user {current_user.id} tried to access photo of user {user_id}")
         raise HTTPException(status_code=403, detail="Access denied. You can only view your own profile photo.")
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # El único lugar que lee el blob: sólo esa columna
+    photo = await db.scalar(select(User.profile_photo).where(User.id == user_id))
 
-    if not user or not user.profile_photo:
+    if not photo:
         logger.warning(f"📷 Profile photo not found for user ID {user_id}")
         raise HTTPException(status_code=404, detail="Profile photo not found")
 
-    mime_type = imghdr.what(None, h=user.profile_photo)
+    mime_type = imghdr.what(None, h=photo)
     if mime_type == "jpeg":
         content_type = "image/jpeg"
     elif mime_type == "png":
@@ -79,4 +79,4 @@ async def get_profile_photo(
         content_type = "application/octet-stream"
 
     logger.info(f"📤 Returning profile photo for user ID {user_id} with MIME type {content_type}")
-    return Response(content=user.profile_photo, media_type=content_type)
+    return Response(content=photo, media_type=content_type)
@@ -0,0 +1,132 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from src.config.db_config import get_db
+from src.config.config import get_settings
+from src.utils.logger import setup_logger
+from src.models.user_model import User
+from src.security.dependencies import get_current_user
+from src.services.reservation_service import ReservationService
+from src.services.seat_hold_service import SeatHoldService
+from src.schema.requests.reservation_request import ReservationCreateRequest, SeatHoldCreateRequest, BestAvailableRequest
+from src.schema.responses.reservation_response import ReservationResponse, SeatHoldResponse
+from src.schema.examples.reservation_example import (
+    reservation_create_examples,
+    reservation_list_examples,
+    reservation_cancel_examples,
+    seat_hold_create_examples,
+    seat_hold_not_found_examples,
+    best_available_examples
+)
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+router = APIRouter(prefix="/reservations", tags=["Reservations"])
+reservation_service = ReservationService()
+seat_hold_service = SeatHoldService()
+
+# GET /reservations
+@router.get(
+    "/",
+    response_model=List[ReservationResponse],
+    status_code=200,
+    responses=reservation_list_examples,
+)
+async def list_my_reservations(
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"📋 Usuario {user.email} solicitó sus reservas")
+    return await reservation_service.get_user_reservations(session, user)
+
+# POST /reservations
+@router.post(
+    "/",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses=reservation_create_examples,
+)
+async def create_reservation(
+    reservation: ReservationCreateRequest,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"🎟️ Usuario {user.email} reserva asientos {reservation.seat_ids} en la función ID {reservation.showtime_id}")
+    return await reservation_service.create_reservation(reservation, session, user)
+
+# POST /reservations/best-available
+@router.post(
+    "/best-available",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses=best_available_examples,
+)
+async def reserve_best_available(
+    request: BestAvailableRequest,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"🎯 Usuario {user.email} pide los {request.quantity} mejores asientos en la función ID {request.showtime_id}")
+    return await reservation_service.reserve_best_available(request, session, user)
+
+# DELETE /reservations/{id}
+@router.delete(
+    "/{reservation_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses=reservation_cancel_examples,
+)
+async def cancel_reservation(
+    reservation_id: int,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.warning(f"🗑️ Usuario {user.email} cancela la reserva ID {reservation_id}")
+    await reservation_service.cancel_reservation(reservation_id, session, user)
+    return
+
+# POST /reservations/holds
+@router.post(
+    "/holds",
+    response_model=SeatHoldResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses=seat_hold_create_examples,
+)
+async def hold_seats(
+    hold: SeatHoldCreateRequest,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"⏳ Usuario {user.email} retiene asientos {hold.seat_ids} en la función ID {hold.showtime_id}")
+    return await seat_hold_service.hold_seats(hold, session, user)
+
+# POST /reservations/holds/{token}/confirm
+@router.post(
+    "/holds/{hold_token}/confirm",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={**reservation_create_examples, **seat_hold_not_found_examples},
+)
+async def confirm_hold(
+    hold_token: str,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"💳 Usuario {user.email} confirma la retención {hold_token}")
+    return await seat_hold_service.confirm_hold(hold_token, session, user)
+
+# DELETE /reservations/holds/{token}
+@router.delete(
+    "/holds/{hold_token}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses=seat_hold_not_found_examples,
+)
+async def release_hold(
+    hold_token: str,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"↩️ Usuario {user.email} libera la retención {hold_token}")
+    await seat_hold_service.release_hold(hold_token, session, user)
+    return
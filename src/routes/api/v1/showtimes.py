@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from datetime import date, time
+from datetime import date, time, datetime
 
 from src.config.db_config import get_db
 from src.config.config import get_settings
@@ -9,14 +10,19 @@ from src.utils.logger import setup_logger
 from src.models.user_model import User
 from src.security.dependencies import get_current_user, get_current_admin_user
 from src.services.showtime_service import ShowtimeService
-from src.schema.requests.showtime_request import ShowtimeCreateRequest, ShowtimeUpdateRequest
-from src.schema.responses.showtime_response import ShowtimeDetailResponse, MovieWithShowtimesGroupedResponse
+from src.schema.requests.showtime_request import ShowtimeCreateRequest, ShowtimeUpdateRequest, ShowtimeScheduleRequest
+from src.schema.responses.showtime_response import ShowtimeDetailResponse, MovieWithShowtimesGroupedResponse, ShowtimeScheduleResponse
+from src.utils.fieldsets import sparse_response
+from src.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from src.utils.etag import etag_matches, not_modified, set_etag
+from src.cache.catalog_snapshots import catalog_snapshots, SHOWTIMES_LISTING
 from src.schema.examples.showtime_example import (
     showtime_create_examples,
     showtime_update_examples,
     showtime_list_examples,
     showtime_detail_examples,
-    showtime_delete_examples
+    showtime_delete_examples,
+    showtime_schedule_examples
 )
 
 _SETTINGS = get_settings()
@@ -33,11 +39,26 @@ showtime_service = ShowtimeService()
     tags=["Showtimes"]
 )
 async def list_showtimes(
+    request: Request,
+    response: Response,
+    start: Optional[datetime] = Query(None, description="Inicio de la ventana (por defecto: ahora)"),
+    end: Optional[datetime] = Query(None, description=f"Fin de la ventana (por defecto: inicio + {_SETTINGS.showtime_window_days} días)"),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (p. ej. title,poster_url)"),
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     logger.info(f"🎭 Listando todas las funciones disponibles para el usuario {user.email}")
-    return await showtime_service.get_all_showtimes(session)
+    etag = await showtime_service.listing_etag(session, start, end)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    if start is None and end is None and fields is None:
+        snapshot = await catalog_snapshots.get(SHOWTIMES_LISTING, etag, session)
+        return snapshot.response(response)
+    showtimes = await showtime_service.get_all_showtimes(session, fields, start, end, version=etag)
+    if fields is not None:
+        return sparse_response(showtimes, response)
+    return showtimes
 
 # GET /showtimes/search
 @router.get(
@@ -49,11 +70,43 @@ async def list_showtimes(
 async def search_showtimes(
     date: date = Query(..., description="Fecha en formato YYYY-MM-DD"),
     time: Optional[time] = Query(None, description="Hora en formato HH:MM (24h, opcional)"),
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (p. ej. title,poster_url)"),
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     logger.info(f"🔎 {user.email} busca funciones para {date} {f'a las {time}' if time else ''}")
-    return await showtime_service.search_showtimes_by_datetime(session, date, time)
+    showtimes = await showtime_service.search_showtimes_by_datetime(session, date, time, fields)
+    if fields is not None:
+        return sparse_response(showtimes)
+    return showtimes
+
+# GET /showtimes/search/advanced
+@router.get(
+    "/search/advanced",
+    response_model=List[MovieWithShowtimesGroupedResponse],
+    status_code=200,
+    tags=["Showtimes"]
+)
+async def search_showtimes_advanced(
+    response: Response,
+    date_from: Optional[date] = Query(None, description="Primer día (YYYY-MM-DD, por defecto hoy)"),
+    date_to: Optional[date] = Query(None, description=f"Último día (por defecto: date_from + {_SETTINGS.showtime_window_days} días)"),
+    genre_ids: Optional[List[int]] = Query(None, description="Géneros (cualquiera de ellos); se repite el parámetro"),
+    time_from: Optional[time] = Query(None, description="Hora de inicio mínima (HH:MM)"),
+    time_to: Optional[time] = Query(None, description="Hora de inicio máxima (HH:MM); puede cruzar la medianoche"),
+    min_seats: Optional[int] = Query(None, ge=1, description="Asientos libres mínimos por función"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Películas por página"),
+    cursor: Optional[str] = Query(None, description=f"Valor de {NEXT_CURSOR_HEADER} de la página anterior"),
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"🔎 {user.email} busca funciones con filtros")
+    movies, next_cursor = await showtime_service.search_showtimes(
+        session, date_from, date_to, genre_ids, time_from, time_to, min_seats, limit, cursor
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return movies
 
 # GET /showtimes/{id}
 @router.get(
@@ -64,12 +117,42 @@ async def search_showtimes(
     tags=["Showtimes"]
 )
 async def get_showtime_detail(
-    showtime_id: int, 
+    showtime_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (p. ej. id,seats)"),
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     logger.info(f"🔍 Detalle solicitado para la función ID {showtime_id} por {user.email}")
-    return await showtime_service.get_showtime_by_id(showtime_id, session)
+    etag, seat_version = await showtime_service.detail_etag(showtime_id, session)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    showtime = await showtime_service.get_showtime_by_id(showtime_id, session, fields, seat_version)
+    if fields is not None:
+        return sparse_response(showtime, response)
+    return showtime
+
+# GET /showtimes/{id}/events (SSE: `snapshot` con el mapa de asientos, luego `seats` con cada cambio)
+@router.get(
+    "/{showtime_id}/events",
+    response_class=StreamingResponse,
+    status_code=200,
+    tags=["Showtimes"]
+)
+async def stream_showtime_seat_events(
+    showtime_id: int,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    logger.info(f"📡 {user.email} se suscribe a los asientos de la función ID {showtime_id}")
+    stream = await showtime_service.open_seat_event_stream(showtime_id, session)
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 # POST /showtimes
 @router.post(
@@ -88,6 +171,23 @@ async def create_showtime(
     logger.info(f"🎬 Creando nueva función para película ID {showtime.movie_id} por admin {admin_user.email}")
     return await showtime_service.create_showtime(showtime, session, admin_user)
 
+# POST /showtimes/schedule
+@router.post(
+    "/schedule",
+    response_model=ShowtimeScheduleResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses=showtime_schedule_examples,
+    tags=["Admin"]
+)
+async def create_showtime_schedule(
+    schedule: ShowtimeScheduleRequest,
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    logger.info(f"📅 Programando funciones para película ID {schedule.movie_id} del {schedule.start_date} al {schedule.end_date} por admin {admin_user.email}")
+    return await showtime_service.create_schedule(schedule, session, admin_user)
+
 # PUT /showtimes/{id}
 @router.put(
     "/{showtime_id}",
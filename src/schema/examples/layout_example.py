@@ -0,0 +1,69 @@
+layout_create_examples = {
+    201: {
+        "description": "Auditorium layout created successfully",
+        "content": {
+            "application/json": {
+                "example": {
+                    "id": 1,
+                    "name": "Sala 1",
+                    "rows": 20,
+                    "seats_per_row": 30,
+                    "gaps": [8, 22],
+                    "capacity": 600
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Invalid layout",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Layout 'Sala 1' already exists."
+                }
+            }
+        }
+    }
+}
+
+layout_list_examples = {
+    200: {
+        "description": "List of auditorium layouts",
+        "content": {
+            "application/json": {
+                "example": [
+                    {"id": 1, "name": "Sala 1", "rows": 20, "seats_per_row": 30, "gaps": [8, 22], "capacity": 600},
+                    {"id": 2, "name": "Sala VIP", "rows": 4, "seats_per_row": 12, "gaps": [6], "capacity": 48}
+                ]
+            }
+        }
+    }
+}
+
+layout_detail_examples = {
+    200: {
+        "description": "Auditorium layout detail",
+        "content": {
+            "application/json": {
+                "example": {"id": 1, "name": "Sala 1", "rows": 20, "seats_per_row": 30, "gaps": [8, 22], "capacity": 600}
+            }
+        }
+    },
+    404: {
+        "description": "Layout not found",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Layout with ID 9 not found."
+                }
+            }
+        }
+    }
+}
+
+layout_delete_examples = {
+    204: {
+        "description": "Auditorium layout deleted successfully"
+    },
+    404: layout_detail_examples[404]
+}
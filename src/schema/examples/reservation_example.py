@@ -0,0 +1,152 @@
+reservation_create_examples = {
+    201: {
+        "description": "Seats reserved successfully",
+        "content": {
+            "application/json": {
+                "example": {
+                    "showtime_id": 1,
+                    "show_datetime": "2025-05-01T19:00:00",
+                    "movie_id": 5,
+                    "movie_title": "Inception",
+                    "seats": [
+                        {"reservation_id": 10, "seat_id": 12, "seat_number": "B2"},
+                        {"reservation_id": 11, "seat_id": 13, "seat_number": "B3"}
+                    ]
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Showtime already started",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Reservations are closed for this showtime."
+                }
+            }
+        }
+    },
+    404: {
+        "description": "Showtime not found",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Showtime ID 1 not found."
+                }
+            }
+        }
+    },
+    409: {
+        "description": "One or more seats are no longer available",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "One or more of the selected seats are no longer available."
+                }
+            }
+        }
+    }
+}
+
+reservation_list_examples = {
+    200: {
+        "description": "Reservations of the current user grouped by showtime",
+        "content": {
+            "application/json": {
+                "example": [
+                    {
+                        "showtime_id": 1,
+                        "show_datetime": "2025-05-01T19:00:00",
+                        "movie_id": 5,
+                        "movie_title": "Inception",
+                        "seats": [
+                            {"reservation_id": 10, "seat_id": 12, "seat_number": "B2"}
+                        ]
+                    }
+                ]
+            }
+        }
+    }
+}
+
+reservation_cancel_examples = {
+    204: {
+        "description": "Reservation cancelled successfully"
+    },
+    400: {
+        "description": "Showtime already started",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Reservations are closed for this showtime."
+                }
+            }
+        }
+    },
+    404: {
+        "description": "Reservation not found",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Reservation ID 10 not found."
+                }
+            }
+        }
+    }
+}
+
+seat_hold_create_examples = {
+    201: {
+        "description": "Seats held until expires_at",
+        "content": {
+            "application/json": {
+                "example": {
+                    "hold_token": "3f1c2a9e-5b7d-4c1e-9a51-6c0f2d8b7e41",
+                    "showtime_id": 1,
+                    "expires_at": "2025-05-01T18:10:00",
+                    "seats": [
+                        {"seat_id": 12, "seat_number": "B2"},
+                        {"seat_id": 13, "seat_number": "B3"}
+                    ]
+                }
+            }
+        }
+    },
+    409: {
+        "description": "One or more seats are reserved or held by someone else",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "One or more of the selected seats are no longer available."
+                }
+            }
+        }
+    }
+}
+
+seat_hold_not_found_examples = {
+    404: {
+        "description": "Hold not found or expired",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Seat hold not found or expired."
+                }
+            }
+        }
+    }
+}
+
+best_available_examples = {
+    **reservation_create_examples,
+    409: {
+        "description": "No block of adjacent seats is available",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Not enough adjacent seats available."
+                }
+            }
+        }
+    }
+}
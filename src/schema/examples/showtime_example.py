@@ -212,3 +212,34 @@ showtime_search_examples = {
         }
     }
 }
+
+showtime_schedule_examples = {
+    201: {
+        "description": "Season of showtimes created",
+        "content": {
+            "application/json": {
+                "example": {
+                    "movie_id": 5,
+                    "created": 3,
+                    "seats_created": 150,
+                    "skipped": [],
+                    "showtimes": [
+                        {"id": 10, "show_datetime": "2025-05-01T14:00:00"},
+                        {"id": 11, "show_datetime": "2025-05-01T17:00:00"},
+                        {"id": 12, "show_datetime": "2025-05-01T20:00:00"}
+                    ]
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Conflicting or invalid schedule",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "2 showtimes already exist for this movie, first at 2025-05-01T17:00:00."
+                }
+            }
+        }
+    }
+}
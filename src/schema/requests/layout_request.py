@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+class AuditoriumLayoutCreateRequest(BaseModel):
+    name: str = Field(..., example="Sala 1")
+    rows: int = Field(..., ge=1, le=52, example=20)
+    seats_per_row: int = Field(..., ge=1, le=60, example=30)
+    gaps: List[int] = Field(default_factory=list, example=[8, 22])  # Pasillo después de estos números de asiento
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+class ReservationCreateRequest(BaseModel):
+    showtime_id: int = Field(..., example=1)
+    seat_ids: List[int] = Field(..., min_length=1, max_length=20, example=[12, 13])
+
+class SeatHoldCreateRequest(BaseModel):
+    showtime_id: int = Field(..., example=1)
+    seat_ids: List[int] = Field(..., min_length=1, max_length=20, example=[12, 13])
+
+class BestAvailableRequest(BaseModel):
+    showtime_id: int = Field(..., example=1)
+    quantity: int = Field(..., ge=1, le=20, example=4)
@@ -1,14 +1,20 @@
-from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional
+from pydantic import BaseModel, Field
+from datetime import datetime, date, time
+from typing import Optional, List
 
 class ShowtimeCreateRequest(BaseModel):
     movie_id: int
     show_datetime: datetime
+    layout_id: Optional[int] = None  # Sin plantilla: sala por defecto A–E × 10
 
 class ShowtimeUpdateRequest(BaseModel):
     show_datetime: Optional[datetime] = None
 
-class ShowtimeCreateRequest(BaseModel):
-    movie_id: int
-    show_datetime: Optional[datetime] = None
\ No newline at end of file
+class ShowtimeScheduleRequest(BaseModel):
+    movie_id: int = Field(..., example=5)
+    start_date: date = Field(..., example="2025-05-01")
+    end_date: date = Field(..., example="2025-06-11")
+    times: List[time] = Field(..., min_length=1, max_length=24, example=["14:00", "17:00", "20:00"])
+    weekdays: Optional[List[int]] = Field(None, example=[0, 1, 2, 3, 4, 5, 6])  # 0 = lunes; None = todos los días
+    layout_id: Optional[int] = None
+    skip_conflicts: bool = False  # Omite los horarios que ya existen en vez de rechazar todo
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import List
+
+class AuditoriumLayoutResponse(BaseModel):
+    id: int
+    name: str
+    rows: int
+    seats_per_row: int
+    gaps: List[int]
+    capacity: int
+
+    class Config:
+        from_attributes = True
@@ -30,4 +30,9 @@ class MovieResponse(BaseModel):
         orm_mode = True
 
 class MovieWithShowtimesResponse(MovieResponse):
-    showtimes: List[ShowtimeResponse]
\ No newline at end of file
+    showtimes: List[ShowtimeResponse]
+class MovieSuggestionResponse(BaseModel):
+    id: int
+    title: str
+    director: Optional[str]
+    year: Optional[int]
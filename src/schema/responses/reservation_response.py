@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+
+class ReservedSeatResponse(BaseModel):
+    reservation_id: int
+    seat_id: int
+    seat_number: str
+
+    class Config:
+        from_attributes = True
+
+class ReservationResponse(BaseModel):
+    showtime_id: int
+    show_datetime: datetime
+    movie_id: int
+    movie_title: str
+    seats: List[ReservedSeatResponse]
+
+    class Config:
+        from_attributes = True
+
+class HeldSeatResponse(BaseModel):
+    seat_id: int
+    seat_number: str
+
+    class Config:
+        from_attributes = True
+
+class SeatHoldResponse(BaseModel):
+    hold_token: str
+    showtime_id: int
+    expires_at: datetime
+    seats: List[HeldSeatResponse]
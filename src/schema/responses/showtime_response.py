@@ -17,6 +17,7 @@ class SeatResponse(BaseModel):
     id: int
     seat_number: str
     is_reserved: bool
+    is_held: bool = False
 
     class Config:
         from_attributes = True
@@ -33,6 +34,9 @@ class ShowtimeDetailResponse(BaseModel):
 class ShowtimeBriefResponse(BaseModel):
     id: int
     show_datetime: datetime
+    seats_total: int = 0
+    seats_available: int = 0
+    sold_out: bool = False
 
     class Config:
         from_attributes = True
@@ -48,3 +52,10 @@ class MovieWithShowtimesGroupedResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+class ShowtimeScheduleResponse(BaseModel):
+    movie_id: int
+    created: int
+    seats_created: int
+    skipped: List[datetime]
+    showtimes: List[ShowtimeBriefResponse]
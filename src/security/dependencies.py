@@ -1,10 +1,9 @@
 from fastapi import Request, HTTPException, status, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from src.config.db_config import get_db
 from src.models.user_model import User
-from src.models.revoked_token_jti_model import RevokedTokenJTI
-from src.security.jwt_handler import decode_token
+from src.cache.revocation_cache import revocation_cache
+from src.security.session import request_session
 from src.utils.logger import setup_logger
 from src.config.config import get_settings
 from src.models.user_model import RoleEnum
@@ -16,13 +15,14 @@ async def get_current_user(
     request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> User:
-    token = request.cookies.get(_SETTINGS.jwt_cookie_name)
+    # Token decodificado y usuario compartidos por toda la request
+    session = request_session(request)
 
-    if not token:
+    if not session.token:
         logger.warning("❌ No access token found in cookies")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
-    payload = decode_token(token)
+    payload = session.payload
     if not payload:
         logger.warning("❌ Invalid or expired token")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
@@ -34,14 +34,12 @@ async def get_current_user(
         logger.error("❌ Invalid token payload structure")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    # 🔒 Revisar si el jti ha sido revocado
-    result = await db.execute(select(RevokedTokenJTI).where(RevokedTokenJTI.jti == jti))
-    if result.scalar_one_or_none():
+    # 🔒 Revisar si el jti ha sido revocado (en memoria; la tabla sólo si la caché no es confiable)
+    if await revocation_cache.is_revoked(jti, db):
         logger.warning(f"🚫 Token with jti {jti} has been revoked")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
 
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    user = await session.load_user(db, int(user_id))
     if user is None:
         logger.warning(f"❌ User with ID {user_id} not found")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
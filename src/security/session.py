@@ -0,0 +1,60 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import HTTPConnection
+from starlette.types import Scope
+
+from src.models.user_model import User
+from src.security.jwt_handler import decode_token
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+
+_STATE_KEY = "session"
+_UNSET = object()
+
+
+class RequestSession:
+    """
+    Principal of one request, resolved lazily: the access-token cookie is
+    decoded on first access to `payload`, and the user row is loaded on the
+    first `load_user`. Both results are kept, so the middleware and every
+    dependency of the request share one decode and at most one query.
+    """
+
+    __slots__ = ("_scope", "_token", "_payload", "_user")
+
+    def __init__(self, scope: Scope):
+        self._scope = scope
+        self._token = _UNSET
+        self._payload = _UNSET
+        self._user = _UNSET
+
+    @property
+    def token(self) -> Optional[str]:
+        if self._token is _UNSET:
+            self._token = HTTPConnection(self._scope).cookies.get(_SETTINGS.jwt_cookie_name)
+        return self._token
+
+    @property
+    def payload(self) -> Optional[dict]:
+        if self._payload is _UNSET:
+            token = self.token
+            self._payload = decode_token(token) if token else None
+        return self._payload
+
+    async def load_user(self, db: AsyncSession, user_id: int) -> Optional[User]:
+        # Con la sesión de la request: la entidad queda asociada a ella, como antes
+        if self._user is _UNSET:
+            result = await db.execute(select(User).where(User.id == user_id))
+            self._user = result.scalar_one_or_none()
+        return self._user
+
+
+def request_session(connection: HTTPConnection) -> RequestSession:
+    """The request's `RequestSession`, created on first use if no middleware installed one."""
+    state = connection.scope.setdefault("state", {})
+    session = state.get(_STATE_KEY)
+    if session is None:
+        session = state[_STATE_KEY] = RequestSession(connection.scope)
+    return session
@@ -1,16 +1,26 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from typing import List, Optional
+from pydantic import TypeAdapter
 from fastapi import HTTPException, status
 
 from src.models.genre_model import Genre
 from src.models.user_model import User, RoleEnum
 from src.schema.requests.genre_request import GenreCreateRequest, GenreUpdateRequest
+from src.schema.responses.genre_response import GenreResponse
+from src.cache.catalog_cache import catalog_cache, GENRES, MOVIES, MOVIE_DETAIL
+from src.cache.catalog_snapshots import catalog_snapshots, GENRES_LIST
+from src.cache.genre_movie_index import genre_movie_index
+from src.services.version_service import VersionService
+from src.utils.etag import make_etag
 from src.utils.logger import setup_logger
 from src.config.config import get_settings
 
 _SETTINGS = get_settings()
 logger = setup_logger(__name__, level=_SETTINGS.log_level)
 
+_GENRE_LIST = TypeAdapter(List[GenreResponse])
+
 
 class GenreService:
     @staticmethod
@@ -22,10 +32,35 @@ class GenreService:
                 detail="Only admins are allowed to perform this action."
             )
 
-    async def get_all_genres(self, session: AsyncSession):
+    @staticmethod
+    async def list_etag(session: AsyncSession) -> str:
+        return make_etag("genres", *await VersionService.get(session, "genre"))
+
+    async def get_all_genres(self, session: AsyncSession, version: Optional[str] = None):
+        return await catalog_cache.get_or_load(GENRES, ("all", version), lambda: self._load_all_genres(session))
+
+    @staticmethod
+    async def _load_all_genres(session: AsyncSession) -> list[GenreResponse]:
         logger.info("📚 Obteniendo todos los géneros")
         result = await session.execute(select(Genre))
-        return result.scalars().all()
+        return [GenreResponse.model_validate(genre) for genre in result.scalars().all()]
+
+    @staticmethod
+    async def build_list_snapshot(session: AsyncSession) -> tuple[bytes, dict]:
+        return _GENRE_LIST.dump_json(await GenreService._load_all_genres(session)), {}
+
+    async def get_genre_by_id(self, genre_id: int, session: AsyncSession):
+        async def load():
+            result = await session.execute(select(Genre).where(Genre.id == genre_id))
+            genre = result.scalar_one_or_none()
+            if not genre:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Genre with ID {genre_id} not found."
+                )
+            return GenreResponse.model_validate(genre)
+
+        return await catalog_cache.get_or_load(GENRES, genre_id, load)
 
     async def create_genre(self, data: GenreCreateRequest, session: AsyncSession, user: User):
         self._verify_admin(user)
@@ -40,8 +75,10 @@ class GenreService:
 
         genre = Genre(name=data.name)
         session.add(genre)
+        await VersionService.bump(session, "genre")
         await session.commit()
         await session.refresh(genre)
+        catalog_cache.invalidate(GENRES)
 
         logger.info(f"✅ Género creado: {genre.name}")
         return genre
@@ -58,8 +95,11 @@ class GenreService:
             )
 
         genre.name = data.name
+        await VersionService.bump(session, "genre")
         await session.commit()
         await session.refresh(genre)
+        # Las películas incluyen sus géneros
+        catalog_cache.invalidate(GENRES, MOVIES, MOVIE_DETAIL)
         logger.info(f"✏️ Género actualizado: {genre.name}")
         return genre
 
@@ -75,6 +115,12 @@ class GenreService:
             )
 
         await session.delete(genre)
+        await VersionService.bump(session, "genre")
         await session.commit()
+        catalog_cache.invalidate(GENRES, MOVIES, MOVIE_DETAIL)
+        genre_movie_index.remove_genre(genre_id)
         logger.warning(f"🗑️ Género eliminado: {genre.name}")
         return {"detail": "Genre deleted successfully"}
+
+
+catalog_snapshots.register(GENRES_LIST, GenreService.list_etag, GenreService.build_list_snapshot)
@@ -0,0 +1,100 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from fastapi import HTTPException, status
+
+from src.models.auditorium_layout_model import AuditoriumLayout
+from src.models.user_model import User, RoleEnum
+from src.schema.requests.layout_request import AuditoriumLayoutCreateRequest
+from src.utils.seat_layout import parse_gaps, format_gaps
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+
+class LayoutService:
+    @staticmethod
+    def _verify_admin(user: User):
+        if user.user_role != RoleEnum.admin:
+            logger.warning("❌ Acción denegada: el usuario no es admin")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only admins are allowed to perform this action."
+            )
+
+    @staticmethod
+    def to_response(layout: AuditoriumLayout) -> dict:
+        return {
+            "id": layout.id,
+            "name": layout.name,
+            "rows": layout.rows,
+            "seats_per_row": layout.seats_per_row,
+            "gaps": parse_gaps(layout.gaps),
+            "capacity": layout.rows * layout.seats_per_row,
+        }
+
+    @staticmethod
+    async def get_layout(layout_id: int, session: AsyncSession) -> AuditoriumLayout:
+        result = await session.execute(select(AuditoriumLayout).where(AuditoriumLayout.id == layout_id))
+        layout = result.scalar_one_or_none()
+        if not layout:
+            logger.warning(f"❌ Plantilla de sala no encontrada: ID {layout_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Layout with ID {layout_id} not found."
+            )
+        return layout
+
+    async def get_all_layouts(self, session: AsyncSession):
+        logger.info("🏛️ Obteniendo todas las plantillas de sala")
+        result = await session.execute(select(AuditoriumLayout).order_by(AuditoriumLayout.id))
+        return [self.to_response(layout) for layout in result.scalars().all()]
+
+    async def get_layout_by_id(self, layout_id: int, session: AsyncSession):
+        return self.to_response(await self.get_layout(layout_id, session))
+
+    async def create_layout(self, data: AuditoriumLayoutCreateRequest, session: AsyncSession, user: User):
+        self._verify_admin(user)
+
+        name = data.name.strip()
+        if not name:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Name cannot be empty."
+            )
+
+        if any(g < 1 or g >= data.seats_per_row for g in data.gaps):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Gaps must be seat numbers between 1 and seats_per_row - 1."
+            )
+
+        existing = await session.execute(select(AuditoriumLayout).where(AuditoriumLayout.name == name))
+        if existing.scalar_one_or_none():
+            logger.warning(f"⚠️ Ya existe la plantilla de sala: {name}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Layout '{name}' already exists."
+            )
+
+        layout = AuditoriumLayout(
+            name=name,
+            rows=data.rows,
+            seats_per_row=data.seats_per_row,
+            gaps=format_gaps(data.gaps)
+        )
+        session.add(layout)
+        await session.commit()
+        await session.refresh(layout)
+
+        logger.info(f"✅ Plantilla de sala creada: {layout.name} ({layout.rows}×{layout.seats_per_row})")
+        return self.to_response(layout)
+
+    async def delete_layout(self, layout_id: int, session: AsyncSession, user: User):
+        self._verify_admin(user)
+
+        layout = await self.get_layout(layout_id, session)
+        await session.delete(layout)
+        await session.commit()
+        logger.warning(f"🗑️ Plantilla de sala eliminada: {layout.name}")
@@ -1,10 +1,11 @@
 from fastapi import HTTPException, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from src.models.user_model import User
+from sqlalchemy.orm import load_only
+from src.models.user_model import User, AUTH_COLUMNS
 from src.schema.requests.login_request import LoginRequest
 from src.schema.responses.token_response import TokenResponse
-from src.utils.password_handler import verify_password
+from src.utils.password_handler import verify_password_async
 from src.utils.login_attempt_handler import (
     check_login_attempts,
     increment_login_attempts,
@@ -23,7 +24,7 @@ class LoginService:
         logger.info(f"🔐 Login attempt for email: {credentials.email}")
 
         # Buscar usuario
-        result = await db.execute(select(User).where(User.email == credentials.email))
+        result = await db.execute(select(User).options(load_only(*AUTH_COLUMNS)).where(User.email == credentials.email))
         user = result.scalar_one_or_none()
 
         if not user:
@@ -37,7 +38,7 @@ class LoginService:
         await check_login_attempts(db, user.id)
 
         # Verificar contraseña
-        if not verify_password(credentials.password, user.password):
+        if not await verify_password_async(credentials.password, user.password):
             logger.warning(f"❌ Login failed - incorrect password for: {credentials.email}")
             await increment_login_attempts(db, user.id)
             raise HTTPException(
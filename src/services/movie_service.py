@@ -1,22 +1,50 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, delete, func, cast, Numeric
+from sqlalchemy.orm import selectinload, load_only
+from sqlalchemy.dialects.mysql import match
+from typing import List, Optional
+from pydantic import TypeAdapter
 from fastapi import HTTPException, status
 from datetime import datetime
+from decimal import Decimal
 
 from src.models.movie_model import Movie
 from src.models.genre_model import Genre
 from src.models.movie_genre_model import MovieGenre
 from src.models.showtime_model import Showtime
+from src.services.showtime_service import ShowtimeService
+from src.cache.catalog_cache import catalog_cache, movie_detail, MOVIES, SHOWTIMES
+from src.cache.catalog_snapshots import catalog_snapshots, MOVIES_PAGE
+from src.cache.movie_search_index import movie_search_index, tokenize
+from src.cache.movie_suggest_index import movie_suggest_index
+from src.cache.genre_movie_index import genre_movie_index, MODE_ALL
+from src.realtime.seat_events import publish_seat_change
+from src.schema.responses.movie_response import MovieResponse, MovieWithShowtimesResponse
 from src.schema.requests.movie_request import MovieCreateRequest, MovieUpdateRequest
 from src.models.user_model import User, RoleEnum
 from src.utils.normalize import normalize_empty_to_none
+from src.services.version_service import VersionService
+from src.utils.pagination import encode_cursor, decode_cursor, DEFAULT_PAGE_SIZE, NEXT_CURSOR_HEADER
+from src.utils.fieldsets import parse_fields
+from src.utils.etag import make_etag
 from src.utils.logger import setup_logger
 from src.config.config import get_settings
 
 _SETTINGS = get_settings()
 logger = setup_logger(__name__, level=_SETTINGS.log_level)
 
+# Campos seleccionables con `fields=`; `genres` y `showtimes` son relaciones
+MOVIE_FIELDS = ("id", "title", "description", "poster_url", "year", "duration_minutes", "director", "genres")
+MOVIE_DETAIL_FIELDS = MOVIE_FIELDS + ("showtimes",)
+MOVIE_RELATIONS = ("genres", "showtimes")
+
+# Espera máxima a la carga inicial del índice de sugerencias
+SUGGEST_READY_TIMEOUT_SECONDS = 5
+# Relevancia de MATCH redondeada a decimales fijos: el cursor la compara por igualdad
+SCORE_DECIMALS = 6
+
+_MOVIE_LIST = TypeAdapter(List[MovieResponse])
+
 class MovieService:
 
     @staticmethod
@@ -28,21 +56,115 @@ class MovieService:
                 detail="Only admins are allowed to perform this action."
             )
 
-    async def get_all_movies(self, session: AsyncSession):
-        logger.debug("📥 Buscando todas las películas con géneros y funciones...")
-        result = await session.execute(
-            select(Movie).options(
-                joinedload(Movie.genres),
-                joinedload(Movie.showtimes)
+    @staticmethod
+    def _after_id(cursor: Optional[str]) -> int:
+        if not cursor:
+            return 0
+        after = decode_cursor(cursor).get("id")
+        if not isinstance(after, int):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor."
             )
-        )
-        movies = result.unique().scalars().all()
+        return after
+
+    @staticmethod
+    def _relation_loader(name: str):
+        if name == "showtimes":
+            # Sólo la cartelera próxima, no el historial completo
+            start, end = ShowtimeService.resolve_window()
+            return selectinload(Movie.showtimes.and_(Showtime.show_datetime.between(start, end)))
+        return selectinload(getattr(Movie, name))
+
+    @classmethod
+    def _load_options(cls, selected: Optional[tuple[str, ...]], relations: tuple[str, ...]) -> list:
+        if selected is None:
+            return [cls._relation_loader(name) for name in relations]
+        # Sólo las columnas pedidas en el SELECT; el resto queda diferido
+        options = [load_only(*[getattr(Movie, name) for name in selected if name not in MOVIE_RELATIONS])]
+        options += [cls._relation_loader(name) for name in relations if name in selected]
+        return options
+
+    @staticmethod
+    def _project(movie: Movie, selected: tuple[str, ...]) -> dict:
+        data = {}
+        for name in selected:
+            if name == "genres":
+                data[name] = [{"id": g.id, "name": g.name} for g in movie.genres]
+            elif name == "showtimes":
+                data[name] = [{"id": st.id, "show_datetime": st.show_datetime} for st in movie.showtimes]
+            else:
+                data[name] = getattr(movie, name)
+        return data
+
+    async def _page(self, session: AsyncSession, stmt, limit: int, fields: Optional[str]) -> tuple[list, Optional[str]]:
+        selected = parse_fields(fields, MOVIE_FIELDS)
+        # Pide una fila de más para saber si hay otra página; los géneros van en un IN aparte
+        result = await session.execute(stmt.limit(limit + 1).options(*self._load_options(selected, ("genres",))))
+        movies = list(result.scalars().all())
+        next_cursor = None
+        if len(movies) > limit:
+            movies = movies[:limit]
+            next_cursor = encode_cursor({"id": movies[-1].id})
+        return self._to_response(movies, selected), next_cursor
+
+    def _to_response(self, movies: list[Movie], selected: Optional[tuple[str, ...]]) -> list:
         for movie in movies:
             normalize_empty_to_none(movie)
+        # Se devuelven modelos de respuesta (no entidades) para poder guardarlos en caché
+        if selected is not None:
+            return [self._project(movie, selected) for movie in movies]
+        return [MovieResponse.model_validate(movie, from_attributes=True) for movie in movies]
+
+    @staticmethod
+    async def list_etag(session: AsyncSession) -> str:
+        return make_etag("movies", *await VersionService.get(session, "movie", "genre"))
+
+    @staticmethod
+    async def detail_etag(movie_id: int, session: AsyncSession) -> str:
+        versions = await VersionService.get(session, "movie", "genre", "showtime")
+        start, end = ShowtimeService.resolve_window()
+        # Con la tabla sin cambios, (cantidad, primera función) identifican el tramo visible de la ventana
+        count, first = (await session.execute(
+            select(func.count(Showtime.id), func.min(Showtime.show_datetime))
+            .where(Showtime.movie_id == movie_id, Showtime.show_datetime.between(start, end))
+        )).one()
+        return make_etag("movie", movie_id, *versions, count, first)
+
+    async def get_all_movies(
+        self,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+        version: Optional[str] = None,
+    ):
+        # La versión (ETag) forma parte de la clave: nunca se sirve un cuerpo más viejo que su ETag
+        return await catalog_cache.get_or_load(
+            MOVIES, ("all", limit, cursor, fields, version),
+            lambda: self._load_all_movies(session, limit, cursor, fields)
+        )
+
+    async def _load_all_movies(self, session: AsyncSession, limit: int, cursor: Optional[str], fields: Optional[str]):
+        after_id = self._after_id(cursor)
+        logger.debug(f"📥 Buscando películas después del ID {after_id} (límite {limit})")
+        movies, next_cursor = await self._page(
+            session,
+            select(Movie).where(Movie.id > after_id).order_by(Movie.id),
+            limit,
+            fields
+        )
         logger.info(f"🎬 {len(movies)} películas encontradas")
-        return movies
+        return movies, next_cursor
 
-    async def get_movie_by_id(self, movie_id: int, session: AsyncSession):
+    async def build_page_snapshot(self, session: AsyncSession) -> tuple[bytes, dict]:
+        # Primera página por defecto: la que abre cualquier cliente
+        movies, next_cursor = await self._load_all_movies(session, DEFAULT_PAGE_SIZE, None, None)
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+        return _MOVIE_LIST.dump_json(movies), headers
+
+    async def get_movie_by_id(self, movie_id: int, session: AsyncSession, fields: Optional[str] = None):
+        selected = parse_fields(fields, MOVIE_DETAIL_FIELDS)
         if movie_id <= 0:
             logger.warning("🚫 ID inválido para película")
             raise HTTPException(
@@ -50,12 +172,9 @@ class MovieService:
                 detail="Invalid movie ID provided."
             )
         result = await session.execute(
-            select(Movie).where(Movie.id == movie_id).options(
-                joinedload(Movie.genres),
-                joinedload(Movie.showtimes)
-            )
+            select(Movie).where(Movie.id == movie_id).options(*self._load_options(selected, MOVIE_RELATIONS))
         )
-        movie = result.unique().scalar_one_or_none()
+        movie = result.scalar_one_or_none()
         if not movie:
             logger.warning(f"❌ Película con ID {movie_id} no encontrada")
             raise HTTPException(
@@ -63,8 +182,19 @@ class MovieService:
                 detail=f"Movie with ID {movie_id} not found."
             )
         normalize_empty_to_none(movie)
+        if selected is not None:
+            return self._project(movie, selected)
         return movie
 
+    async def get_movie_detail(self, movie_id: int, session: AsyncSession, fields: Optional[str] = None, version: Optional[str] = None):
+        async def load():
+            movie = await self.get_movie_by_id(movie_id, session, fields)
+            if fields is not None:
+                return movie
+            return MovieWithShowtimesResponse.model_validate(movie, from_attributes=True)
+
+        return await catalog_cache.get_or_load(movie_detail(movie_id), (fields, version), load)
+
     async def create_movie(self, data: MovieCreateRequest, session: AsyncSession, user: User):
         self.verify_admin(user)
 
@@ -116,10 +246,16 @@ class MovieService:
                 )
             session.add(MovieGenre(movie_id=movie.id, genre_id=genre_id))
 
+        await VersionService.bump(session, "movie")
         await session.commit()
-        await session.refresh(movie)
-        normalize_empty_to_none(movie)
-        return movie
+        catalog_cache.invalidate(MOVIES)
+        movie_search_index.upsert(movie.id, movie.title, movie.director, movie.description)
+        movie_suggest_index.upsert(movie.id, movie.title, movie.director, movie.year)
+        genre_movie_index.set_movie(movie.id, data.genre_ids)
+        # Recarga con los géneros en un SELECT aparte (el lazy load no es posible en async)
+        movie_id = movie.id
+        session.expire(movie)
+        return await self.get_movie_by_id(movie_id, session)
 
     async def update_movie(self, movie_id: int, data: MovieUpdateRequest, session: AsyncSession, user: User):
         self.verify_admin(user)
@@ -162,38 +298,195 @@ class MovieService:
                     )
                 session.add(MovieGenre(movie_id=movie.id, genre_id=genre_id))
 
+        await VersionService.bump(session, "movie")
         await session.commit()
-        await session.refresh(movie)
-        normalize_empty_to_none(movie)
-        return movie
+        # La cartelera agrupada repite los datos de la película
+        catalog_cache.invalidate(MOVIES, movie_detail(movie_id), SHOWTIMES)
+        movie_search_index.upsert(movie.id, movie.title, movie.director, movie.description)
+        movie_suggest_index.upsert(movie.id, movie.title, movie.director, movie.year)
+        if data.genre_ids is not None:
+            genre_movie_index.set_movie(movie.id, data.genre_ids)
+        # Recarga con los géneros en un SELECT aparte (el lazy load no es posible en async)
+        movie_id = movie.id
+        session.expire(movie)
+        return await self.get_movie_by_id(movie_id, session)
 
     async def delete_movie(self, movie_id: int, session: AsyncSession, user: User):
         self.verify_admin(user)
         logger.warning(f"🗑️ Eliminando película ID {movie_id}")
         movie = await self.get_movie_by_id(movie_id, session)
+        # Todas las funciones, no sólo la cartelera próxima que carga get_movie_by_id
+        showtime_ids = list((await session.execute(select(Showtime.id).where(Showtime.movie_id == movie_id))).scalars())
+        await ShowtimeService.ensure_unsold(showtime_ids, session)
         await session.delete(movie)
-        await session.commit()
+        await VersionService.bump(session, "movie", "showtime")
+        await ShowtimeService.commit_delete(session)
+        for showtime_id in showtime_ids:
+            publish_seat_change(showtime_id, invalidate=True)
+        catalog_cache.invalidate(MOVIES, movie_detail(movie_id), SHOWTIMES)
+        movie_search_index.remove(movie_id)
+        movie_suggest_index.remove(movie_id)
+        genre_movie_index.remove_movie(movie_id)
 
-    async def get_movies_by_genre(self, genre_id: int, session: AsyncSession):
+    async def get_movies_by_genre(
+        self,
+        genre_id: int,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+        version: Optional[str] = None,
+    ):
         if genre_id <= 0:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Invalid genre ID provided."
             )
 
-        stmt = (
+        return await catalog_cache.get_or_load(
+            MOVIES, ("genre", genre_id, limit, cursor, fields, version),
+            lambda: self._load_movies_by_genres([genre_id], MODE_ALL, session, limit, cursor, fields)
+        )
+
+    @staticmethod
+    def _parse_genre_ids(genres: str) -> list[int]:
+        try:
+            genre_ids = [int(value) for value in genres.split(",") if value.strip()]
+        except ValueError:
+            genre_ids = []
+        if not genre_ids or any(genre_id <= 0 for genre_id in genre_ids):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Invalid genre ID provided."
+            )
+        return sorted(set(genre_ids))
+
+    async def get_movies_by_genres(
+        self,
+        genres: str,
+        mode: str,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+        version: Optional[str] = None,
+    ):
+        genre_ids = self._parse_genre_ids(genres)
+        return await catalog_cache.get_or_load(
+            MOVIES, ("genres", tuple(genre_ids), mode, limit, cursor, fields, version),
+            lambda: self._load_movies_by_genres(genre_ids, mode, session, limit, cursor, fields)
+        )
+
+    async def _load_movies_by_genres(
+        self,
+        genre_ids: list[int],
+        mode: str,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str],
+        fields: Optional[str],
+    ) -> tuple[list, Optional[str]]:
+        selected = parse_fields(fields, MOVIE_FIELDS)
+        after = self._after_id(cursor)
+        # Los IDs salen del índice en memoria; la base sólo carga las filas de la página
+        await genre_movie_index.ensure_built(session)
+        movie_ids = genre_movie_index.movie_ids(genre_ids, mode, limit + 1, after)
+        next_cursor = None
+        if len(movie_ids) > limit:
+            movie_ids = movie_ids[:limit]
+            next_cursor = encode_cursor({"id": movie_ids[-1]})
+        if not movie_ids:
+            return [], None
+
+        result = await session.execute(
             select(Movie)
-            .join(Movie.genres)
-            .where(Genre.id == genre_id)
-            .options(
-                joinedload(Movie.genres),
-                joinedload(Movie.showtimes)
+            .where(Movie.id.in_(movie_ids))
+            .order_by(Movie.id)
+            .options(*self._load_options(selected, ("genres",)))
+        )
+        movies = list(result.scalars().all())
+        logger.info(f"🎯 {len(movies)} películas de los géneros {genre_ids} ({mode})")
+        return self._to_response(movies, selected), next_cursor
+
+    @staticmethod
+    async def suggest_movies(prefix: str, limit: int) -> list[dict]:
+        # Sólo memoria: ninguna consulta a la base por tecla
+        if not await movie_suggest_index.wait_ready(SUGGEST_READY_TIMEOUT_SECONDS):
+            logger.warning("⏳ Índice de sugerencias todavía cargando")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Suggestions are not available yet."
+            )
+        return movie_suggest_index.suggest(prefix, limit)
+
+    @staticmethod
+    def _search_after(cursor: Optional[str]) -> Optional[tuple[float, int]]:
+        if not cursor:
+            return None
+        values = decode_cursor(cursor)
+        score, movie_id = values.get("score"), values.get("id")
+        if not isinstance(score, (int, float)) or not isinstance(movie_id, int):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor."
             )
+        return float(score), movie_id
+
+    @staticmethod
+    async def _fulltext_search(session: AsyncSession, terms: list[str], limit: int, after: Optional[tuple[float, int]]) -> list[tuple[int, float]]:
+        # `+` en cada término: todos deben aparecer, igual que en el índice en memoria
+        score = match(
+            Movie.title, Movie.director, Movie.description,
+            against=" ".join(f"+{term}" for term in dict.fromkeys(terms))
+        ).in_boolean_mode()
+        # Se ordena y pagina por el DECIMAL, no por el float: el valor del cursor vuelve idéntico
+        rounded = cast(score, Numeric(20, SCORE_DECIMALS))
+        stmt = select(Movie.id, rounded.label("score")).where(score > 0)
+        if after is not None:
+            after_score = Decimal(repr(after[0])).quantize(Decimal(1).scaleb(-SCORE_DECIMALS))
+            stmt = stmt.where((rounded < after_score) | ((rounded == after_score) & (Movie.id > after[1])))
+        result = await session.execute(stmt.order_by(rounded.desc(), Movie.id).limit(limit))
+        return [(row.id, float(row.score)) for row in result]
+
+    async def search_movies(
+        self,
+        q: str,
+        session: AsyncSession,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> tuple[list, Optional[str]]:
+        """Movies matching every term of `q`, by relevance; the cursor is the (score, id) of the last row."""
+        selected = parse_fields(fields, MOVIE_FIELDS)
+        after = self._search_after(cursor)
+        terms = tokenize(q)
+        if not terms:
+            logger.info(f"🔎 Búsqueda sin términos indexables: {q!r}")
+            return [], None
+
+        if session.get_bind().dialect.name == "mysql":
+            ranked = await self._fulltext_search(session, terms, limit + 1, after)
+        else:
+            await movie_search_index.ensure_built(session)
+            ranked = movie_search_index.search(terms, limit + 1, after)
+
+        next_cursor = None
+        if len(ranked) > limit:
+            ranked = ranked[:limit]
+            last_id, last_score = ranked[-1]
+            next_cursor = encode_cursor({"score": last_score, "id": last_id})
+        if not ranked:
+            return [], None
+
+        result = await session.execute(
+            select(Movie)
+            .where(Movie.id.in_([movie_id for movie_id, _ in ranked]))
+            .options(*self._load_options(selected, ("genres",)))
         )
-        result = await session.execute(stmt)
-        movies = result.unique().scalars().all()
+        by_id = {movie.id: movie for movie in result.scalars().all()}
+        movies = [by_id[movie_id] for movie_id, _ in ranked if movie_id in by_id]
+        logger.info(f"🔎 {len(movies)} películas para la búsqueda {q!r}")
+        return self._to_response(movies, selected), next_cursor
 
-        for movie in movies:
-            normalize_empty_to_none(movie)
 
-        return movies
+catalog_snapshots.register(MOVIES_PAGE, MovieService.list_etag, MovieService().build_page_snapshot)
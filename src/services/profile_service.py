@@ -2,7 +2,7 @@ from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from src.models.user_model import User
-from src.utils.password_handler import hash_password
+from src.utils.password_handler import hash_password_async
 from src.schema.requests.update_profile_request import UpdateProfileRequest
 from src.utils.logger import setup_logger
 from src.config.config import get_settings
@@ -27,7 +27,7 @@ class ProfileService:
             "country": user.country,
             "country_code": user.country_code,
             "phone_number": user.phone_number,
-            "profile_photo_url": f"/profile/photo/{user.id}" if user.profile_photo else None
+            "profile_photo_url": f"/profile/photo/{user.id}" if user.has_profile_photo else None
         }
 
     async def update_profile(self, user: User, data: UpdateProfileRequest, db: AsyncSession):
@@ -46,7 +46,7 @@ class ProfileService:
 
             # Verifica si otro usuario ya tiene este teléfono
             result = await db.execute(
-                select(User).where(
+                select(User.id).where(
                     User.country_code == user.country_code,
                     User.phone_number == data.phone_number,
                     User.id != user.id
@@ -63,7 +63,7 @@ class ProfileService:
 
         if data.password:
             validate_password_strength(data.password)
-            user.password = hash_password(data.password)
+            user.password = await hash_password_async(data.password)
 
         if data.profile_photo:
             data.profile_photo.file.seek(0)  # 🔁 asegura que está en posición inicial
@@ -87,5 +87,5 @@ class ProfileService:
             "phone_number": user.phone_number,
             "country": user.country,
             "country_code": user.country_code,
-            "profile_photo_url": f"/profile/photo/{user.id}" if user.profile_photo else None
+            "profile_photo_url": f"/profile/photo/{user.id}" if user.has_profile_photo else None
         }
@@ -1,9 +1,12 @@
 from fastapi import HTTPException, status, Response, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert
-from datetime import datetime, timezone
-from src.models.user_model import User
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
+from datetime import datetime
+from src.models.user_model import User, AUTH_COLUMNS
 from src.models.revoked_token_jti_model import RevokedTokenJTI
+from src.cache.revocation_cache import revocation_cache
 from src.security.jwt_handler import decode_token, create_access_token, create_refresh_token
 from src.config.config import get_settings
 from src.utils.logger import setup_logger
@@ -29,23 +32,32 @@ class RefreshTokenService:
         if not user_id or not jti or not exp:
             raise HTTPException(status_code=401, detail="Invalid refresh token payload")
 
-        # Verificar si ya fue revocado
-        result = await db.execute(select(RevokedTokenJTI).where(RevokedTokenJTI.jti == jti))
-        if result.scalar_one_or_none():
+        # Atajo en memoria; la verificación definitiva es el INSERT de abajo
+        if await revocation_cache.is_revoked(jti, db):
             raise HTTPException(status_code=401, detail="Refresh token already used")
 
         # Verificar existencia de usuario
-        result = await db.execute(select(User).where(User.id == int(user_id)))
+        result = await db.execute(select(User).options(load_only(*AUTH_COLUMNS)).where(User.id == int(user_id)))
         user = result.scalar_one_or_none()
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
 
-        # Revocar token usado
-        await db.execute(insert(RevokedTokenJTI).values(
-            user_id=user.id,
-            jti=jti,
-            exp=datetime.fromtimestamp(exp, tz=timezone.utc)
-        ))
+        # Revocar token usado: el UNIQUE de jti lo hace de un solo uso aunque otro worker
+        # ya lo haya revocado o dos refresh con la misma cookie corran a la vez
+        expires_at = datetime.utcfromtimestamp(exp)
+        try:
+            await db.execute(insert(RevokedTokenJTI).values(
+                user_id=user.id,
+                jti=jti,
+                exp=expires_at
+            ))
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            revocation_cache.revoke(jti, expires_at)
+            logger.warning(f"🚫 Refresh token reused — JTI: {jti}")
+            raise HTTPException(status_code=401, detail="Refresh token already used")
+        revocation_cache.revoke(jti, expires_at)
 
         # Crear tokens nuevos
         access_token = create_access_token({"sub": str(user.id)})
@@ -96,9 +108,15 @@ class RefreshTokenService:
         exp = payload.get("exp")
 
         if jti and exp:
-            await db.execute(insert(RevokedTokenJTI).values(
-                user_id=user_id,
-                jti=jti,
-                exp=datetime.fromtimestamp(exp, tz=timezone.utc)
-            ))
-            await db.commit()
\ No newline at end of file
+            expires_at = datetime.utcfromtimestamp(exp)
+            try:
+                await db.execute(insert(RevokedTokenJTI).values(
+                    user_id=user_id,
+                    jti=jti,
+                    exp=expires_at
+                ))
+                await db.commit()
+            except IntegrityError:
+                # Ya estaba revocado (rotado antes o en otro worker): no hay nada más que hacer
+                await db.rollback()
+            revocation_cache.revoke(jti, expires_at)
\ No newline at end of file
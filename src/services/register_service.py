@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from src.models.user_model import User
 from src.schema.requests.register_request import RegisterRequest
-from src.utils.password_handler import hash_password
+from src.utils.password_handler import hash_password_async
 from src.utils.logger import setup_logger
 from src.config.config import get_settings
 from src.utils.validators import (
@@ -27,7 +27,7 @@ class RegisterService:
         validate_password_strength(register_data.password)
 
         # ❌ Email ya registrado
-        result_email = await db.execute(select(User).where(User.email == register_data.email))
+        result_email = await db.execute(select(User.id).where(User.email == register_data.email))
         if result_email.scalar_one_or_none():
             logger.warning(f"❌ Email already registered: {register_data.email}")
             raise HTTPException(
@@ -37,7 +37,7 @@ class RegisterService:
 
         # ❌ Teléfono ya registrado
         result_phone = await db.execute(
-            select(User).where(
+            select(User.id).where(
                 User.country_code == register_data.country_code,
                 User.phone_number == register_data.phone_number
             )
@@ -49,6 +49,9 @@ class RegisterService:
                 detail="Phone number is already registered."
             )
 
+        # Fuera del try: un 503 por cola llena no debe convertirse en 500
+        hashed_password = await hash_password_async(register_data.password)
+
         # ✅ Crear usuario
         try:
             new_user = User(
@@ -56,7 +59,7 @@ class RegisterService:
                 lastname=register_data.lastname,
                 nickname=register_data.nickname,
                 email=register_data.email,
-                password=hash_password(register_data.password),
+                password=hashed_password,
                 country_code=register_data.country_code,
                 phone_number=register_data.phone_number,
                 country=register_data.country
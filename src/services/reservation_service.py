@@ -0,0 +1,252 @@
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert, delete, exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from datetime import datetime
+
+from src.models.reservation_model import Reservation
+from src.models.seat_model import Seat
+from src.models.seat_hold_model import SeatHold
+from src.models.showtime_model import Showtime
+from src.models.user_model import User
+from src.schema.requests.reservation_request import ReservationCreateRequest, BestAvailableRequest
+from src.schema.responses.reservation_response import ReservationResponse, ReservedSeatResponse
+from src.cache.seat_map_cache import seat_map_cache
+from src.realtime.seat_events import publish_seat_change
+from src.utils.seat_allocator import find_best_seats
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+# Reintentos de mejor ubicación cuando otro comprador gana alguno de los asientos elegidos
+BEST_AVAILABLE_ATTEMPTS = 3
+
+class ReservationService:
+    """
+    Seat booking engine.
+
+    Seats are taken with a single conditional UPDATE (`is_reserved = false`
+    in the WHERE clause) over the sorted seat IDs, so concurrent buyers
+    serialize on the seat rows themselves: the first one flips the flag and
+    every other one matches fewer rows than requested and rolls back with
+    409. Seats under an active hold of another user are skipped the same way.
+    Every write path locks seat rows first, then the showtime row (its
+    availability counters), then reservation rows, then seat holds, which
+    keeps the lock order fixed and avoids deadlocks. The counter goes before
+    the reservation INSERT because that INSERT takes a shared lock on the
+    showtime row for its foreign key check.
+    """
+
+    @staticmethod
+    async def _get_bookable_showtime(showtime_id: int, session: AsyncSession) -> Showtime:
+        result = await session.execute(
+            select(Showtime).where(Showtime.id == showtime_id).options(joinedload(Showtime.movie))
+        )
+        showtime = result.scalar_one_or_none()
+        if not showtime:
+            logger.warning(f"⚠️ Función no encontrada al reservar: ID {showtime_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Showtime ID {showtime_id} not found."
+            )
+        if showtime.show_datetime <= datetime.now():
+            logger.warning(f"⛔ Intento de reservar una función pasada: ID {showtime_id}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Reservations are closed for this showtime."
+            )
+        return showtime
+
+    @staticmethod
+    async def _adjust_available(session: AsyncSession, showtime_id: int, delta: int):
+        await session.execute(
+            update(Showtime)
+            .where(Showtime.id == showtime_id)
+            .values(
+                seats_available=Showtime.seats_available + delta,
+                seat_version=Showtime.seat_version + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def _bump_seat_version(session: AsyncSession, showtime_ids: list[int]):
+        # Cambios que no mueven el contador (retenciones): sólo la versión del mapa
+        await session.execute(
+            update(Showtime)
+            .where(Showtime.id.in_(sorted(showtime_ids)))
+            .values(seat_version=Showtime.seat_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def _book_seats(session: AsyncSession, user_id: int, showtime_id: int, seat_ids: list[int]) -> list[ReservedSeatResponse]:
+        # Update condicional: sólo reserva si el asiento sigue libre y nadie más lo retiene
+        held_by_other = exists().where(
+            SeatHold.seat_id == Seat.id,
+            SeatHold.user_id != user_id,
+            SeatHold.expires_at > datetime.now(),
+        )
+        result = await session.execute(
+            update(Seat)
+            .where(
+                Seat.showtime_id == showtime_id,
+                Seat.id.in_(seat_ids),
+                Seat.is_reserved == False,
+                ~held_by_other,
+            )
+            .values(is_reserved=True)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != len(seat_ids):
+            await session.rollback()
+            logger.info(f"🪑 Conflicto de asientos en función {showtime_id}: {len(seat_ids) - result.rowcount} no disponibles")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="One or more of the selected seats are no longer available."
+            )
+
+        await ReservationService._adjust_available(session, showtime_id, -len(seat_ids))
+        try:
+            await session.execute(
+                insert(Reservation).values([
+                    {"user_id": user_id, "showtime_id": showtime_id, "seat_id": seat_id}
+                    for seat_id in seat_ids
+                ])
+            )
+        except IntegrityError:
+            await session.rollback()
+            logger.warning(f"🪑 Reserva duplicada detectada por constraint en función {showtime_id}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="One or more of the selected seats are no longer available."
+            )
+
+        rows = await session.execute(
+            select(Reservation.id, Reservation.seat_id, Seat.seat_number)
+            .join(Seat, Seat.id == Reservation.seat_id)
+            .where(Reservation.seat_id.in_(seat_ids))
+            .order_by(Reservation.seat_id)
+        )
+        return [
+            ReservedSeatResponse(reservation_id=row.id, seat_id=row.seat_id, seat_number=row.seat_number)
+            for row in rows
+        ]
+
+    async def create_reservation(self, data: ReservationCreateRequest, session: AsyncSession, user: User) -> ReservationResponse:
+        seat_ids = sorted(set(data.seat_ids))
+        showtime = await self._get_bookable_showtime(data.showtime_id, session)
+
+        logger.info(f"🎟️ Usuario {user.id} reservando {len(seat_ids)} asientos en función {showtime.id}")
+        seats = await self._book_seats(session, user.id, showtime.id, seat_ids)
+        await session.commit()
+        publish_seat_change(showtime.id, reserved=seat_ids)
+
+        logger.info(f"✅ Reserva confirmada para usuario {user.id} en función {showtime.id}: {[s.seat_number for s in seats]}")
+        return ReservationResponse(
+            showtime_id=showtime.id,
+            show_datetime=showtime.show_datetime,
+            movie_id=showtime.movie.id,
+            movie_title=showtime.movie.title,
+            seats=seats
+        )
+
+    async def reserve_best_available(self, data: BestAvailableRequest, session: AsyncSession, user: User) -> ReservationResponse:
+        showtime = await self._get_bookable_showtime(data.showtime_id, session)
+        # El rollback de un conflicto expira la entidad: se copian los datos antes
+        showtime_id, show_datetime = showtime.id, showtime.show_datetime
+        movie_id, movie_title = showtime.movie.id, showtime.movie.title
+
+        for attempt in range(1, BEST_AVAILABLE_ATTEMPTS + 1):
+            seat_map = await seat_map_cache.get(showtime_id, session)
+            seat_ids = find_best_seats(seat_map, data.quantity) if seat_map else None
+            if not seat_ids:
+                logger.info(f"🪑 Sin {data.quantity} asientos contiguos en función {showtime_id}")
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Not enough adjacent seats available."
+                )
+            try:
+                seats = await self._book_seats(session, user.id, showtime_id, seat_ids)
+            except HTTPException as e:
+                if e.status_code != status.HTTP_409_CONFLICT or attempt == BEST_AVAILABLE_ATTEMPTS:
+                    raise
+                # El mapa en caché estaba desactualizado (otro worker vendió): recargar y reintentar
+                seat_map_cache.invalidate(showtime_id)
+                continue
+            await session.commit()
+            publish_seat_change(showtime_id, reserved=seat_ids)
+
+            logger.info(f"✅ Mejor ubicación para usuario {user.id} en función {showtime_id}: {[s.seat_number for s in seats]}")
+            return ReservationResponse(
+                showtime_id=showtime_id,
+                show_datetime=show_datetime,
+                movie_id=movie_id,
+                movie_title=movie_title,
+                seats=seats
+            )
+
+    async def get_user_reservations(self, session: AsyncSession, user: User) -> list[ReservationResponse]:
+        result = await session.execute(
+            select(Reservation)
+            .where(Reservation.user_id == user.id)
+            .options(
+                joinedload(Reservation.seat),
+                joinedload(Reservation.showtime).joinedload(Showtime.movie)
+            )
+            .order_by(Reservation.showtime_id, Reservation.seat_id)
+        )
+        reservations = result.scalars().all()
+
+        grouped: dict[int, ReservationResponse] = {}
+        for r in reservations:
+            st = r.showtime
+            if st.id not in grouped:
+                grouped[st.id] = ReservationResponse(
+                    showtime_id=st.id,
+                    show_datetime=st.show_datetime,
+                    movie_id=st.movie.id,
+                    movie_title=st.movie.title,
+                    seats=[]
+                )
+            grouped[st.id].seats.append(
+                ReservedSeatResponse(reservation_id=r.id, seat_id=r.seat_id, seat_number=r.seat.seat_number)
+            )
+
+        logger.info(f"📋 Usuario {user.id} tiene {len(reservations)} asientos reservados en {len(grouped)} funciones")
+        return list(grouped.values())
+
+    async def cancel_reservation(self, reservation_id: int, session: AsyncSession, user: User):
+        result = await session.execute(
+            select(Reservation)
+            .where(Reservation.id == reservation_id, Reservation.user_id == user.id)
+            .options(joinedload(Reservation.showtime))
+        )
+        reservation = result.scalar_one_or_none()
+        if not reservation:
+            logger.warning(f"❌ Reserva {reservation_id} no encontrada para usuario {user.id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Reservation ID {reservation_id} not found."
+            )
+        if reservation.showtime.show_datetime <= datetime.now():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Reservations are closed for this showtime."
+            )
+
+        # Mismo orden de locks que la reserva: asiento, contador de la función, reserva
+        await session.execute(
+            update(Seat)
+            .where(Seat.id == reservation.seat_id)
+            .values(is_reserved=False)
+            .execution_options(synchronize_session=False)
+        )
+        await self._adjust_available(session, reservation.showtime_id, 1)
+        await session.execute(delete(Reservation).where(Reservation.id == reservation_id))
+        await session.commit()
+        publish_seat_change(reservation.showtime_id, released=[reservation.seat_id])
+        logger.info(f"🗑️ Reserva {reservation_id} cancelada por usuario {user.id}")
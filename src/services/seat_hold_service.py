@@ -0,0 +1,191 @@
+import uuid
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, func
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.models.seat_model import Seat
+from src.models.seat_hold_model import SeatHold
+from src.models.user_model import User
+from src.schema.requests.reservation_request import SeatHoldCreateRequest
+from src.schema.responses.reservation_response import (
+    ReservationResponse,
+    SeatHoldResponse,
+    HeldSeatResponse
+)
+from src.services.reservation_service import ReservationService
+from src.realtime.seat_events import publish_seat_change
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+class SeatHoldService:
+    """
+    Time-limited seat holds stored in `seat_hold`, so every worker and node
+    sees the same holds. A hold never keeps a transaction open: it is a row
+    with an indexed `expires_at` that turns into reservations on confirm and
+    is otherwise released by the background sweeper.
+    """
+
+    async def hold_seats(self, data: SeatHoldCreateRequest, session: AsyncSession, user: User) -> SeatHoldResponse:
+        seat_ids = sorted(set(data.seat_ids))
+        showtime = await ReservationService._get_bookable_showtime(data.showtime_id, session)
+        now = datetime.now()
+
+        # Locks de asientos en orden fijo (ids ordenados), igual que la reserva directa
+        result = await session.execute(
+            select(Seat.id, Seat.seat_number)
+            .where(
+                Seat.showtime_id == showtime.id,
+                Seat.id.in_(seat_ids),
+                Seat.is_reserved == False,
+            )
+            .order_by(Seat.id)
+            .with_for_update()
+        )
+        seats = result.all()
+        if len(seats) != len(seat_ids):
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="One or more of the selected seats are no longer available."
+            )
+
+        await ReservationService._bump_seat_version(session, [showtime.id])
+
+        # Libera en línea las retenciones vencidas de estos asientos
+        await session.execute(
+            delete(SeatHold)
+            .where(SeatHold.seat_id.in_(seat_ids), SeatHold.expires_at <= now)
+            .execution_options(synchronize_session=False)
+        )
+
+        token = str(uuid.uuid4())
+        expires_at = (now + timedelta(seconds=_SETTINGS.seat_hold_ttl_seconds)).replace(microsecond=0)
+        try:
+            await session.execute(
+                insert(SeatHold).values([
+                    {
+                        "hold_token": token,
+                        "user_id": user.id,
+                        "showtime_id": showtime.id,
+                        "seat_id": seat_id,
+                        "expires_at": expires_at,
+                    }
+                    for seat_id in seat_ids
+                ])
+            )
+        except IntegrityError:
+            await session.rollback()
+            logger.info(f"🪑 Asientos ya retenidos por otro usuario en función {showtime.id}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="One or more of the selected seats are no longer available."
+            )
+        await session.commit()
+        publish_seat_change(showtime.id, held=seat_ids, expires_at=expires_at)
+
+        logger.info(f"⏳ Usuario {user.id} retiene {len(seat_ids)} asientos en función {showtime.id} hasta {expires_at}")
+        return SeatHoldResponse(
+            hold_token=token,
+            showtime_id=showtime.id,
+            expires_at=expires_at,
+            seats=[HeldSeatResponse(seat_id=s.id, seat_number=s.seat_number) for s in seats]
+        )
+
+    async def confirm_hold(self, hold_token: str, session: AsyncSession, user: User) -> ReservationResponse:
+        result = await session.execute(
+            select(SeatHold.showtime_id, SeatHold.seat_id)
+            .where(
+                SeatHold.hold_token == hold_token,
+                SeatHold.user_id == user.id,
+                SeatHold.expires_at > datetime.now(),
+            )
+        )
+        held = result.all()
+        if not held:
+            logger.warning(f"❌ Retención {hold_token} no encontrada o vencida para usuario {user.id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Seat hold not found or expired."
+            )
+
+        showtime = await ReservationService._get_bookable_showtime(held[0].showtime_id, session)
+        seat_ids = sorted(h.seat_id for h in held)
+
+        seats = await ReservationService._book_seats(session, user.id, showtime.id, seat_ids)
+        await session.execute(
+            delete(SeatHold)
+            .where(SeatHold.hold_token == hold_token)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        publish_seat_change(showtime.id, reserved=seat_ids)
+
+        logger.info(f"✅ Retención {hold_token} confirmada: {len(seats)} asientos para usuario {user.id}")
+        return ReservationResponse(
+            showtime_id=showtime.id,
+            show_datetime=showtime.show_datetime,
+            movie_id=showtime.movie.id,
+            movie_title=showtime.movie.title,
+            seats=seats
+        )
+
+    async def release_hold(self, hold_token: str, session: AsyncSession, user: User):
+        result = await session.execute(
+            select(SeatHold.id, SeatHold.showtime_id, SeatHold.seat_id)
+            .where(SeatHold.hold_token == hold_token, SeatHold.user_id == user.id)
+        )
+        held = result.all()
+        if not held:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Seat hold not found or expired."
+            )
+
+        # Mismo orden de locks que la retención: función antes que seat_hold
+        await ReservationService._bump_seat_version(session, [held[0].showtime_id])
+        await session.execute(
+            delete(SeatHold)
+            .where(SeatHold.id.in_([h.id for h in held]))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        publish_seat_change(held[0].showtime_id, unheld=[h.seat_id for h in held])
+        logger.info(f"↩️ Retención {hold_token} liberada por usuario {user.id}")
+
+    @staticmethod
+    async def release_expired(session: AsyncSession, batch_size: int) -> int:
+        # Recorre sólo el rango vencido del índice de expires_at
+        result = await session.execute(
+            select(SeatHold.id, SeatHold.showtime_id, SeatHold.seat_id)
+            .where(SeatHold.expires_at <= datetime.now())
+            .order_by(SeatHold.expires_at)
+            .limit(batch_size)
+        )
+        expired = result.all()
+        if not expired:
+            return 0
+
+        await ReservationService._bump_seat_version(session, list({h.showtime_id for h in expired}))
+        await session.execute(
+            delete(SeatHold)
+            .where(SeatHold.id.in_([h.id for h in expired]))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+        by_showtime: dict[int, list[int]] = {}
+        for h in expired:
+            by_showtime.setdefault(h.showtime_id, []).append(h.seat_id)
+        for showtime_id, seat_ids in by_showtime.items():
+            publish_seat_change(showtime_id, unheld=seat_ids)
+        return len(expired)
+
+    @staticmethod
+    async def next_expiry(session: AsyncSession) -> Optional[datetime]:
+        return await session.scalar(select(func.min(SeatHold.expires_at)))
@@ -1,23 +1,52 @@
+import json
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, insert, exists, func, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, load_only, contains_eager
 from datetime import date, time, datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, List, Optional
+from pydantic import TypeAdapter
 
 from src.models.showtime_model import Showtime
 from src.models.movie_model import Movie
+from src.models.movie_genre_model import MovieGenre
 from src.models.seat_model import Seat
+from src.models.reservation_model import Reservation
 from src.models.user_model import User, RoleEnum
 from src.utils.logger import setup_logger
 from src.config.config import get_settings
 from src.utils.normalize import normalize_empty_to_none
-from src.schema.requests.showtime_request import ShowtimeCreateRequest, ShowtimeUpdateRequest
-from src.schema.responses.showtime_response import MovieWithShowtimesGroupedResponse, ShowtimeBriefResponse
+from src.services.version_service import VersionService
+from src.utils.fieldsets import parse_fields, pick
+from src.utils.etag import make_etag
+from src.utils.pagination import encode_cursor, decode_cursor
+from src.schema.requests.showtime_request import ShowtimeCreateRequest, ShowtimeUpdateRequest, ShowtimeScheduleRequest
+from src.schema.responses.showtime_response import (
+    MovieWithShowtimesGroupedResponse,
+    ShowtimeBriefResponse,
+    ShowtimeScheduleResponse
+)
+from src.cache.seat_map_cache import seat_map_cache
+from src.cache.catalog_cache import catalog_cache, movie_detail, SHOWTIMES
+from src.cache.catalog_snapshots import catalog_snapshots, SHOWTIMES_LISTING
+from src.realtime.seat_events import publish_seat_change, seat_event_hub, seat_event_stream
+from src.services.layout_service import LayoutService
+from src.utils.seat_layout import generate_seat_numbers, DEFAULT_ROWS, DEFAULT_SEATS_PER_ROW
 
 _SETTINGS = get_settings()
 logger = setup_logger(__name__, level=_SETTINGS.log_level)
 
+# Filas por INSERT multi-fila de asientos (holgado para max_allowed_packet y el límite de parámetros de SQLite)
+SEAT_INSERT_BATCH_SIZE = 3000
+MAX_SCHEDULE_SLOTS = 1000
+
+# Campos seleccionables con `fields=` en los listados agrupados y en el detalle
+GROUPED_FIELDS = ("id", "title", "description", "poster_url", "duration_minutes", "director", "showtimes")
+DETAIL_FIELDS = ("id", "show_datetime", "movie", "seats")
+
+_GROUPED_LIST = TypeAdapter(List[MovieWithShowtimesGroupedResponse])
+
 class ShowtimeService:
 
     @staticmethod
@@ -30,36 +59,185 @@ class ShowtimeService:
             )
 
     @staticmethod
-    async def get_all_showtimes(session: AsyncSession):
-        logger.info("📺 Recuperando todas las funciones agrupadas por película")
-        result = await session.execute(
-            select(Movie).options(joinedload(Movie.showtimes))
+    def _brief(showtime) -> ShowtimeBriefResponse:
+        return ShowtimeBriefResponse(
+            id=showtime.id,
+            show_datetime=showtime.show_datetime,
+            seats_total=showtime.seats_total,
+            seats_available=showtime.seats_available,
+            sold_out=showtime.seats_total > 0 and showtime.seats_available == 0
         )
+
+    @staticmethod
+    async def _insert_seats(session: AsyncSession, showtime_ids: list[int], rows: int, seats_per_row: int) -> int:
+        seat_numbers = generate_seat_numbers(rows, seats_per_row)
+        batch: list[dict] = []
+        total = 0
+        for showtime_id in showtime_ids:
+            batch.extend(
+                {"showtime_id": showtime_id, "seat_number": seat_number, "is_reserved": False}
+                for seat_number in seat_numbers
+            )
+            if len(batch) >= SEAT_INSERT_BATCH_SIZE:
+                await session.execute(insert(Seat).values(batch))
+                total += len(batch)
+                batch = []
+        if batch:
+            await session.execute(insert(Seat).values(batch))
+            total += len(batch)
+        return total
+
+    @staticmethod
+    def resolve_window(start: Optional[datetime] = None, end: Optional[datetime] = None) -> tuple[datetime, datetime]:
+        """Listing window; defaults to now .. now + `showtime_window_days`."""
+        # Las funciones se guardan en hora local sin zona
+        if start and start.tzinfo:
+            start = start.astimezone().replace(tzinfo=None)
+        if end and end.tzinfo:
+            end = end.astimezone().replace(tzinfo=None)
+        start = start or datetime.now()
+        end = end or start + timedelta(days=_SETTINGS.showtime_window_days)
+        if end <= start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="End of the window must be after its start."
+            )
+        if end - start > timedelta(days=_SETTINGS.showtime_max_window_days):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Window cannot exceed {_SETTINGS.showtime_max_window_days} days."
+            )
+        return start, end
+
+    @staticmethod
+    async def listing_etag(session: AsyncSession, start: Optional[datetime] = None, end: Optional[datetime] = None) -> str:
+        start, end = ShowtimeService.resolve_window(start, end)
+        versions = await VersionService.get(session, "showtime", "movie")
+        # La suma de seat_version sube con cada cambio de disponibilidad dentro de la ventana
+        count, first, seat_versions = (await session.execute(
+            select(
+                func.count(Showtime.id),
+                func.min(Showtime.show_datetime),
+                func.coalesce(func.sum(Showtime.seat_version), 0),
+            ).where(Showtime.show_datetime.between(start, end))
+        )).one()
+        return make_etag("showtimes", *versions, count, first, seat_versions)
+
+    @staticmethod
+    async def detail_etag(showtime_id: int, session: AsyncSession) -> tuple[str, int]:
+        """ETag of the seat map and the `seat_version` it was computed from."""
+        seat_version = await session.scalar(select(Showtime.seat_version).where(Showtime.id == showtime_id))
+        if seat_version is None:
+            logger.warning(f"⚠️ Función no encontrada: ID {showtime_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Showtime ID {showtime_id} not found."
+            )
+        versions = await VersionService.get(session, "showtime", "movie")
+        return make_etag("showtime", showtime_id, seat_version, *versions), seat_version
+
+    @staticmethod
+    async def get_all_showtimes(
+        session: AsyncSession,
+        fields: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        version: Optional[str] = None,
+    ):
+        return await catalog_cache.get_or_load(
+            SHOWTIMES, ("all", fields, start, end, version),
+            lambda: ShowtimeService._load_all_showtimes(session, fields, start, end)
+        )
+
+    @staticmethod
+    async def _load_all_showtimes(session: AsyncSession, fields: Optional[str], start: Optional[datetime], end: Optional[datetime]):
+        selected = parse_fields(fields, GROUPED_FIELDS)
+        start, end = ShowtimeService.resolve_window(start, end)
+        logger.info(f"📺 Recuperando funciones agrupadas por película entre {start:%Y-%m-%d %H:%M} y {end:%Y-%m-%d %H:%M}")
+
+        # Un rango de (movie_id, show_datetime) por película: el historial no se recorre
+        in_window = (Showtime.movie_id == Movie.id) & Showtime.show_datetime.between(start, end)
+        if selected is None or "showtimes" in selected:
+            stmt = (
+                select(Movie)
+                .join(Showtime, in_window)
+                .options(contains_eager(Movie.showtimes))
+                .order_by(Movie.id, Showtime.show_datetime)
+            )
+        else:
+            stmt = select(Movie).where(exists().where(in_window)).order_by(Movie.id)
+        if selected is not None:
+            stmt = stmt.options(load_only(*ShowtimeService._movie_columns(selected)))
+        result = await session.execute(stmt)
         movies = result.unique().scalars().all()
 
         response = []
         for movie in movies:
             normalize_empty_to_none(movie)
-            response.append(
-                MovieWithShowtimesGroupedResponse(
-                    id=movie.id,
-                    title=movie.title,
-                    description=movie.description,
-                    poster_url=movie.poster_url,
-                    duration_minutes=movie.duration_minutes,
-                    director=movie.director,
-                    showtimes=[
-                        ShowtimeBriefResponse(id=st.id, show_datetime=st.show_datetime)
-                        for st in movie.showtimes
-                    ]
-                )
-            )
+            entry = ShowtimeService._group_entry(movie, selected)
+            if "showtimes" in entry:
+                entry["showtimes"].extend(ShowtimeService._brief(st) for st in movie.showtimes)
+            response.append(ShowtimeService._finish_entry(entry, selected))
         logger.info(f"🎬 Total de películas con funciones: {len(response)}")
         return response
 
     @staticmethod
-    async def get_showtime_by_id(showtime_id: int, session: AsyncSession):
+    async def build_listing_snapshot(session: AsyncSession) -> tuple[bytes, dict]:
+        # Ventana por defecto, sin `fields=`: el listado que piden casi todos los clientes
+        showtimes = await ShowtimeService._load_all_showtimes(session, None, None, None)
+        return _GROUPED_LIST.dump_json(showtimes), {}
+
+    @staticmethod
+    def _movie_columns(selected: tuple[str, ...]) -> list:
+        return [getattr(Movie, name) for name in selected if name != "showtimes"]
+
+    @staticmethod
+    def _group_entry(movie: Movie, selected: Optional[tuple[str, ...]]) -> dict:
+        names = selected or GROUPED_FIELDS
+        return {
+            name: [] if name == "showtimes" else getattr(movie, name)
+            for name in names
+        }
+
+    @staticmethod
+    def _finish_entry(entry: dict, selected: Optional[tuple[str, ...]]):
+        # Sin `fields=` se mantiene el modelo de respuesta completo
+        return MovieWithShowtimesGroupedResponse(**entry) if selected is None else entry
+
+    @staticmethod
+    async def get_showtime_by_id(
+        showtime_id: int,
+        session: AsyncSession,
+        fields: Optional[str] = None,
+        seat_version: Optional[int] = None,
+    ):
+        selected = parse_fields(fields, DETAIL_FIELDS)
         logger.info(f"🔍 Buscando función por ID: {showtime_id}")
+        seat_map = await seat_map_cache.get(showtime_id, session, seat_version)
+        if not seat_map:
+            logger.warning(f"⚠️ Función no encontrada: ID {showtime_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Showtime ID {showtime_id} not found."
+            )
+        if selected is not None:
+            return pick(seat_map.to_response(), selected)
+        return seat_map.to_response()
+
+    @staticmethod
+    async def open_seat_event_stream(showtime_id: int, session: AsyncSession) -> AsyncIterator[bytes]:
+        # Suscribe antes de leer el snapshot para no perder cambios intermedios
+        subscription = seat_event_hub.subscribe(showtime_id)
+        try:
+            snapshot = await ShowtimeService.get_showtime_by_id(showtime_id, session)
+        except Exception:
+            seat_event_hub.unsubscribe(subscription)
+            raise
+        logger.info(f"📡 Nuevo suscriptor en función {showtime_id} ({seat_event_hub.subscriber_count(showtime_id)} activos)")
+        return seat_event_stream(subscription, snapshot)
+
+    @staticmethod
+    async def _get_showtime_entity(showtime_id: int, session: AsyncSession):
         result = await session.execute(
             select(Showtime).where(Showtime.id == showtime_id).options(
                 joinedload(Showtime.movie),
@@ -113,30 +291,144 @@ class ShowtimeService:
                 detail="A showtime already exists for this movie at the specified datetime."
             )
 
+        rows, seats_per_row = DEFAULT_ROWS, DEFAULT_SEATS_PER_ROW
+        if data.layout_id is not None:
+            layout = await LayoutService.get_layout(data.layout_id, session)
+            rows, seats_per_row = layout.rows, layout.seats_per_row
+
         showtime = Showtime(
             movie_id=data.movie_id,
-            show_datetime=data.show_datetime
+            show_datetime=data.show_datetime,
+            layout_id=data.layout_id,
+            seats_total=rows * seats_per_row,
+            seats_available=rows * seats_per_row
         )
         session.add(showtime)
         await session.flush()
 
-        logger.info(f"🎬 Función creada para película ID {data.movie_id}, generando asientos...")
-        rows = ['A', 'B', 'C', 'D', 'E']
-        for row in rows:
-            for num in range(1, 11):
-                session.add(Seat(showtime_id=showtime.id, seat_number=f"{row}{num}", is_reserved=False))
+        # Todos los asientos en un único INSERT multi-fila
+        logger.info(f"🎬 Función creada para película ID {data.movie_id}, generando {rows * seats_per_row} asientos...")
+        await ShowtimeService._insert_seats(session, [showtime.id], rows, seats_per_row)
 
+        await VersionService.bump(session, "showtime")
         await session.commit()
-        await session.refresh(showtime)
-        normalize_empty_to_none(showtime)
+        catalog_cache.invalidate(SHOWTIMES, movie_detail(data.movie_id))
         logger.info(f"✅ Función creada con ID {showtime.id}")
-        return showtime
+        return await ShowtimeService.get_showtime_by_id(showtime.id, session)
+
+    @staticmethod
+    async def create_schedule(data: ShowtimeScheduleRequest, session: AsyncSession, user: User):
+        ShowtimeService.verify_admin(user)
+
+        if data.end_date < data.start_date:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="end_date must be on or after start_date."
+            )
+
+        if data.weekdays and any(day < 0 or day > 6 for day in data.weekdays):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="weekdays must be between 0 (Monday) and 6 (Sunday)."
+            )
+
+        weekdays = set(data.weekdays) if data.weekdays else set(range(7))
+        slots = sorted({
+            datetime.combine(data.start_date + timedelta(days=offset), slot_time.replace(second=0, microsecond=0))
+            for offset in range((data.end_date - data.start_date).days + 1)
+            if (data.start_date + timedelta(days=offset)).weekday() in weekdays
+            for slot_time in data.times
+        })
+        if not slots:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="The schedule does not produce any showtime."
+            )
+        if len(slots) > MAX_SCHEDULE_SLOTS:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"A schedule can create at most {MAX_SCHEDULE_SLOTS} showtimes."
+            )
+        if slots[0] < datetime.now() + timedelta(minutes=30):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Showtime must be at least 30 minutes in the future."
+            )
+
+        movie_result = await session.execute(select(Movie.id).where(Movie.id == data.movie_id))
+        if movie_result.scalar_one_or_none() is None:
+            logger.warning(f"❌ Película no encontrada al programar funciones: ID {data.movie_id}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Movie with ID {data.movie_id} not found."
+            )
+
+        rows, seats_per_row = DEFAULT_ROWS, DEFAULT_SEATS_PER_ROW
+        if data.layout_id is not None:
+            layout = await LayoutService.get_layout(data.layout_id, session)
+            rows, seats_per_row = layout.rows, layout.seats_per_row
+
+        # Una sola consulta de rango para detectar todos los choques
+        existing_result = await session.execute(
+            select(Showtime.show_datetime).where(
+                Showtime.movie_id == data.movie_id,
+                Showtime.show_datetime.between(slots[0], slots[-1])
+            )
+        )
+        existing = set(existing_result.scalars().all())
+        conflicts = [slot for slot in slots if slot in existing]
+        if conflicts and not data.skip_conflicts:
+            logger.warning(f"⚠️ {len(conflicts)} funciones ya existen para la película {data.movie_id}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{len(conflicts)} showtimes already exist for this movie, first at {conflicts[0].isoformat()}."
+            )
+        slots = [slot for slot in slots if slot not in existing]
+        if not slots:
+            return ShowtimeScheduleResponse(movie_id=data.movie_id, created=0, seats_created=0, skipped=conflicts, showtimes=[])
+
+        await session.execute(
+            insert(Showtime).values([
+                {
+                    "movie_id": data.movie_id,
+                    "show_datetime": slot,
+                    "layout_id": data.layout_id,
+                    "seats_total": rows * seats_per_row,
+                    "seats_available": rows * seats_per_row,
+                }
+                for slot in slots
+            ])
+        )
+        created_result = await session.execute(
+            select(Showtime.id, Showtime.show_datetime, Showtime.seats_total, Showtime.seats_available)
+            .where(
+                Showtime.movie_id == data.movie_id,
+                Showtime.show_datetime.between(slots[0], slots[-1])
+            )
+            .order_by(Showtime.show_datetime)
+        )
+        new_slots = set(slots)
+        created = [row for row in created_result.all() if row.show_datetime in new_slots]
+
+        seats_created = await ShowtimeService._insert_seats(session, [row.id for row in created], rows, seats_per_row)
+        await VersionService.bump(session, "showtime")
+        await session.commit()
+        catalog_cache.invalidate(SHOWTIMES, movie_detail(data.movie_id))
+
+        logger.info(f"📅 {len(created)} funciones y {seats_created} asientos creados para la película {data.movie_id}")
+        return ShowtimeScheduleResponse(
+            movie_id=data.movie_id,
+            created=len(created),
+            seats_created=seats_created,
+            skipped=conflicts,
+            showtimes=[ShowtimeService._brief(row) for row in created]
+        )
 
     @staticmethod
     async def update_showtime(showtime_id: int, data: ShowtimeUpdateRequest, session: AsyncSession, user: User):
         ShowtimeService.verify_admin(user)
 
-        showtime = await ShowtimeService.get_showtime_by_id(showtime_id, session)
+        showtime = await ShowtimeService._get_showtime_entity(showtime_id, session)
 
         if data.show_datetime:
             min_datetime = datetime.now() + timedelta(minutes=30)
@@ -165,8 +457,11 @@ class ShowtimeService:
         for field, value in data.dict(exclude_unset=True).items():
             setattr(showtime, field, value)
 
+        await VersionService.bump(session, "showtime")
         await session.commit()
         await session.refresh(showtime)
+        publish_seat_change(showtime.id, invalidate=True)
+        catalog_cache.invalidate(SHOWTIMES, movie_detail(showtime.movie_id))
         normalize_empty_to_none(showtime)
         logger.info(f"✏️ Función actualizada ID {showtime.id}")
         return showtime
@@ -175,20 +470,61 @@ class ShowtimeService:
     async def delete_showtime(showtime_id: int, session: AsyncSession, user: User):
         ShowtimeService.verify_admin(user)
 
-        showtime = await ShowtimeService.get_showtime_by_id(showtime_id, session)
+        showtime = await ShowtimeService._get_showtime_entity(showtime_id, session)
+        movie_id = showtime.movie_id
+        await ShowtimeService.ensure_unsold([showtime_id], session)
         await session.delete(showtime)
-        await session.commit()
-        logger.info(f"🗑️ Función eliminada ID {showtime.id}")
+        await VersionService.bump(session, "showtime")
+        await ShowtimeService.commit_delete(session)
+        # Cierra el mapa de asientos y avisa a los suscriptores SSE para que reconecten (y reciban 404)
+        publish_seat_change(showtime_id, invalidate=True)
+        catalog_cache.invalidate(SHOWTIMES, movie_detail(movie_id))
+        logger.info(f"🗑️ Función eliminada ID {showtime_id}")
 
     @staticmethod
-    async def search_showtimes_by_datetime(session: AsyncSession, target_date: date, target_time: Optional[time] = None):
+    async def ensure_unsold(showtime_ids: List[int], session: AsyncSession):
+        """Rejects deleting showtimes that already have reservations with 409."""
+        if not showtime_ids:
+            return
+        sold = await session.scalar(select(exists().where(Reservation.showtime_id.in_(showtime_ids))))
+        if sold:
+            logger.warning(f"⛔ Intento de eliminar funciones con reservas: {showtime_ids}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Showtimes with reservations cannot be deleted."
+            )
+
+    @staticmethod
+    async def commit_delete(session: AsyncSession):
+        # Una reserva confirmada entre la verificación y el borrado no puede quedar huérfana
+        try:
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            logger.warning("⛔ Reserva confirmada durante el borrado de una función")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Showtimes with reservations cannot be deleted."
+            )
+
+    @staticmethod
+    async def search_showtimes_by_datetime(session: AsyncSession, target_date: date, target_time: Optional[time] = None, fields: Optional[str] = None):
+        return await catalog_cache.get_or_load(
+            SHOWTIMES, ("search", target_date, target_time, fields),
+            lambda: ShowtimeService._search_showtimes(session, target_date, target_time, fields)
+        )
+
+    @staticmethod
+    async def _search_showtimes(session: AsyncSession, target_date: date, target_time: Optional[time], fields: Optional[str]):
+        selected = parse_fields(fields, GROUPED_FIELDS)
         logger.info(f"🔎 Buscando funciones para el {target_date} {f'a las {target_time}' if target_time else ''}")
         
         now = datetime.now()
 
-        stmt = select(Showtime).options(
-            joinedload(Showtime.movie)
-        ).where(
+        movie_load = joinedload(Showtime.movie)
+        if selected is not None:
+            movie_load = movie_load.load_only(*ShowtimeService._movie_columns(selected))
+        stmt = select(Showtime).options(movie_load).where(
             Showtime.show_datetime >= max(now, datetime.combine(target_date, time.min)),
             Showtime.show_datetime <= datetime.combine(target_date, time.max)
         )
@@ -208,23 +544,116 @@ class ShowtimeService:
                 detail="No showtimes found for the specified date and time."
             )
 
-        grouped: dict[int, MovieWithShowtimesGroupedResponse] = {}
+        grouped: dict[int, dict] = {}
 
         for st in showtimes:
             m = st.movie
             if m.id not in grouped:
-                grouped[m.id] = MovieWithShowtimesGroupedResponse(
-                    id=m.id,
-                    title=m.title,
-                    description=m.description,
-                    poster_url=m.poster_url,
-                    duration_minutes=m.duration_minutes,
-                    director=m.director,
-                    showtimes=[]
-                )
-            grouped[m.id].showtimes.append(
-                ShowtimeBriefResponse(id=st.id, show_datetime=st.show_datetime)
-            )
+                grouped[m.id] = ShowtimeService._group_entry(m, selected)
+            if "showtimes" in grouped[m.id]:
+                grouped[m.id]["showtimes"].append(ShowtimeService._brief(st))
 
         logger.info(f"🎯 Funciones encontradas: {len(showtimes)} para {len(grouped)} películas")
-        return list(grouped.values())
+        return [ShowtimeService._finish_entry(entry, selected) for entry in grouped.values()]
+
+    @staticmethod
+    def _showtimes_json(dialect: str):
+        entry = func.json_object(
+            "id", Showtime.id,
+            "show_datetime", Showtime.show_datetime,
+            "seats_total", Showtime.seats_total,
+            "seats_available", Showtime.seats_available,
+        )
+        # Un arreglo JSON por película: el agrupamiento lo hace el motor
+        if dialect == "mysql":
+            return func.json_arrayagg(entry)
+        return func.json_group_array(entry)
+
+    @staticmethod
+    def _start_time_window(time_from: Optional[time], time_to: Optional[time]):
+        start_time = func.time(Showtime.show_datetime)
+        # time() devuelve HH:MM:SS en ambos motores; se compara contra el mismo formato
+        lower = time_from.strftime("%H:%M:%S") if time_from else None
+        upper = time_to.strftime("%H:%M:%S") if time_to else None
+        if lower and upper:
+            if lower <= upper:
+                return start_time.between(lower, upper)
+            # Ventana que cruza la medianoche (p. ej. 22:00 a 01:00)
+            return (start_time >= lower) | (start_time <= upper)
+        return start_time >= lower if lower else start_time <= upper
+
+    @staticmethod
+    async def search_showtimes(
+        session: AsyncSession,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        genre_ids: Optional[list[int]] = None,
+        time_from: Optional[time] = None,
+        time_to: Optional[time] = None,
+        min_seats: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[MovieWithShowtimesGroupedResponse], Optional[str]]:
+        """
+        Upcoming showtimes matching every filter, grouped by movie in one
+        query and paginated by movie ID.
+        """
+        start, end = ShowtimeService.resolve_window(
+            datetime.combine(date_from, time.min) if date_from else None,
+            datetime.combine(date_to, time.max) if date_to else None,
+        )
+        start = max(start, datetime.now())
+        after_id = decode_cursor(cursor).get("id") if cursor else 0
+        if not isinstance(after_id, int):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor."
+            )
+        logger.info(f"🔎 Búsqueda de funciones entre {start:%Y-%m-%d %H:%M} y {end:%Y-%m-%d %H:%M} (géneros {genre_ids or '-'}, mín. {min_seats or 0} asientos)")
+
+        # Las películas se recorren por PK; por cada una, un rango de (movie_id, show_datetime)
+        matching = [Showtime.movie_id == Movie.id, Showtime.show_datetime.between(start, end)]
+        if min_seats:
+            matching.append(Showtime.seats_available >= min_seats)
+        if time_from or time_to:
+            matching.append(ShowtimeService._start_time_window(time_from, time_to))
+        stmt = (
+            select(
+                Movie.id, Movie.title, Movie.description, Movie.poster_url, Movie.duration_minutes, Movie.director,
+                ShowtimeService._showtimes_json(session.get_bind().dialect.name).label("showtimes"),
+            )
+            .join(Showtime, and_(*matching))
+            .where(Movie.id > after_id)
+            .group_by(Movie.id)
+            .order_by(Movie.id)
+            .limit(limit + 1)
+        )
+        if genre_ids:
+            stmt = stmt.where(exists().where(MovieGenre.movie_id == Movie.id, MovieGenre.genre_id.in_(genre_ids)))
+        rows = (await session.execute(stmt)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor({"id": rows[-1].id})
+
+        response = []
+        for row in rows:
+            showtimes = sorted(json.loads(row.showtimes), key=lambda st: st["show_datetime"])
+            response.append(MovieWithShowtimesGroupedResponse(
+                id=row.id,
+                title=row.title,
+                description=row.description or None,
+                poster_url=row.poster_url or None,
+                duration_minutes=row.duration_minutes,
+                director=row.director or None,
+                showtimes=[
+                    ShowtimeBriefResponse(**st, sold_out=st["seats_total"] > 0 and st["seats_available"] == 0)
+                    for st in showtimes
+                ],
+            ))
+        logger.info(f"🎯 {len(response)} películas con funciones que cumplen los filtros")
+        return response, next_cursor
+
+
+catalog_snapshots.register(SHOWTIMES_LISTING, ShowtimeService.listing_etag, ShowtimeService.build_listing_snapshot)
@@ -0,0 +1,59 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert
+from sqlalchemy.exc import IntegrityError
+
+from src.models.table_version_model import TableVersion
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+# Tablas de catálogo con contador de cambios
+VERSIONED_TABLES = ("movie", "genre", "showtime")
+
+
+class VersionService:
+    """
+    Per-table change counters for the catalog. Admin writes bump them inside
+    their own transaction, so every worker derives the same ETag from one
+    primary-key read without touching the catalog rows.
+    """
+
+    @staticmethod
+    async def ensure_rows(session: AsyncSession):
+        existing = set((await session.execute(select(TableVersion.table_name))).scalars())
+        missing = [name for name in VERSIONED_TABLES if name not in existing]
+        if not missing:
+            return
+        try:
+            await session.execute(insert(TableVersion).values([{"table_name": name, "version": 0} for name in missing]))
+            await session.commit()
+        except IntegrityError:
+            # Otro worker las creó al mismo tiempo
+            await session.rollback()
+
+    @staticmethod
+    async def bump(session: AsyncSession, *tables: str):
+        """Increments the counters of `tables`; call it before the write's commit."""
+        result = await session.execute(
+            update(TableVersion)
+            .where(TableVersion.table_name.in_(tables))
+            .values(version=TableVersion.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount < len(tables):
+            existing = set((await session.execute(
+                select(TableVersion.table_name).where(TableVersion.table_name.in_(tables))
+            )).scalars())
+            await session.execute(insert(TableVersion).values([
+                {"table_name": name, "version": 1} for name in tables if name not in existing
+            ]))
+
+    @staticmethod
+    async def get(session: AsyncSession, *tables: str) -> tuple[int, ...]:
+        result = await session.execute(
+            select(TableVersion.table_name, TableVersion.version).where(TableVersion.table_name.in_(tables))
+        )
+        versions = dict(result.all())
+        return tuple(versions.get(name, 0) for name in tables)
@@ -0,0 +1,140 @@
+"""
+Deletes expired rows from `revoked_token_jti` (a token past its `exp` is
+rejected by the signature check anyway) and stale `login_attempts`, in small
+batches so the auth tables are never locked for long.
+
+    python -m src.tasks.auth_sweeper            # purge everything that is due
+    python -m src.tasks.auth_sweeper --dry-run  # only count it
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import select, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.db_config import async_session
+from src.models.revoked_token_jti_model import RevokedTokenJTI
+from src.models.login_attempt_model import LoginAttempt
+# Registra el resto de los mappers cuando se ejecuta como script
+from src.models.user_model import User  # noqa: F401
+from src.utils.metrics import register_metrics
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+# `exp` se guarda en UTC sin zona horaria; el margen sólo cubre el desfase de relojes
+EXP_GRACE = timedelta(minutes=5)
+# Pausa entre lotes: deja pasar a los logins que esperan esas filas
+BATCH_PAUSE_SECONDS = 0.05
+
+_STATS = {
+    "revoked_token_jti_rows": None,
+    "login_attempts_rows": None,
+    "revoked_token_jti_purged": 0,
+    "login_attempts_purged": 0,
+    "last_run_at": None,
+    "last_run_ms": None,
+}
+
+
+def revoked_cutoff() -> datetime:
+    return datetime.utcnow() - EXP_GRACE
+
+
+def login_attempt_cutoff() -> datetime:
+    return datetime.utcnow() - timedelta(hours=_SETTINGS.login_attempt_retention_hours)
+
+
+def _due_conditions() -> list[tuple[type, object, object]]:
+    # (modelo, condición, columna indexada por la que se recorre)
+    return [
+        (RevokedTokenJTI, RevokedTokenJTI.exp < revoked_cutoff(), RevokedTokenJTI.exp),
+        # Contador reseteado tras un login correcto: equivale a no tener fila
+        (LoginAttempt, LoginAttempt.last_failed_at.is_(None), LoginAttempt.id),
+        (LoginAttempt, LoginAttempt.last_failed_at < login_attempt_cutoff(), LoginAttempt.last_failed_at),
+    ]
+
+
+async def purge_batch(session: AsyncSession, model, condition, order_by, batch_size: int) -> int:
+    """Deletes up to `batch_size` rows matching `condition` in one short transaction."""
+    result = await session.execute(select(model.id).where(condition).order_by(order_by).limit(batch_size))
+    ids = list(result.scalars())
+    if not ids:
+        return 0
+    await session.execute(
+        delete(model)
+        .where(model.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return len(ids)
+
+
+async def purge_expired_auth_rows() -> dict[str, int]:
+    """Purges every due row in batches. Returns the rows deleted per table."""
+    started = time.monotonic()
+    batch_size = _SETTINGS.auth_sweep_batch_size
+    purged = {RevokedTokenJTI.__tablename__: 0, LoginAttempt.__tablename__: 0}
+    for model, condition, order_by in _due_conditions():
+        while True:
+            async with async_session() as session:
+                deleted = await purge_batch(session, model, condition, order_by, batch_size)
+            purged[model.__tablename__] += deleted
+            if deleted < batch_size:
+                break
+            await asyncio.sleep(BATCH_PAUSE_SECONDS)
+
+    async with async_session() as session:
+        _STATS["revoked_token_jti_rows"] = await session.scalar(select(func.count(RevokedTokenJTI.id)))
+        _STATS["login_attempts_rows"] = await session.scalar(select(func.count(LoginAttempt.id)))
+    _STATS["revoked_token_jti_purged"] += purged[RevokedTokenJTI.__tablename__]
+    _STATS["login_attempts_purged"] += purged[LoginAttempt.__tablename__]
+    _STATS["last_run_at"] = datetime.now().isoformat(timespec="seconds")
+    _STATS["last_run_ms"] = round((time.monotonic() - started) * 1000, 1)
+    return purged
+
+
+async def run_auth_sweeper(stop: asyncio.Event):
+    """Background loop that purges expired auth rows every `auth_sweep_interval_seconds`."""
+    interval = _SETTINGS.auth_sweep_interval_seconds
+    if interval <= 0:
+        return
+    logger.info("🧹 Auth sweeper started")
+    while not stop.is_set():
+        try:
+            purged = await purge_expired_auth_rows()
+            if any(purged.values()):
+                logger.info(f"🧹 Filas de autenticación vencidas eliminadas: {purged}")
+        except Exception as e:
+            logger.error(f"❌ Auth sweeper error: {e}")
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("🛑 Auth sweeper stopped")
+
+
+async def main(dry_run: bool):
+    if dry_run:
+        async with async_session() as session:
+            for model, condition, _ in _due_conditions():
+                due = await session.scalar(select(func.count(model.id)).where(condition))
+                logger.info(f"🔎 {due} filas de {model.__tablename__} para eliminar")
+        return
+
+    purged = await purge_expired_auth_rows()
+    logger.info(f"🧹 Filas de autenticación eliminadas: {purged}")
+
+
+register_metrics("auth_sweeper", lambda: dict(_STATS))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Purge expired token revocations and stale login attempts")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the rows that are due")
+    args = parser.parse_args()
+    asyncio.run(main(args.dry_run))
@@ -0,0 +1,94 @@
+"""
+Consistency checker for the denormalized `showtime.seats_total` and
+`showtime.seats_available` counters.
+
+    python -m src.tasks.availability_counters            # report drift
+    python -m src.tasks.availability_counters --rebuild  # recompute all counters
+"""
+import argparse
+import asyncio
+from sqlalchemy import select, update, func, case, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.db_config import async_session
+from src.models.showtime_model import Showtime
+from src.models.seat_model import Seat
+# Registra el resto de los mappers cuando se ejecuta como script
+from src.models.movie_model import Movie  # noqa: F401
+from src.models.reservation_model import Reservation  # noqa: F401
+from src.models.user_model import User  # noqa: F401
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+
+async def find_drift(session: AsyncSession) -> list:
+    """Showtimes whose counters disagree with the seat table, in one grouped query."""
+    counts = (
+        select(
+            Seat.showtime_id.label("showtime_id"),
+            func.count(Seat.id).label("total"),
+            func.sum(case((Seat.is_reserved == False, 1), else_=0)).label("available"),
+        )
+        .group_by(Seat.showtime_id)
+        .subquery()
+    )
+    total = func.coalesce(counts.c.total, 0)
+    available = func.coalesce(counts.c.available, 0)
+    result = await session.execute(
+        select(
+            Showtime.id,
+            Showtime.seats_total,
+            Showtime.seats_available,
+            total.label("actual_total"),
+            available.label("actual_available"),
+        )
+        .outerjoin(counts, counts.c.showtime_id == Showtime.id)
+        .where(or_(Showtime.seats_total != total, Showtime.seats_available != available))
+        .order_by(Showtime.id)
+    )
+    return result.all()
+
+
+async def rebuild_counters(session: AsyncSession, showtime_ids: list[int] | None = None) -> int:
+    """Recomputes the counters from `seat` with a single correlated UPDATE."""
+    total = select(func.count(Seat.id)).where(Seat.showtime_id == Showtime.id).scalar_subquery()
+    available = (
+        select(func.count(Seat.id))
+        .where(Seat.showtime_id == Showtime.id, Seat.is_reserved == False)
+        .scalar_subquery()
+    )
+    stmt = update(Showtime).values(
+        seats_total=total,
+        seats_available=available,
+        seat_version=Showtime.seat_version + 1,
+    )
+    if showtime_ids is not None:
+        stmt = stmt.where(Showtime.id.in_(showtime_ids))
+    result = await session.execute(stmt.execution_options(synchronize_session=False))
+    await session.commit()
+    return result.rowcount
+
+
+async def main(rebuild: bool):
+    async with async_session() as session:
+        drift = await find_drift(session)
+        for row in drift:
+            logger.warning(
+                f"⚠️ Función {row.id}: total {row.seats_total}/{row.actual_total}, "
+                f"disponibles {row.seats_available}/{row.actual_available}"
+            )
+        logger.info(f"🔎 {len(drift)} funciones con contadores desalineados")
+
+        if rebuild:
+            updated = await rebuild_counters(session)
+            logger.info(f"🔧 Contadores recalculados para {updated} funciones")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check or rebuild showtime availability counters")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute every counter from the seat table")
+    args = parser.parse_args()
+    asyncio.run(main(args.rebuild))
@@ -0,0 +1,63 @@
+import asyncio
+
+from src.config.db_config import async_session
+from src.cache.genre_movie_index import genre_movie_index
+from src.cache.movie_search_index import movie_search_index
+from src.cache.movie_suggest_index import movie_suggest_index
+from src.services.version_service import VersionService
+from src.utils.metrics import register_metrics
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+# Las tres se mantienen con escrituras de películas y géneros
+INDEXES = (genre_movie_index, movie_search_index, movie_suggest_index)
+VERSIONED = ("movie", "genre")
+
+_STATS = {"rebuilds": 0, "last_rebuild_ms": None}
+
+
+async def run_catalog_index_refresher(stop: asyncio.Event):
+    """
+    Rebuilds the in-memory catalog indexes when the catalog version moved
+    since their last build. Writes reach them directly or over the event
+    relay; this catches the ones that did not (no relay, a dropped
+    connection), within `catalog_index_refresh_seconds`.
+    """
+    interval = _SETTINGS.catalog_index_refresh_seconds
+    if interval <= 0:
+        return
+    logger.info("🗂️ Catalog index refresher started")
+    # Sin versión vista, la primera vuelta reconstruye: cubre escrituras durante la carga inicial
+    seen = None
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+            break
+        except asyncio.TimeoutError:
+            pass
+
+        try:
+            async with async_session() as session:
+                versions = await VersionService.get(session, *VERSIONED)
+                if versions == seen:
+                    continue
+                # Índices no cargados (p. ej. búsqueda en MySQL) quedan para su propia carga
+                ready = [index for index in INDEXES if index.ready]
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+                for index in ready:
+                    await index.rebuild(session)
+                if ready:
+                    _STATS["rebuilds"] += 1
+                    _STATS["last_rebuild_ms"] = round((loop.time() - started) * 1000, 1)
+                    logger.info(f"🗂️ Índices del catálogo reconstruidos (versión {versions})")
+                seen = versions
+        except Exception as e:
+            logger.error(f"❌ Catalog index refresher error: {e}")
+    logger.info("🛑 Catalog index refresher stopped")
+
+
+register_metrics("catalog_index_refresher", lambda: dict(_STATS))
@@ -0,0 +1,41 @@
+import asyncio
+
+from src.config.db_config import async_session
+from src.cache.catalog_snapshots import catalog_snapshots
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+# Ráfagas de cambios (ventas seguidas) se agrupan en una sola reconstrucción
+COALESCE_SECONDS = 0.25
+
+
+async def run_catalog_snapshot_refresher(stop: asyncio.Event):
+    """
+    Keeps the pre-serialized catalog listings current: rebuilds them when a
+    change is notified, or every `catalog_snapshot_refresh_seconds` to catch
+    writes made by other workers and the moving showtime window.
+    """
+    interval = _SETTINGS.catalog_snapshot_refresh_seconds
+    if interval <= 0:
+        return
+    logger.info("📦 Catalog snapshot refresher started")
+    while not stop.is_set():
+        try:
+            async with async_session() as session:
+                await catalog_snapshots.refresh(session)
+        except Exception as e:
+            logger.error(f"❌ Catalog snapshot refresher error: {e}")
+
+        # Despierta con un cambio notificado, al vencer el intervalo o al apagar
+        waiters = [asyncio.create_task(catalog_snapshots.wait_dirty(interval)), asyncio.create_task(stop.wait())]
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in waiters:
+            waiter.cancel()
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=COALESCE_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("🛑 Catalog snapshot refresher stopped")
@@ -0,0 +1,32 @@
+import asyncio
+
+from src.config.db_config import async_session
+from src.cache.revocation_cache import revocation_cache
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+
+async def run_revocation_refresher(stop: asyncio.Event):
+    """
+    Loads the revoked JTIs at startup, then re-reads the new ones every
+    `revocation_cache_refresh_seconds` to catch revocations whose relay
+    message was lost.
+    """
+    interval = _SETTINGS.revocation_cache_refresh_seconds
+    logger.info("🔒 Revocation refresher started")
+    while not stop.is_set():
+        try:
+            async with async_session() as session:
+                await revocation_cache.refresh(session)
+        except Exception as e:
+            logger.error(f"❌ Revocation refresher error: {e}")
+        if interval <= 0 and revocation_cache.ready:
+            break
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=max(interval, 1))
+        except asyncio.TimeoutError:
+            pass
+    logger.info("🛑 Revocation refresher stopped")
@@ -0,0 +1,122 @@
+"""
+Brings a database created before the current models up to date. The
+startup `create_all` only creates missing tables; this also adds the
+columns and indexes missing from existing ones (showtime counters and
+layout, catalog and auth indexes, the FULLTEXT search index) and
+backfills the seat counters of existing showtimes from `seat`. Safe to
+run more than once; run it before starting the new version.
+
+    python -m src.tasks.schema_upgrade            # apply
+    python -m src.tasks.schema_upgrade --dry-run  # only print the statements
+"""
+import argparse
+import asyncio
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable, CreateColumn, CreateIndex, AddConstraint, Index, Column
+
+from src.config.db_config import engine, async_session
+from src.models.base_model import Base
+# Registra todos los mappers: el plan compara contra Base.metadata completo
+from src.models.user_model import User  # noqa: F401
+from src.models.login_attempt_model import LoginAttempt  # noqa: F401
+from src.models.revoked_token_jti_model import RevokedTokenJTI  # noqa: F401
+from src.models.movie_model import Movie  # noqa: F401
+from src.models.showtime_model import Showtime
+from src.models.seat_model import Seat  # noqa: F401
+from src.models.reservation_model import Reservation  # noqa: F401
+from src.models.seat_hold_model import SeatHold  # noqa: F401
+from src.models.auditorium_layout_model import AuditoriumLayout  # noqa: F401
+from src.models.showtime_archive_model import ShowtimeArchive  # noqa: F401
+from src.models.seat_archive_model import SeatArchive  # noqa: F401
+from src.models.reservation_archive_model import ReservationArchive  # noqa: F401
+from src.models.table_version_model import TableVersion  # noqa: F401
+from src.tasks.availability_counters import rebuild_counters
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+# Columnas que, si se agregan ahora, arrancan en 0 y hay que recalcular desde `seat`
+COUNTER_COLUMNS = {"seats_total", "seats_available"}
+
+
+def _creatable(index: Index, dialect_name: str) -> bool:
+    # FULLTEXT sólo existe en MySQL; en otros motores la búsqueda usa el índice en memoria
+    return dialect_name == "mysql" or index.dialect_options["mysql"]["prefix"] != "FULLTEXT"
+
+
+def _add_column_sql(column: Column, conn: Connection) -> str:
+    ddl = str(CreateColumn(column).compile(dialect=conn.dialect))
+    if conn.dialect.name == "sqlite":
+        # SQLite no admite ADD CONSTRAINT: la referencia va en la misma columna
+        for fk in column.foreign_keys:
+            ddl += f" REFERENCES {fk.column.table.name} ({fk.column.name})"
+            if fk.ondelete:
+                ddl += f" ON DELETE {fk.ondelete}"
+    return f"ALTER TABLE {column.table.name} ADD COLUMN {ddl}"
+
+
+def plan_upgrade(conn: Connection) -> tuple[list[str], list[Column]]:
+    """DDL statements still missing in the database, and the columns they add."""
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    statements, added = [], []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            statements.append(str(CreateTable(table).compile(dialect=conn.dialect)).strip())
+            statements += [
+                str(CreateIndex(index).compile(dialect=conn.dialect))
+                for index in sorted(table.indexes, key=lambda index: index.name)
+                if _creatable(index, conn.dialect.name)
+            ]
+            continue
+        present = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in present:
+                continue
+            added.append(column)
+            statements.append(_add_column_sql(column, conn))
+            if conn.dialect.name != "sqlite":
+                for fk in column.foreign_keys:
+                    statements.append(str(AddConstraint(fk.constraint).compile(dialect=conn.dialect)))
+
+        indexed = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name not in indexed and _creatable(index, conn.dialect.name):
+                statements.append(str(CreateIndex(index).compile(dialect=conn.dialect)))
+    return statements, added
+
+
+async def main(dry_run: bool):
+    async with engine.connect() as conn:
+        statements, added = await conn.run_sync(plan_upgrade)
+
+    if not statements:
+        logger.info("✅ El esquema ya está al día")
+        return
+
+    for statement in statements:
+        logger.info(f"🛠️ {' '.join(statement.split())}")
+    if dry_run:
+        logger.info(f"🔎 {len(statements)} cambios pendientes")
+        return
+
+    # Una sentencia por transacción: en MySQL cada DDL confirma de todas formas
+    for statement in statements:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(statement)
+
+    if any(column.table is Showtime.__table__ and column.name in COUNTER_COLUMNS for column in added):
+        async with async_session() as session:
+            updated = await rebuild_counters(session)
+        logger.info(f"🔧 Contadores de asientos calculados para {updated} funciones")
+    logger.info(f"✅ Esquema actualizado: {len(statements)} cambios aplicados")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add the columns and indexes missing from an existing database")
+    parser.add_argument("--dry-run", action="store_true", help="Only print the pending statements")
+    args = parser.parse_args()
+    asyncio.run(main(args.dry_run))
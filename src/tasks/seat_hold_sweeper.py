@@ -0,0 +1,49 @@
+import asyncio
+from datetime import datetime
+
+from src.config.db_config import async_session
+from src.services.seat_hold_service import SeatHoldService
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+
+async def sweep_expired_holds() -> int:
+    """Release every expired hold in small batches. Returns the number of holds released."""
+    total = 0
+    while True:
+        async with async_session() as session:
+            released = await SeatHoldService.release_expired(session, _SETTINGS.seat_hold_sweep_batch_size)
+        total += released
+        if released < _SETTINGS.seat_hold_sweep_batch_size:
+            return total
+
+
+async def run_seat_hold_sweeper(stop: asyncio.Event):
+    """
+    Background loop that wakes up at the next hold expiry (bounded by
+    `seat_hold_sweep_interval_seconds`) instead of polling the whole table.
+    Safe to run on every worker: deletes are idempotent.
+    """
+    logger.info("⏳ Seat hold sweeper started")
+    while not stop.is_set():
+        delay = _SETTINGS.seat_hold_sweep_interval_seconds
+        try:
+            released = await sweep_expired_holds()
+            if released:
+                logger.info(f"🧹 {released} retenciones vencidas liberadas")
+
+            async with async_session() as session:
+                next_expiry = await SeatHoldService.next_expiry(session)
+            if next_expiry:
+                delay = min(delay, max(1.0, (next_expiry - datetime.now()).total_seconds()))
+        except Exception as e:
+            logger.error(f"❌ Seat hold sweeper error: {e}")
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("🛑 Seat hold sweeper stopped")
@@ -0,0 +1,149 @@
+"""
+Moves showtimes that ended more than `showtime_archive_after_hours` ago,
+together with their seats and reservations, into the `*_archive` tables, so
+the hot tables only hold the upcoming schedule.
+
+    python -m src.tasks.showtime_archiver            # archive everything that is due
+    python -m src.tasks.showtime_archiver --dry-run  # only count it
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import select, insert, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.db_config import async_session
+from src.models.showtime_model import Showtime
+from src.models.seat_model import Seat
+from src.models.reservation_model import Reservation
+from src.models.seat_hold_model import SeatHold
+from src.models.showtime_archive_model import ShowtimeArchive
+from src.models.seat_archive_model import SeatArchive
+from src.models.reservation_archive_model import ReservationArchive
+# Registra el resto de los mappers cuando se ejecuta como script
+from src.models.movie_model import Movie  # noqa: F401
+from src.models.user_model import User  # noqa: F401
+from src.realtime.seat_events import publish_seat_change
+from src.cache.catalog_cache import catalog_cache, SHOWTIMES, MOVIE_DETAIL
+from src.services.version_service import VersionService
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+
+def archive_cutoff() -> datetime:
+    return datetime.now() - timedelta(hours=_SETTINGS.showtime_archive_after_hours)
+
+
+async def archive_batch(session: AsyncSession, cutoff: datetime, batch_size: int) -> int:
+    """Archives up to `batch_size` showtimes older than `cutoff` in one transaction."""
+    # SKIP LOCKED: varios workers pueden archivar a la vez sin pisarse
+    result = await session.execute(
+        select(Showtime.id)
+        .where(Showtime.show_datetime < cutoff)
+        .order_by(Showtime.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    showtime_ids = list(result.scalars())
+    if not showtime_ids:
+        return 0
+
+    await session.execute(
+        insert(ShowtimeArchive).from_select(
+            ["id", "movie_id", "show_datetime", "layout_id", "seats_total", "seats_available", "created_at"],
+            select(
+                Showtime.id, Showtime.movie_id, Showtime.show_datetime, Showtime.layout_id,
+                Showtime.seats_total, Showtime.seats_available, Showtime.created_at,
+            ).where(Showtime.id.in_(showtime_ids))
+        )
+    )
+    await session.execute(
+        insert(SeatArchive).from_select(
+            ["id", "showtime_id", "seat_number", "is_reserved"],
+            select(Seat.id, Seat.showtime_id, Seat.seat_number, Seat.is_reserved)
+            .where(Seat.showtime_id.in_(showtime_ids))
+        )
+    )
+    await session.execute(
+        insert(ReservationArchive).from_select(
+            ["id", "user_id", "showtime_id", "seat_id", "reserved_at"],
+            select(Reservation.id, Reservation.user_id, Reservation.showtime_id, Reservation.seat_id, Reservation.reserved_at)
+            .where(Reservation.showtime_id.in_(showtime_ids))
+        )
+    )
+
+    # Hijos primero: no depende de que el motor aplique ON DELETE CASCADE
+    for model in (SeatHold, Reservation, Seat):
+        await session.execute(
+            delete(model)
+            .where(model.showtime_id.in_(showtime_ids))
+            .execution_options(synchronize_session=False)
+        )
+    await session.execute(
+        delete(Showtime)
+        .where(Showtime.id.in_(showtime_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await VersionService.bump(session, "showtime")
+    await session.commit()
+
+    for showtime_id in showtime_ids:
+        publish_seat_change(showtime_id, invalidate=True)
+    return len(showtime_ids)
+
+
+async def archive_past_showtimes(cutoff: datetime | None = None) -> int:
+    """Archives every due showtime in batches. Returns the number of showtimes moved."""
+    cutoff = cutoff or archive_cutoff()
+    total = 0
+    while True:
+        async with async_session() as session:
+            archived = await archive_batch(session, cutoff, _SETTINGS.showtime_archive_batch_size)
+        total += archived
+        if archived < _SETTINGS.showtime_archive_batch_size:
+            if total:
+                catalog_cache.invalidate(SHOWTIMES, MOVIE_DETAIL)
+            return total
+
+
+async def run_showtime_archiver(stop: asyncio.Event):
+    """Background loop that archives past showtimes every `showtime_archive_interval_seconds`."""
+    interval = _SETTINGS.showtime_archive_interval_seconds
+    if interval <= 0:
+        return
+    logger.info("🗄️ Showtime archiver started")
+    while not stop.is_set():
+        try:
+            archived = await archive_past_showtimes()
+            if archived:
+                logger.info(f"🗄️ {archived} funciones pasadas movidas al archivo")
+        except Exception as e:
+            logger.error(f"❌ Showtime archiver error: {e}")
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("🛑 Showtime archiver stopped")
+
+
+async def main(dry_run: bool):
+    cutoff = archive_cutoff()
+    if dry_run:
+        async with async_session() as session:
+            due = await session.scalar(select(func.count(Showtime.id)).where(Showtime.show_datetime < cutoff))
+        logger.info(f"🔎 {due} funciones anteriores a {cutoff:%Y-%m-%d %H:%M} para archivar")
+        return
+
+    archived = await archive_past_showtimes(cutoff)
+    logger.info(f"🗄️ {archived} funciones anteriores a {cutoff:%Y-%m-%d %H:%M} archivadas")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move past showtimes into the archive tables")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the showtimes that are due")
+    args = parser.parse_args()
+    asyncio.run(main(args.dry_run))
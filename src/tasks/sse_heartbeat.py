@@ -0,0 +1,21 @@
+import asyncio
+
+from src.realtime.seat_events import seat_event_hub, KEEPALIVE_FRAME
+from src.utils.logger import setup_logger
+from src.config.config import get_settings
+
+_SETTINGS = get_settings()
+logger = setup_logger(__name__, level=_SETTINGS.log_level)
+
+
+async def run_sse_heartbeat(stop: asyncio.Event):
+    """
+    Sends an SSE comment to every live subscriber each
+    `sse_keepalive_seconds`, so idle connections survive proxies without a
+    timer per connection.
+    """
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=_SETTINGS.sse_keepalive_seconds)
+        except asyncio.TimeoutError:
+            seat_event_hub.broadcast(KEEPALIVE_FRAME)
@@ -0,0 +1,28 @@
+from typing import Iterable, Optional
+from fastapi import HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[tuple[str, ...]]:
+    """Validate a `fields=a,b` selector; `id` is always included. None means every field."""
+    if fields is None:
+        return None
+    allowed = tuple(allowed)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}."
+        )
+    requested.add("id")
+    return tuple(name for name in allowed if name in requested)
+
+def pick(payload: dict, selected: Iterable[str]) -> dict:
+    return {name: payload[name] for name in selected if name in payload}
+
+def sparse_response(content, response: Optional[Response] = None) -> JSONResponse:
+    """Serialize a sparse payload directly, bypassing the full response model."""
+    # Conserva los headers ya puestos por la ruta (p. ej. X-Next-Cursor)
+    headers = dict(response.headers) if response is not None else None
+    return JSONResponse(jsonable_encoder(content), headers=headers)
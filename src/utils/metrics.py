@@ -0,0 +1,11 @@
+from typing import Callable
+
+# Proveedores de métricas en proceso (cachés, colas, tareas); cada uno devuelve un dict
+_PROVIDERS: dict[str, Callable[[], dict]] = {}
+
+def register_metrics(name: str, provider: Callable[[], dict]):
+    _PROVIDERS[name] = provider
+
+def collect_metrics() -> dict:
+    """Snapshot of every registered provider, for the admin metrics endpoint."""
+    return {name: provider() for name, provider in sorted(_PROVIDERS.items())}
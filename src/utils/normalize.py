@@ -1,5 +1,11 @@
+from sqlalchemy import inspect
+
 def normalize_empty_to_none(obj):
+    # Omite columnas diferidas (load_only / fields=): leerlas dispararía un lazy load
+    unloaded = inspect(obj).unloaded
     for attr in obj.__mapper__.column_attrs:
+        if attr.key in unloaded:
+            continue
         val = getattr(obj, attr.key)
         if isinstance(val, str) and val.strip() == "":
             setattr(obj, attr.key, None)
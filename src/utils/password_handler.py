@@ -1,5 +1,10 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, status
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
+from src.utils.metrics import register_metrics
 from src.utils.logger import setup_logger
 from src.config.config import get_settings
 
@@ -28,3 +33,87 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     except Exception as e:
         logger.error(f"Unexpected error during password verification: {e}")
         return False
+
+
+class PasswordHashPool:
+    """
+    Bounded thread pool for Argon2, so hashing never blocks the event loop.
+    argon2-cffi releases the GIL while hashing, so threads run in parallel
+    without the pickling cost of a process pool.
+
+    At most `workers + max_queue` calls are admitted; beyond that the caller
+    gets a 503 right away instead of waiting behind a login burst.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="argon2")
+        self._admitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_wait = 0.0
+
+    @property
+    def queued(self) -> int:
+        return max(0, self._admitted - self.workers)
+
+    async def run(self, fn, *args):
+        if self._admitted >= self.workers + self.max_queue:
+            self.rejected += 1
+            logger.warning(f"🚦 Cola de hashing llena ({self._admitted} en curso): se rechaza la solicitud")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please try again shortly.",
+                headers={"Retry-After": "1"},
+            )
+        self._admitted += 1
+        submitted = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        job = self._executor.submit(self._timed, fn, *args)
+        # Se libera cuando el hilo termina, no cuando el llamador deja de esperar:
+        # una petición cancelada sigue ocupando su hilo hasta acabar el hash
+        job.add_done_callback(lambda _: self._release(loop))
+        started, result = await asyncio.wrap_future(job)
+        # Espera en la cola: desde que se encoló hasta que un hilo lo tomó
+        self._total_wait += started - submitted
+        self.completed += 1
+        return result
+
+    def _release(self, loop: asyncio.AbstractEventLoop):
+        # Corre en el hilo del pool: el contador sólo se toca desde el loop
+        try:
+            loop.call_soon_threadsafe(self._decrement)
+        except RuntimeError:
+            # Loop ya cerrado (apagado): no queda nadie a quien admitir
+            pass
+
+    def _decrement(self):
+        self._admitted -= 1
+
+    @staticmethod
+    def _timed(fn, *args):
+        return time.perf_counter(), fn(*args)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(self._admitted, self.workers),
+            "queued": self.queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self._total_wait / self.completed * 1000, 2) if self.completed else 0.0,
+        }
+
+
+password_hash_pool = PasswordHashPool(_SETTINGS.password_hash_workers, _SETTINGS.password_hash_max_queue)
+register_metrics("password_hash_pool", password_hash_pool.stats)
+
+async def hash_password_async(password: str) -> str:
+    """`hash_password` on the bounded pool; raises 503 when the queue is full."""
+    return await password_hash_pool.run(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """`verify_password` on the bounded pool; raises 503 when the queue is full."""
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
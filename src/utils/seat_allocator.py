@@ -0,0 +1,42 @@
+from typing import Optional
+
+from src.cache.seat_map_cache import SeatMap
+
+# Fila ideal: a dos tercios de la pantalla
+PREFERRED_ROW_DEPTH = 2 / 3
+
+
+def find_best_seats(seat_map: SeatMap, count: int) -> Optional[list[int]]:
+    """
+    Best `count` adjacent free seats, or None if no row has a long enough
+    run. Rows whose longest free run is too short are skipped from the
+    per-row index, so the cost is O(rows) plus the runs of candidate rows.
+    Blocks closer to the preferred row and to the row center score better.
+    """
+    rows = len(seat_map.row_seats)
+    if not rows:
+        return None
+    ideal_row = (rows - 1) * PREFERRED_ROW_DEPTH
+
+    best: Optional[tuple[float, int, int]] = None
+    for row in range(rows):
+        longest, runs = seat_map.free_runs(row)
+        if longest < count:
+            continue
+        width = len(seat_map.row_seats[row])
+        center = (width - 1) / 2
+        row_score = abs(row - ideal_row) / rows
+        for start, length in runs:
+            if length < count:
+                continue
+            # Desplaza el bloque dentro del tramo lo más cerca posible del centro
+            offset = round(center - (count - 1) / 2)
+            offset = min(max(offset, start), start + length - count)
+            score = row_score + abs(offset + (count - 1) / 2 - center) / width
+            if best is None or score < best[0]:
+                best = (score, row, offset)
+
+    if best is None:
+        return None
+    _, row, offset = best
+    return [seat_map.seat_ids[ordinal] for ordinal in seat_map.row_seats[row][offset:offset + count]]
@@ -0,0 +1,34 @@
+import re
+from typing import Optional
+
+# Sala por defecto cuando la función no tiene plantilla: filas A–E × 10
+DEFAULT_ROWS = 5
+DEFAULT_SEATS_PER_ROW = 10
+
+_SEAT_NUMBER_RE = re.compile(r"^([A-Z]+)(\d+)$")
+
+def row_label(index: int) -> str:
+    """0 -> A, 25 -> Z, 26 -> AA, ..."""
+    label = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        label = chr(ord("A") + rem) + label
+    return label
+
+def parse_gaps(gaps: Optional[str]) -> list[int]:
+    if not gaps:
+        return []
+    return sorted({int(g) for g in gaps.split(",") if g.strip()})
+
+def format_gaps(gaps: list[int]) -> Optional[str]:
+    return ",".join(str(g) for g in sorted(set(gaps))) or None
+
+def generate_seat_numbers(rows: int, seats_per_row: int) -> list[str]:
+    return [f"{row_label(r)}{n}" for r in range(rows) for n in range(1, seats_per_row + 1)]
+
+def split_seat_number(seat_number: str) -> tuple[str, int]:
+    match = _SEAT_NUMBER_RE.match(seat_number)
+    if not match:
+        raise ValueError(f"Invalid seat number: {seat_number}")
+    return match.group(1), int(match.group(2))
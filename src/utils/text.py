@@ -0,0 +1,11 @@
+import re
+import unicodedata
+
+_COMBINING_RE = re.compile(r"[\u0300-\u036f]")
+
+def fold(text: str) -> str:
+    """Case- and accent-insensitive form of `text` ("Película" -> "pelicula"), like utf8mb4_unicode_ci."""
+    folded = text.casefold()
+    if not folded.isascii():
+        folded = _COMBINING_RE.sub("", unicodedata.normalize("NFKD", folded))
+    return folded
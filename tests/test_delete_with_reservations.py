@@ -0,0 +1,76 @@
+import asyncio
+import os
+import tempfile
+import uuid
+
+# La base se elige al importar src.config.db_config: SQLite descartable salvo que se indique otra
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{tempfile.gettempdir()}/movies_test_{uuid.uuid4().hex[:8]}.db")
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, func
+
+from benchmarks.common import create_tables, create_bench_user, create_bench_showtime, get_seat_ids
+from src.config.db_config import async_session
+from src.models.user_model import RoleEnum
+from src.models.showtime_model import Showtime
+from src.models.seat_model import Seat
+from src.models.reservation_model import Reservation
+from src.schema.requests.reservation_request import ReservationCreateRequest
+from src.services.reservation_service import ReservationService
+from src.services.showtime_service import ShowtimeService
+from src.services.movie_service import MovieService
+
+
+async def _booked_showtime(session):
+    await create_tables()
+    admin = await create_bench_user(session)
+    admin.user_role = RoleEnum.admin
+    await session.commit()
+    showtime = await create_bench_showtime(session, rows=2, seats_per_row=5)
+    seat_ids = await get_seat_ids(session, showtime.id)
+    await ReservationService().create_reservation(
+        ReservationCreateRequest(showtime_id=showtime.id, seat_ids=seat_ids[:2]), session, admin
+    )
+    return admin, showtime.id, showtime.movie_id
+
+
+@pytest.mark.parametrize("target", ["showtime", "movie"])
+def test_delete_with_reservations_is_rejected(target):
+    async def scenario():
+        async with async_session() as session:
+            admin, showtime_id, movie_id = await _booked_showtime(session)
+            with pytest.raises(HTTPException) as exc:
+                if target == "showtime":
+                    await ShowtimeService.delete_showtime(showtime_id, session, admin)
+                else:
+                    await MovieService().delete_movie(movie_id, session, admin)
+            assert exc.value.status_code == 409
+
+        async with async_session() as session:
+            assert await session.scalar(select(func.count(Reservation.id)).where(Reservation.showtime_id == showtime_id)) == 2
+            assert await session.scalar(select(Showtime.seats_available).where(Showtime.id == showtime_id)) == 8
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("target", ["showtime", "movie"])
+def test_delete_without_reservations_removes_seats(target):
+    async def scenario():
+        async with async_session() as session:
+            await create_tables()
+            admin = await create_bench_user(session)
+            admin.user_role = RoleEnum.admin
+            await session.commit()
+            showtime = await create_bench_showtime(session, rows=2, seats_per_row=5)
+            showtime_id, movie_id = showtime.id, showtime.movie_id
+            if target == "showtime":
+                await ShowtimeService.delete_showtime(showtime_id, session, admin)
+            else:
+                await MovieService().delete_movie(movie_id, session, admin)
+
+        async with async_session() as session:
+            assert await session.scalar(select(func.count(Showtime.id)).where(Showtime.id == showtime_id)) == 0
+            assert await session.scalar(select(func.count(Seat.id)).where(Seat.showtime_id == showtime_id)) == 0
+
+    asyncio.run(scenario())